@@ -1,3238 +0,0 @@
-name_to_abbrev = {
-	"Autauga County, AL": "01001",
-	"Baldwin County, AL": "01003",
-	"Barbour County, AL": "01005",
-	"Bibb County, AL": "01007",
-	"Blount County, AL": "01009",
-	"Bullock County, AL": "01011",
-	"Butler County, AL": "01013",
-	"Calhoun County, AL": "01015",
-	"Chambers County, AL": "01017",
-	"Cherokee County, AL": "01019",
-	"Chilton County, AL": "01021",
-	"Choctaw County, AL": "01023",
-	"Clarke County, AL": "01025",
-	"Clay County, AL": "01027",
-	"Cleburne County, AL": "01029",
-	"Coffee County, AL": "01031",
-	"Colbert County, AL": "01033",
-	"Conecuh County, AL": "01035",
-	"Coosa County, AL": "01037",
-	"Covington County, AL": "01039",
-	"Crenshaw County, AL": "01041",
-	"Cullman County, AL": "01043",
-	"Dale County, AL": "01045",
-	"Dallas County, AL": "01047",
-	"DeKalb County, AL": "01049",
-	"Elmore County, AL": "01051",
-	"Escambia County, AL": "01053",
-	"Etowah County, AL": "01055",
-	"Fayette County, AL": "01057",
-	"Franklin County, AL": "01059",
-	"Geneva County, AL": "01061",
-	"Greene County, AL": "01063",
-	"Hale County, AL": "01065",
-	"Henry County, AL": "01067",
-	"Houston County, AL": "01069",
-	"Jackson County, AL": "01071",
-	"Jefferson County, AL": "01073",
-	"Lamar County, AL": "01075",
-	"Lauderdale County, AL": "01077",
-	"Lawrence County, AL": "01079",
-	"Lee County, AL": "01081",
-	"Limestone County, AL": "01083",
-	"Lowndes County, AL": "01085",
-	"Macon County, AL": "01087",
-	"Madison County, AL": "01089",
-	"Marengo County, AL": "01091",
-	"Marion County, AL": "01093",
-	"Marshall County, AL": "01095",
-	"Mobile County, AL": "01097",
-	"Monroe County, AL": "01099",
-	"Montgomery County, AL": "01101",
-	"Morgan County, AL": "01103",
-	"Perry County, AL": "01105",
-	"Pickens County, AL": "01107",
-	"Pike County, AL": "01109",
-	"Randolph County, AL": "01111",
-	"Russell County, AL": "01113",
-	"St. Clair County, AL": "01115",
-	"Shelby County, AL": "01117",
-	"Sumter County, AL": "01119",
-	"Talladega County, AL": "01121",
-	"Tallapoosa County, AL": "01123",
-	"Tuscaloosa County, AL": "01125",
-	"Walker County, AL": "01127",
-	"Washington County, AL": "01129",
-	"Wilcox County, AL": "01131",
-	"Winston County, AL": "01133",
-	"Aleutians East Borough, AK": "02013",
-	"Aleutians West Census Area, AK": "02016",
-	"Anchorage Municipality, AK": "02020",
-	"Bethel Census Area, AK": "02050",
-	"Bristol Bay Borough, AK": "02060",
-	"Denali Borough, AK": "02068",
-	"Dillingham Census Area, AK": "02070",
-	"Fairbanks North Star Borough, AK": "02090",
-	"Haines Borough, AK": "02100",
-	"Hoonah-Angoon Census Area, AK": "02105",
-	"Juneau City and Borough, AK": "02110",
-	"Kenai Peninsula Borough, AK": "02122",
-	"Ketchikan Gateway Borough, AK": "02130",
-	"Kodiak Island Borough, AK": "02150",
-	"Kusilvak Census Area, AK": "02270",
-	"Lake and Peninsula Borough, AK": "02164",
-	"Matanuska-Susitna Borough, AK": "02170",
-	"Nome Census Area, AK": "02180",
-	"North Slope Borough, AK": "02185",
-	"Northwest Arctic Borough, AK": "02188",
-	"Petersburg Borough, AK": "02195",
-	"Prince of Wales-Hyder Census Area, AK": "02198",
-	"Sitka City and Borough, AK": "02220",
-	"Skagway Municipality, AK": "02230",
-	"Southeast Fairbanks Census Area, AK": "02240",
-	"Valdez-Cordova Census Area, AK": "02261",
-	"Wrangell City and Borough, AK": "02275",
-	"Yakutat City and Borough, AK": "02282",
-	"Yukon-Koyukuk Census Area, AK": "02290",
-	"Apache County, AZ": "04001",
-	"Cochise County, AZ": "04003",
-	"Coconino County, AZ": "04005",
-	"Gila County, AZ": "04007",
-	"Graham County, AZ": "04009",
-	"Greenlee County, AZ": "04011",
-	"La Paz County, AZ": "04012",
-	"Maricopa County, AZ": "04013",
-	"Mohave County, AZ": "04015",
-	"Navajo County, AZ": "04017",
-	"Pima County, AZ": "04019",
-	"Pinal County, AZ": "04021",
-	"Santa Cruz County, AZ": "04023",
-	"Yavapai County, AZ": "04025",
-	"Yuma County, AZ": "04027",
-	"Arkansas County, AR": "05001",
-	"Ashley County, AR": "05003",
-	"Baxter County, AR": "05005",
-	"Benton County, AR": "05007",
-	"Boone County, AR": "05009",
-	"Bradley County, AR": "05011",
-	"Calhoun County, AR": "05013",
-	"Carroll County, AR": "05015",
-	"Chicot County, AR": "05017",
-	"Clark County, AR": "05019",
-	"Clay County, AR": "05021",
-	"Cleburne County, AR": "05023",
-	"Cleveland County, AR": "05025",
-	"Columbia County, AR": "05027",
-	"Conway County, AR": "05029",
-	"Craighead County, AR": "05031",
-	"Crawford County, AR": "05033",
-	"Crittenden County, AR": "05035",
-	"Cross County, AR": "05037",
-	"Dallas County, AR": "05039",
-	"Desha County, AR": "05041",
-	"Drew County, AR": "05043",
-	"Faulkner County, AR": "05045",
-	"Franklin County, AR": "05047",
-	"Fulton County, AR": "05049",
-	"Garland County, AR": "05051",
-	"Grant County, AR": "05053",
-	"Greene County, AR": "05055",
-	"Hempstead County, AR": "05057",
-	"Hot Spring County, AR": "05059",
-	"Howard County, AR": "05061",
-	"Independence County, AR": "05063",
-	"Izard County, AR": "05065",
-	"Jackson County, AR": "05067",
-	"Jefferson County, AR": "05069",
-	"Johnson County, AR": "05071",
-	"Lafayette County, AR": "05073",
-	"Lawrence County, AR": "05075",
-	"Lee County, AR": "05077",
-	"Lincoln County, AR": "05079",
-	"Little River County, AR": "05081",
-	"Logan County, AR": "05083",
-	"Lonoke County, AR": "05085",
-	"Madison County, AR": "05087",
-	"Marion County, AR": "05089",
-	"Miller County, AR": "05091",
-	"Mississippi County, AR": "05093",
-	"Monroe County, AR": "05095",
-	"Montgomery County, AR": "05097",
-	"Nevada County, AR": "05099",
-	"Newton County, AR": "05101",
-	"Ouachita County, AR": "05103",
-	"Perry County, AR": "05105",
-	"Phillips County, AR": "05107",
-	"Pike County, AR": "05109",
-	"Poinsett County, AR": "05111",
-	"Polk County, AR": "05113",
-	"Pope County, AR": "05115",
-	"Prairie County, AR": "05117",
-	"Pulaski County, AR": "05119",
-	"Randolph County, AR": "05121",
-	"St. Francis County, AR": "05123",
-	"Saline County, AR": "05125",
-	"Scott County, AR": "05127",
-	"Searcy County, AR": "05129",
-	"Sebastian County, AR": "05131",
-	"Sevier County, AR": "05133",
-	"Sharp County, AR": "05135",
-	"Stone County, AR": "05137",
-	"Union County, AR": "05139",
-	"Van Buren County, AR": "05141",
-	"Washington County, AR": "05143",
-	"White County, AR": "05145",
-	"Woodruff County, AR": "05147",
-	"Yell County, AR": "05149",
-	"Alameda County, CA": "06001",
-	"Alpine County, CA": "06003",
-	"Amador County, CA": "06005",
-	"Butte County, CA": "06007",
-	"Calaveras County, CA": "06009",
-	"Colusa County, CA": "06011",
-	"Contra Costa County, CA": "06013",
-	"Del Norte County, CA": "06015",
-	"El Dorado County, CA": "06017",
-	"Fresno County, CA": "06019",
-	"Glenn County, CA": "06021",
-	"Humboldt County, CA": "06023",
-	"Imperial County, CA": "06025",
-	"Inyo County, CA": "06027",
-	"Kern County, CA": "06029",
-	"Kings County, CA": "06031",
-	"Lake County, CA": "06033",
-	"Lassen County, CA": "06035",
-	"Los Angeles County, CA": "06037",
-	"Madera County, CA": "06039",
-	"Marin County, CA": "06041",
-	"Mariposa County, CA": "06043",
-	"Mendocino County, CA": "06045",
-	"Merced County, CA": "06047",
-	"Modoc County, CA": "06049",
-	"Mono County, CA": "06051",
-	"Monterey County, CA": "06053",
-	"Napa County, CA": "06055",
-	"Nevada County, CA": "06057",
-	"Orange County, CA": "06059",
-	"Placer County, CA": "06061",
-	"Plumas County, CA": "06063",
-	"Riverside County, CA": "06065",
-	"Sacramento County, CA": "06067",
-	"San Benito County, CA": "06069",
-	"San Bernardino County, CA": "06071",
-	"San Diego County, CA": "06073",
-	"San Francisco County, CA": "06075",
-	"San Joaquin County, CA": "06077",
-	"San Luis Obispo County, CA": "06079",
-	"San Mateo County, CA": "06081",
-	"Santa Barbara County, CA": "06083",
-	"Santa Clara County, CA": "06085",
-	"Santa Cruz County, CA": "06087",
-	"Shasta County, CA": "06089",
-	"Sierra County, CA": "06091",
-	"Siskiyou County, CA": "06093",
-	"Solano County, CA": "06095",
-	"Sonoma County, CA": "06097",
-	"Stanislaus County, CA": "06099",
-	"Sutter County, CA": "06101",
-	"Tehama County, CA": "06103",
-	"Trinity County, CA": "06105",
-	"Tulare County, CA": "06107",
-	"Tuolumne County, CA": "06109",
-	"Ventura County, CA": "06111",
-	"Yolo County, CA": "06113",
-	"Yuba County, CA": "06115",
-	"Adams County, CO": "08001",
-	"Alamosa County, CO": "08003",
-	"Arapahoe County, CO": "08005",
-	"Archuleta County, CO": "08007",
-	"Baca County, CO": "08009",
-	"Bent County, CO": "08011",
-	"Boulder County, CO": "08013",
-	"Broomfield County, CO": "08014",
-	"Chaffee County, CO": "08015",
-	"Cheyenne County, CO": "08017",
-	"Clear Creek County, CO": "08019",
-	"Conejos County, CO": "08021",
-	"Costilla County, CO": "08023",
-	"Crowley County, CO": "08025",
-	"Custer County, CO": "08027",
-	"Delta County, CO": "08029",
-	"Denver County, CO": "08031",
-	"Dolores County, CO": "08033",
-	"Douglas County, CO": "08035",
-	"Eagle County, CO": "08037",
-	"Elbert County, CO": "08039",
-	"El Paso County, CO": "08041",
-	"Fremont County, CO": "08043",
-	"Garfield County, CO": "08045",
-	"Gilpin County, CO": "08047",
-	"Grand County, CO": "08049",
-	"Gunnison County, CO": "08051",
-	"Hinsdale County, CO": "08053",
-	"Huerfano County, CO": "08055",
-	"Jackson County, CO": "08057",
-	"Jefferson County, CO": "08059",
-	"Kiowa County, CO": "08061",
-	"Kit Carson County, CO": "08063",
-	"Lake County, CO": "08065",
-	"La Plata County, CO": "08067",
-	"Larimer County, CO": "08069",
-	"Las Animas County, CO": "08071",
-	"Lincoln County, CO": "08073",
-	"Logan County, CO": "08075",
-	"Mesa County, CO": "08077",
-	"Mineral County, CO": "08079",
-	"Moffat County, CO": "08081",
-	"Montezuma County, CO": "08083",
-	"Montrose County, CO": "08085",
-	"Morgan County, CO": "08087",
-	"Otero County, CO": "08089",
-	"Ouray County, CO": "08091",
-	"Park County, CO": "08093",
-	"Phillips County, CO": "08095",
-	"Pitkin County, CO": "08097",
-	"Prowers County, CO": "08099",
-	"Pueblo County, CO": "08101",
-	"Rio Blanco County, CO": "08103",
-	"Rio Grande County, CO": "08105",
-	"Routt County, CO": "08107",
-	"Saguache County, CO": "08109",
-	"San Juan County, CO": "08111",
-	"San Miguel County, CO": "08113",
-	"Sedgwick County, CO": "08115",
-	"Summit County, CO": "08117",
-	"Teller County, CO": "08119",
-	"Washington County, CO": "08121",
-	"Weld County, CO": "08123",
-	"Yuma County, CO": "08125",
-	"Fairfield County, CT": "09001",
-	"Hartford County, CT": "09003",
-	"Litchfield County, CT": "09005",
-	"Middlesex County, CT": "09007",
-	"New Haven County, CT": "09009",
-	"New London County, CT": "09011",
-	"Tolland County, CT": "09013",
-	"Windham County, CT": "09015",
-	"Kent County, DE": "10001",
-	"New Castle County, DE": "10003",
-	"Sussex County, DE": "10005",
-	"District of Columbia, DC": "11001",
-	"Alachua County, FL": "12001",
-	"Baker County, FL": "12003",
-	"Bay County, FL": "12005",
-	"Bradford County, FL": "12007",
-	"Brevard County, FL": "12009",
-	"Broward County, FL": "12011",
-	"Calhoun County, FL": "12013",
-	"Charlotte County, FL": "12015",
-	"Citrus County, FL": "12017",
-	"Clay County, FL": "12019",
-	"Collier County, FL": "12021",
-	"Columbia County, FL": "12023",
-	"DeSoto County, FL": "12027",
-	"Dixie County, FL": "12029",
-	"Duval County, FL": "12031",
-	"Escambia County, FL": "12033",
-	"Flagler County, FL": "12035",
-	"Franklin County, FL": "12037",
-	"Gadsden County, FL": "12039",
-	"Gilchrist County, FL": "12041",
-	"Glades County, FL": "12043",
-	"Gulf County, FL": "12045",
-	"Hamilton County, FL": "12047",
-	"Hardee County, FL": "12049",
-	"Hendry County, FL": "12051",
-	"Hernando County, FL": "12053",
-	"Highlands County, FL": "12055",
-	"Hillsborough County, FL": "12057",
-	"Holmes County, FL": "12059",
-	"Indian River County, FL": "12061",
-	"Jackson County, FL": "12063",
-	"Jefferson County, FL": "12065",
-	"Lafayette County, FL": "12067",
-	"Lake County, FL": "12069",
-	"Lee County, FL": "12071",
-	"Leon County, FL": "12073",
-	"Levy County, FL": "12075",
-	"Liberty County, FL": "12077",
-	"Madison County, FL": "12079",
-	"Manatee County, FL": "12081",
-	"Marion County, FL": "12083",
-	"Martin County, FL": "12085",
-	"Miami-Dade County, FL": "12086",
-	"Monroe County, FL": "12087",
-	"Nassau County, FL": "12089",
-	"Okaloosa County, FL": "12091",
-	"Okeechobee County, FL": "12093",
-	"Orange County, FL": "12095",
-	"Osceola County, FL": "12097",
-	"Palm Beach County, FL": "12099",
-	"Pasco County, FL": "12101",
-	"Pinellas County, FL": "12103",
-	"Polk County, FL": "12105",
-	"Putnam County, FL": "12107",
-	"St. Johns County, FL": "12109",
-	"St. Lucie County, FL": "12111",
-	"Santa Rosa County, FL": "12113",
-	"Sarasota County, FL": "12115",
-	"Seminole County, FL": "12117",
-	"Sumter County, FL": "12119",
-	"Suwannee County, FL": "12121",
-	"Taylor County, FL": "12123",
-	"Union County, FL": "12125",
-	"Volusia County, FL": "12127",
-	"Wakulla County, FL": "12129",
-	"Walton County, FL": "12131",
-	"Washington County, FL": "12133",
-	"Appling County, GA": "13001",
-	"Atkinson County, GA": "13003",
-	"Bacon County, GA": "13005",
-	"Baker County, GA": "13007",
-	"Baldwin County, GA": "13009",
-	"Banks County, GA": "13011",
-	"Barrow County, GA": "13013",
-	"Bartow County, GA": "13015",
-	"Ben Hill County, GA": "13017",
-	"Berrien County, GA": "13019",
-	"Bibb County, GA": "13021",
-	"Bleckley County, GA": "13023",
-	"Brantley County, GA": "13025",
-	"Brooks County, GA": "13027",
-	"Bryan County, GA": "13029",
-	"Bulloch County, GA": "13031",
-	"Burke County, GA": "13033",
-	"Butts County, GA": "13035",
-	"Calhoun County, GA": "13037",
-	"Camden County, GA": "13039",
-	"Candler County, GA": "13043",
-	"Carroll County, GA": "13045",
-	"Catoosa County, GA": "13047",
-	"Charlton County, GA": "13049",
-	"Chatham County, GA": "13051",
-	"Chattahoochee County, GA": "13053",
-	"Chattooga County, GA": "13055",
-	"Cherokee County, GA": "13057",
-	"Clarke County, GA": "13059",
-	"Clay County, GA": "13061",
-	"Clayton County, GA": "13063",
-	"Clinch County, GA": "13065",
-	"Cobb County, GA": "13067",
-	"Coffee County, GA": "13069",
-	"Colquitt County, GA": "13071",
-	"Columbia County, GA": "13073",
-	"Cook County, GA": "13075",
-	"Coweta County, GA": "13077",
-	"Crawford County, GA": "13079",
-	"Crisp County, GA": "13081",
-	"Dade County, GA": "13083",
-	"Dawson County, GA": "13085",
-	"Decatur County, GA": "13087",
-	"DeKalb County, GA": "13089",
-	"Dodge County, GA": "13091",
-	"Dooly County, GA": "13093",
-	"Dougherty County, GA": "13095",
-	"Douglas County, GA": "13097",
-	"Early County, GA": "13099",
-	"Echols County, GA": "13101",
-	"Effingham County, GA": "13103",
-	"Elbert County, GA": "13105",
-	"Emanuel County, GA": "13107",
-	"Evans County, GA": "13109",
-	"Fannin County, GA": "13111",
-	"Fayette County, GA": "13113",
-	"Floyd County, GA": "13115",
-	"Forsyth County, GA": "13117",
-	"Franklin County, GA": "13119",
-	"Fulton County, GA": "13121",
-	"Gilmer County, GA": "13123",
-	"Glascock County, GA": "13125",
-	"Glynn County, GA": "13127",
-	"Gordon County, GA": "13129",
-	"Grady County, GA": "13131",
-	"Greene County, GA": "13133",
-	"Gwinnett County, GA": "13135",
-	"Habersham County, GA": "13137",
-	"Hall County, GA": "13139",
-	"Hancock County, GA": "13141",
-	"Haralson County, GA": "13143",
-	"Harris County, GA": "13145",
-	"Hart County, GA": "13147",
-	"Heard County, GA": "13149",
-	"Henry County, GA": "13151",
-	"Houston County, GA": "13153",
-	"Irwin County, GA": "13155",
-	"Jackson County, GA": "13157",
-	"Jasper County, GA": "13159",
-	"Jeff Davis County, GA": "13161",
-	"Jefferson County, GA": "13163",
-	"Jenkins County, GA": "13165",
-	"Johnson County, GA": "13167",
-	"Jones County, GA": "13169",
-	"Lamar County, GA": "13171",
-	"Lanier County, GA": "13173",
-	"Laurens County, GA": "13175",
-	"Lee County, GA": "13177",
-	"Liberty County, GA": "13179",
-	"Lincoln County, GA": "13181",
-	"Long County, GA": "13183",
-	"Lowndes County, GA": "13185",
-	"Lumpkin County, GA": "13187",
-	"McDuffie County, GA": "13189",
-	"McIntosh County, GA": "13191",
-	"Macon County, GA": "13193",
-	"Madison County, GA": "13195",
-	"Marion County, GA": "13197",
-	"Meriwether County, GA": "13199",
-	"Miller County, GA": "13201",
-	"Mitchell County, GA": "13205",
-	"Monroe County, GA": "13207",
-	"Montgomery County, GA": "13209",
-	"Morgan County, GA": "13211",
-	"Murray County, GA": "13213",
-	"Muscogee County, GA": "13215",
-	"Newton County, GA": "13217",
-	"Oconee County, GA": "13219",
-	"Oglethorpe County, GA": "13221",
-	"Paulding County, GA": "13223",
-	"Peach County, GA": "13225",
-	"Pickens County, GA": "13227",
-	"Pierce County, GA": "13229",
-	"Pike County, GA": "13231",
-	"Polk County, GA": "13233",
-	"Pulaski County, GA": "13235",
-	"Putnam County, GA": "13237",
-	"Quitman County, GA": "13239",
-	"Rabun County, GA": "13241",
-	"Randolph County, GA": "13243",
-	"Richmond County, GA": "13245",
-	"Rockdale County, GA": "13247",
-	"Schley County, GA": "13249",
-	"Screven County, GA": "13251",
-	"Seminole County, GA": "13253",
-	"Spalding County, GA": "13255",
-	"Stephens County, GA": "13257",
-	"Stewart County, GA": "13259",
-	"Sumter County, GA": "13261",
-	"Talbot County, GA": "13263",
-	"Taliaferro County, GA": "13265",
-	"Tattnall County, GA": "13267",
-	"Taylor County, GA": "13269",
-	"Telfair County, GA": "13271",
-	"Terrell County, GA": "13273",
-	"Thomas County, GA": "13275",
-	"Tift County, GA": "13277",
-	"Toombs County, GA": "13279",
-	"Towns County, GA": "13281",
-	"Treutlen County, GA": "13283",
-	"Troup County, GA": "13285",
-	"Turner County, GA": "13287",
-	"Twiggs County, GA": "13289",
-	"Union County, GA": "13291",
-	"Upson County, GA": "13293",
-	"Walker County, GA": "13295",
-	"Walton County, GA": "13297",
-	"Ware County, GA": "13299",
-	"Warren County, GA": "13301",
-	"Washington County, GA": "13303",
-	"Wayne County, GA": "13305",
-	"Webster County, GA": "13307",
-	"Wheeler County, GA": "13309",
-	"White County, GA": "13311",
-	"Whitfield County, GA": "13313",
-	"Wilcox County, GA": "13315",
-	"Wilkes County, GA": "13317",
-	"Wilkinson County, GA": "13319",
-	"Worth County, GA": "13321",
-	"Hawaii County, HI": "15001",
-	"Honolulu County, HI": "15003",
-	"Kalawao County, HI": "15005",
-	"Kauai County, HI": "15007",
-	"Maui County, HI": "15009",
-	"Ada County, ID": "16001",
-	"Adams County, ID": "16003",
-	"Bannock County, ID": "16005",
-	"Bear Lake County, ID": "16007",
-	"Benewah County, ID": "16009",
-	"Bingham County, ID": "16011",
-	"Blaine County, ID": "16013",
-	"Boise County, ID": "16015",
-	"Bonner County, ID": "16017",
-	"Bonneville County, ID": "16019",
-	"Boundary County, ID": "16021",
-	"Butte County, ID": "16023",
-	"Camas County, ID": "16025",
-	"Canyon County, ID": "16027",
-	"Caribou County, ID": "16029",
-	"Cassia County, ID": "16031",
-	"Clark County, ID": "16033",
-	"Clearwater County, ID": "16035",
-	"Custer County, ID": "16037",
-	"Elmore County, ID": "16039",
-	"Franklin County, ID": "16041",
-	"Fremont County, ID": "16043",
-	"Gem County, ID": "16045",
-	"Gooding County, ID": "16047",
-	"Idaho County, ID": "16049",
-	"Jefferson County, ID": "16051",
-	"Jerome County, ID": "16053",
-	"Kootenai County, ID": "16055",
-	"Latah County, ID": "16057",
-	"Lemhi County, ID": "16059",
-	"Lewis County, ID": "16061",
-	"Lincoln County, ID": "16063",
-	"Madison County, ID": "16065",
-	"Minidoka County, ID": "16067",
-	"Nez Perce County, ID": "16069",
-	"Oneida County, ID": "16071",
-	"Owyhee County, ID": "16073",
-	"Payette County, ID": "16075",
-	"Power County, ID": "16077",
-	"Shoshone County, ID": "16079",
-	"Teton County, ID": "16081",
-	"Twin Falls County, ID": "16083",
-	"Valley County, ID": "16085",
-	"Washington County, ID": "16087",
-	"Adams County, IL": "17001",
-	"Alexander County, IL": "17003",
-	"Bond County, IL": "17005",
-	"Boone County, IL": "17007",
-	"Brown County, IL": "17009",
-	"Bureau County, IL": "17011",
-	"Calhoun County, IL": "17013",
-	"Carroll County, IL": "17015",
-	"Cass County, IL": "17017",
-	"Champaign County, IL": "17019",
-	"Christian County, IL": "17021",
-	"Clark County, IL": "17023",
-	"Clay County, IL": "17025",
-	"Clinton County, IL": "17027",
-	"Coles County, IL": "17029",
-	"Cook County, IL": "17031",
-	"Crawford County, IL": "17033",
-	"Cumberland County, IL": "17035",
-	"DeKalb County, IL": "17037",
-	"De Witt County, IL": "17039",
-	"Douglas County, IL": "17041",
-	"DuPage County, IL": "17043",
-	"Edgar County, IL": "17045",
-	"Edwards County, IL": "17047",
-	"Effingham County, IL": "17049",
-	"Fayette County, IL": "17051",
-	"Ford County, IL": "17053",
-	"Franklin County, IL": "17055",
-	"Fulton County, IL": "17057",
-	"Gallatin County, IL": "17059",
-	"Greene County, IL": "17061",
-	"Grundy County, IL": "17063",
-	"Hamilton County, IL": "17065",
-	"Hancock County, IL": "17067",
-	"Hardin County, IL": "17069",
-	"Henderson County, IL": "17071",
-	"Henry County, IL": "17073",
-	"Iroquois County, IL": "17075",
-	"Jackson County, IL": "17077",
-	"Jasper County, IL": "17079",
-	"Jefferson County, IL": "17081",
-	"Jersey County, IL": "17083",
-	"Jo Daviess County, IL": "17085",
-	"Johnson County, IL": "17087",
-	"Kane County, IL": "17089",
-	"Kankakee County, IL": "17091",
-	"Kendall County, IL": "17093",
-	"Knox County, IL": "17095",
-	"Lake County, IL": "17097",
-	"LaSalle County, IL": "17099",
-	"Lawrence County, IL": "17101",
-	"Lee County, IL": "17103",
-	"Livingston County, IL": "17105",
-	"Logan County, IL": "17107",
-	"McDonough County, IL": "17109",
-	"McHenry County, IL": "17111",
-	"McLean County, IL": "17113",
-	"Macon County, IL": "17115",
-	"Macoupin County, IL": "17117",
-	"Madison County, IL": "17119",
-	"Marion County, IL": "17121",
-	"Marshall County, IL": "17123",
-	"Mason County, IL": "17125",
-	"Massac County, IL": "17127",
-	"Menard County, IL": "17129",
-	"Mercer County, IL": "17131",
-	"Monroe County, IL": "17133",
-	"Montgomery County, IL": "17135",
-	"Morgan County, IL": "17137",
-	"Moultrie County, IL": "17139",
-	"Ogle County, IL": "17141",
-	"Peoria County, IL": "17143",
-	"Perry County, IL": "17145",
-	"Piatt County, IL": "17147",
-	"Pike County, IL": "17149",
-	"Pope County, IL": "17151",
-	"Pulaski County, IL": "17153",
-	"Putnam County, IL": "17155",
-	"Randolph County, IL": "17157",
-	"Richland County, IL": "17159",
-	"Rock Island County, IL": "17161",
-	"St. Clair County, IL": "17163",
-	"Saline County, IL": "17165",
-	"Sangamon County, IL": "17167",
-	"Schuyler County, IL": "17169",
-	"Scott County, IL": "17171",
-	"Shelby County, IL": "17173",
-	"Stark County, IL": "17175",
-	"Stephenson County, IL": "17177",
-	"Tazewell County, IL": "17179",
-	"Union County, IL": "17181",
-	"Vermilion County, IL": "17183",
-	"Wabash County, IL": "17185",
-	"Warren County, IL": "17187",
-	"Washington County, IL": "17189",
-	"Wayne County, IL": "17191",
-	"White County, IL": "17193",
-	"Whiteside County, IL": "17195",
-	"Will County, IL": "17197",
-	"Williamson County, IL": "17199",
-	"Winnebago County, IL": "17201",
-	"Woodford County, IL": "17203",
-	"Adams County, IN": "18001",
-	"Allen County, IN": "18003",
-	"Bartholomew County, IN": "18005",
-	"Benton County, IN": "18007",
-	"Blackford County, IN": "18009",
-	"Boone County, IN": "18011",
-	"Brown County, IN": "18013",
-	"Carroll County, IN": "18015",
-	"Cass County, IN": "18017",
-	"Clark County, IN": "18019",
-	"Clay County, IN": "18021",
-	"Clinton County, IN": "18023",
-	"Crawford County, IN": "18025",
-	"Daviess County, IN": "18027",
-	"Dearborn County, IN": "18029",
-	"Decatur County, IN": "18031",
-	"DeKalb County, IN": "18033",
-	"Delaware County, IN": "18035",
-	"Dubois County, IN": "18037",
-	"Elkhart County, IN": "18039",
-	"Fayette County, IN": "18041",
-	"Floyd County, IN": "18043",
-	"Fountain County, IN": "18045",
-	"Franklin County, IN": "18047",
-	"Fulton County, IN": "18049",
-	"Gibson County, IN": "18051",
-	"Grant County, IN": "18053",
-	"Greene County, IN": "18055",
-	"Hamilton County, IN": "18057",
-	"Hancock County, IN": "18059",
-	"Harrison County, IN": "18061",
-	"Hendricks County, IN": "18063",
-	"Henry County, IN": "18065",
-	"Howard County, IN": "18067",
-	"Huntington County, IN": "18069",
-	"Jackson County, IN": "18071",
-	"Jasper County, IN": "18073",
-	"Jay County, IN": "18075",
-	"Jefferson County, IN": "18077",
-	"Jennings County, IN": "18079",
-	"Johnson County, IN": "18081",
-	"Knox County, IN": "18083",
-	"Kosciusko County, IN": "18085",
-	"LaGrange County, IN": "18087",
-	"Lake County, IN": "18089",
-	"LaPorte County, IN": "18091",
-	"Lawrence County, IN": "18093",
-	"Madison County, IN": "18095",
-	"Marion County, IN": "18097",
-	"Marshall County, IN": "18099",
-	"Martin County, IN": "18101",
-	"Miami County, IN": "18103",
-	"Monroe County, IN": "18105",
-	"Montgomery County, IN": "18107",
-	"Morgan County, IN": "18109",
-	"Newton County, IN": "18111",
-	"Noble County, IN": "18113",
-	"Ohio County, IN": "18115",
-	"Orange County, IN": "18117",
-	"Owen County, IN": "18119",
-	"Parke County, IN": "18121",
-	"Perry County, IN": "18123",
-	"Pike County, IN": "18125",
-	"Porter County, IN": "18127",
-	"Posey County, IN": "18129",
-	"Pulaski County, IN": "18131",
-	"Putnam County, IN": "18133",
-	"Randolph County, IN": "18135",
-	"Ripley County, IN": "18137",
-	"Rush County, IN": "18139",
-	"St. Joseph County, IN": "18141",
-	"Scott County, IN": "18143",
-	"Shelby County, IN": "18145",
-	"Spencer County, IN": "18147",
-	"Starke County, IN": "18149",
-	"Steuben County, IN": "18151",
-	"Sullivan County, IN": "18153",
-	"Switzerland County, IN": "18155",
-	"Tippecanoe County, IN": "18157",
-	"Tipton County, IN": "18159",
-	"Union County, IN": "18161",
-	"Vanderburgh County, IN": "18163",
-	"Vermillion County, IN": "18165",
-	"Vigo County, IN": "18167",
-	"Wabash County, IN": "18169",
-	"Warren County, IN": "18171",
-	"Warrick County, IN": "18173",
-	"Washington County, IN": "18175",
-	"Wayne County, IN": "18177",
-	"Wells County, IN": "18179",
-	"White County, IN": "18181",
-	"Whitley County, IN": "18183",
-	"Adair County, IA": "19001",
-	"Adams County, IA": "19003",
-	"Allamakee County, IA": "19005",
-	"Appanoose County, IA": "19007",
-	"Audubon County, IA": "19009",
-	"Benton County, IA": "19011",
-	"Black Hawk County, IA": "19013",
-	"Boone County, IA": "19015",
-	"Bremer County, IA": "19017",
-	"Buchanan County, IA": "19019",
-	"Buena Vista County, IA": "19021",
-	"Butler County, IA": "19023",
-	"Calhoun County, IA": "19025",
-	"Carroll County, IA": "19027",
-	"Cass County, IA": "19029",
-	"Cedar County, IA": "19031",
-	"Cerro Gordo County, IA": "19033",
-	"Cherokee County, IA": "19035",
-	"Chickasaw County, IA": "19037",
-	"Clarke County, IA": "19039",
-	"Clay County, IA": "19041",
-	"Clayton County, IA": "19043",
-	"Clinton County, IA": "19045",
-	"Crawford County, IA": "19047",
-	"Dallas County, IA": "19049",
-	"Davis County, IA": "19051",
-	"Decatur County, IA": "19053",
-	"Delaware County, IA": "19055",
-	"Des Moines County, IA": "19057",
-	"Dickinson County, IA": "19059",
-	"Dubuque County, IA": "19061",
-	"Emmet County, IA": "19063",
-	"Fayette County, IA": "19065",
-	"Floyd County, IA": "19067",
-	"Franklin County, IA": "19069",
-	"Fremont County, IA": "19071",
-	"Greene County, IA": "19073",
-	"Grundy County, IA": "19075",
-	"Guthrie County, IA": "19077",
-	"Hamilton County, IA": "19079",
-	"Hancock County, IA": "19081",
-	"Hardin County, IA": "19083",
-	"Harrison County, IA": "19085",
-	"Henry County, IA": "19087",
-	"Howard County, IA": "19089",
-	"Humboldt County, IA": "19091",
-	"Ida County, IA": "19093",
-	"Iowa County, IA": "19095",
-	"Jackson County, IA": "19097",
-	"Jasper County, IA": "19099",
-	"Jefferson County, IA": "19101",
-	"Johnson County, IA": "19103",
-	"Jones County, IA": "19105",
-	"Keokuk County, IA": "19107",
-	"Kossuth County, IA": "19109",
-	"Lee County, IA": "19111",
-	"Linn County, IA": "19113",
-	"Louisa County, IA": "19115",
-	"Lucas County, IA": "19117",
-	"Lyon County, IA": "19119",
-	"Madison County, IA": "19121",
-	"Mahaska County, IA": "19123",
-	"Marion County, IA": "19125",
-	"Marshall County, IA": "19127",
-	"Mills County, IA": "19129",
-	"Mitchell County, IA": "19131",
-	"Monona County, IA": "19133",
-	"Monroe County, IA": "19135",
-	"Montgomery County, IA": "19137",
-	"Muscatine County, IA": "19139",
-	"O'Brien County, IA": "19141",
-	"Osceola County, IA": "19143",
-	"Page County, IA": "19145",
-	"Palo Alto County, IA": "19147",
-	"Plymouth County, IA": "19149",
-	"Pocahontas County, IA": "19151",
-	"Polk County, IA": "19153",
-	"Pottawattamie County, IA": "19155",
-	"Poweshiek County, IA": "19157",
-	"Ringgold County, IA": "19159",
-	"Sac County, IA": "19161",
-	"Scott County, IA": "19163",
-	"Shelby County, IA": "19165",
-	"Sioux County, IA": "19167",
-	"Story County, IA": "19169",
-	"Tama County, IA": "19171",
-	"Taylor County, IA": "19173",
-	"Union County, IA": "19175",
-	"Van Buren County, IA": "19177",
-	"Wapello County, IA": "19179",
-	"Warren County, IA": "19181",
-	"Washington County, IA": "19183",
-	"Wayne County, IA": "19185",
-	"Webster County, IA": "19187",
-	"Winnebago County, IA": "19189",
-	"Winneshiek County, IA": "19191",
-	"Woodbury County, IA": "19193",
-	"Worth County, IA": "19195",
-	"Wright County, IA": "19197",
-	"Allen County, KS": "20001",
-	"Anderson County, KS": "20003",
-	"Atchison County, KS": "20005",
-	"Barber County, KS": "20007",
-	"Barton County, KS": "20009",
-	"Bourbon County, KS": "20011",
-	"Brown County, KS": "20013",
-	"Butler County, KS": "20015",
-	"Chase County, KS": "20017",
-	"Chautauqua County, KS": "20019",
-	"Cherokee County, KS": "20021",
-	"Cheyenne County, KS": "20023",
-	"Clark County, KS": "20025",
-	"Clay County, KS": "20027",
-	"Cloud County, KS": "20029",
-	"Coffey County, KS": "20031",
-	"Comanche County, KS": "20033",
-	"Cowley County, KS": "20035",
-	"Crawford County, KS": "20037",
-	"Decatur County, KS": "20039",
-	"Dickinson County, KS": "20041",
-	"Doniphan County, KS": "20043",
-	"Douglas County, KS": "20045",
-	"Edwards County, KS": "20047",
-	"Elk County, KS": "20049",
-	"Ellis County, KS": "20051",
-	"Ellsworth County, KS": "20053",
-	"Finney County, KS": "20055",
-	"Ford County, KS": "20057",
-	"Franklin County, KS": "20059",
-	"Geary County, KS": "20061",
-	"Gove County, KS": "20063",
-	"Graham County, KS": "20065",
-	"Grant County, KS": "20067",
-	"Gray County, KS": "20069",
-	"Greeley County, KS": "20071",
-	"Greenwood County, KS": "20073",
-	"Hamilton County, KS": "20075",
-	"Harper County, KS": "20077",
-	"Harvey County, KS": "20079",
-	"Haskell County, KS": "20081",
-	"Hodgeman County, KS": "20083",
-	"Jackson County, KS": "20085",
-	"Jefferson County, KS": "20087",
-	"Jewell County, KS": "20089",
-	"Johnson County, KS": "20091",
-	"Kearny County, KS": "20093",
-	"Kingman County, KS": "20095",
-	"Kiowa County, KS": "20097",
-	"Labette County, KS": "20099",
-	"Lane County, KS": "20101",
-	"Leavenworth County, KS": "20103",
-	"Lincoln County, KS": "20105",
-	"Linn County, KS": "20107",
-	"Logan County, KS": "20109",
-	"Lyon County, KS": "20111",
-	"McPherson County, KS": "20113",
-	"Marion County, KS": "20115",
-	"Marshall County, KS": "20117",
-	"Meade County, KS": "20119",
-	"Miami County, KS": "20121",
-	"Mitchell County, KS": "20123",
-	"Montgomery County, KS": "20125",
-	"Morris County, KS": "20127",
-	"Morton County, KS": "20129",
-	"Nemaha County, KS": "20131",
-	"Neosho County, KS": "20133",
-	"Ness County, KS": "20135",
-	"Norton County, KS": "20137",
-	"Osage County, KS": "20139",
-	"Osborne County, KS": "20141",
-	"Ottawa County, KS": "20143",
-	"Pawnee County, KS": "20145",
-	"Phillips County, KS": "20147",
-	"Pottawatomie County, KS": "20149",
-	"Pratt County, KS": "20151",
-	"Rawlins County, KS": "20153",
-	"Reno County, KS": "20155",
-	"Republic County, KS": "20157",
-	"Rice County, KS": "20159",
-	"Riley County, KS": "20161",
-	"Rooks County, KS": "20163",
-	"Rush County, KS": "20165",
-	"Russell County, KS": "20167",
-	"Saline County, KS": "20169",
-	"Scott County, KS": "20171",
-	"Sedgwick County, KS": "20173",
-	"Seward County, KS": "20175",
-	"Shawnee County, KS": "20177",
-	"Sheridan County, KS": "20179",
-	"Sherman County, KS": "20181",
-	"Smith County, KS": "20183",
-	"Stafford County, KS": "20185",
-	"Stanton County, KS": "20187",
-	"Stevens County, KS": "20189",
-	"Sumner County, KS": "20191",
-	"Thomas County, KS": "20193",
-	"Trego County, KS": "20195",
-	"Wabaunsee County, KS": "20197",
-	"Wallace County, KS": "20199",
-	"Washington County, KS": "20201",
-	"Wichita County, KS": "20203",
-	"Wilson County, KS": "20205",
-	"Woodson County, KS": "20207",
-	"Wyandotte County, KS": "20209",
-	"Adair County, KY": "21001",
-	"Allen County, KY": "21003",
-	"Anderson County, KY": "21005",
-	"Ballard County, KY": "21007",
-	"Barren County, KY": "21009",
-	"Bath County, KY": "21011",
-	"Bell County, KY": "21013",
-	"Boone County, KY": "21015",
-	"Bourbon County, KY": "21017",
-	"Boyd County, KY": "21019",
-	"Boyle County, KY": "21021",
-	"Bracken County, KY": "21023",
-	"Breathitt County, KY": "21025",
-	"Breckinridge County, KY": "21027",
-	"Bullitt County, KY": "21029",
-	"Butler County, KY": "21031",
-	"Caldwell County, KY": "21033",
-	"Calloway County, KY": "21035",
-	"Campbell County, KY": "21037",
-	"Carlisle County, KY": "21039",
-	"Carroll County, KY": "21041",
-	"Carter County, KY": "21043",
-	"Casey County, KY": "21045",
-	"Christian County, KY": "21047",
-	"Clark County, KY": "21049",
-	"Clay County, KY": "21051",
-	"Clinton County, KY": "21053",
-	"Crittenden County, KY": "21055",
-	"Cumberland County, KY": "21057",
-	"Daviess County, KY": "21059",
-	"Edmonson County, KY": "21061",
-	"Elliott County, KY": "21063",
-	"Estill County, KY": "21065",
-	"Fayette County, KY": "21067",
-	"Fleming County, KY": "21069",
-	"Floyd County, KY": "21071",
-	"Franklin County, KY": "21073",
-	"Fulton County, KY": "21075",
-	"Gallatin County, KY": "21077",
-	"Garrard County, KY": "21079",
-	"Grant County, KY": "21081",
-	"Graves County, KY": "21083",
-	"Grayson County, KY": "21085",
-	"Green County, KY": "21087",
-	"Greenup County, KY": "21089",
-	"Hancock County, KY": "21091",
-	"Hardin County, KY": "21093",
-	"Harlan County, KY": "21095",
-	"Harrison County, KY": "21097",
-	"Hart County, KY": "21099",
-	"Henderson County, KY": "21101",
-	"Henry County, KY": "21103",
-	"Hickman County, KY": "21105",
-	"Hopkins County, KY": "21107",
-	"Jackson County, KY": "21109",
-	"Jefferson County, KY": "21111",
-	"Jessamine County, KY": "21113",
-	"Johnson County, KY": "21115",
-	"Kenton County, KY": "21117",
-	"Knott County, KY": "21119",
-	"Knox County, KY": "21121",
-	"Larue County, KY": "21123",
-	"Laurel County, KY": "21125",
-	"Lawrence County, KY": "21127",
-	"Lee County, KY": "21129",
-	"Leslie County, KY": "21131",
-	"Letcher County, KY": "21133",
-	"Lewis County, KY": "21135",
-	"Lincoln County, KY": "21137",
-	"Livingston County, KY": "21139",
-	"Logan County, KY": "21141",
-	"Lyon County, KY": "21143",
-	"McCracken County, KY": "21145",
-	"McCreary County, KY": "21147",
-	"McLean County, KY": "21149",
-	"Madison County, KY": "21151",
-	"Magoffin County, KY": "21153",
-	"Marion County, KY": "21155",
-	"Marshall County, KY": "21157",
-	"Martin County, KY": "21159",
-	"Mason County, KY": "21161",
-	"Meade County, KY": "21163",
-	"Menifee County, KY": "21165",
-	"Mercer County, KY": "21167",
-	"Metcalfe County, KY": "21169",
-	"Monroe County, KY": "21171",
-	"Montgomery County, KY": "21173",
-	"Morgan County, KY": "21175",
-	"Muhlenberg County, KY": "21177",
-	"Nelson County, KY": "21179",
-	"Nicholas County, KY": "21181",
-	"Ohio County, KY": "21183",
-	"Oldham County, KY": "21185",
-	"Owen County, KY": "21187",
-	"Owsley County, KY": "21189",
-	"Pendleton County, KY": "21191",
-	"Perry County, KY": "21193",
-	"Pike County, KY": "21195",
-	"Powell County, KY": "21197",
-	"Pulaski County, KY": "21199",
-	"Robertson County, KY": "21201",
-	"Rockcastle County, KY": "21203",
-	"Rowan County, KY": "21205",
-	"Russell County, KY": "21207",
-	"Scott County, KY": "21209",
-	"Shelby County, KY": "21211",
-	"Simpson County, KY": "21213",
-	"Spencer County, KY": "21215",
-	"Taylor County, KY": "21217",
-	"Todd County, KY": "21219",
-	"Trigg County, KY": "21221",
-	"Trimble County, KY": "21223",
-	"Union County, KY": "21225",
-	"Warren County, KY": "21227",
-	"Washington County, KY": "21229",
-	"Wayne County, KY": "21231",
-	"Webster County, KY": "21233",
-	"Whitley County, KY": "21235",
-	"Wolfe County, KY": "21237",
-	"Woodford County, KY": "21239",
-	"Acadia Parish, LA": "22001",
-	"Allen Parish, LA": "22003",
-	"Ascension Parish, LA": "22005",
-	"Assumption Parish, LA": "22007",
-	"Avoyelles Parish, LA": "22009",
-	"Beauregard Parish, LA": "22011",
-	"Bienville Parish, LA": "22013",
-	"Bossier Parish, LA": "22015",
-	"Caddo Parish, LA": "22017",
-	"Calcasieu Parish, LA": "22019",
-	"Caldwell Parish, LA": "22021",
-	"Cameron Parish, LA": "22023",
-	"Catahoula Parish, LA": "22025",
-	"Claiborne Parish, LA": "22027",
-	"Concordia Parish, LA": "22029",
-	"De Soto Parish, LA": "22031",
-	"East Baton Rouge Parish, LA": "22033",
-	"East Carroll Parish, LA": "22035",
-	"East Feliciana Parish, LA": "22037",
-	"Evangeline Parish, LA": "22039",
-	"Franklin Parish, LA": "22041",
-	"Grant Parish, LA": "22043",
-	"Iberia Parish, LA": "22045",
-	"Iberville Parish, LA": "22047",
-	"Jackson Parish, LA": "22049",
-	"Jefferson Parish, LA": "22051",
-	"Jefferson Davis Parish, LA": "22053",
-	"Lafayette Parish, LA": "22055",
-	"Lafourche Parish, LA": "22057",
-	"LaSalle Parish, LA": "22059",
-	"Lincoln Parish, LA": "22061",
-	"Livingston Parish, LA": "22063",
-	"Madison Parish, LA": "22065",
-	"Morehouse Parish, LA": "22067",
-	"Natchitoches Parish, LA": "22069",
-	"Orleans Parish, LA": "22071",
-	"Ouachita Parish, LA": "22073",
-	"Plaquemines Parish, LA": "22075",
-	"Pointe Coupee Parish, LA": "22077",
-	"Rapides Parish, LA": "22079",
-	"Red River Parish, LA": "22081",
-	"Richland Parish, LA": "22083",
-	"Sabine Parish, LA": "22085",
-	"St. Bernard Parish, LA": "22087",
-	"St. Charles Parish, LA": "22089",
-	"St. Helena Parish, LA": "22091",
-	"St. James Parish, LA": "22093",
-	"St. John the Baptist Parish, LA": "22095",
-	"St. Landry Parish, LA": "22097",
-	"St. Martin Parish, LA": "22099",
-	"St. Mary Parish, LA": "22101",
-	"St. Tammany Parish, LA": "22103",
-	"Tangipahoa Parish, LA": "22105",
-	"Tensas Parish, LA": "22107",
-	"Terrebonne Parish, LA": "22109",
-	"Union Parish, LA": "22111",
-	"Vermilion Parish, LA": "22113",
-	"Vernon Parish, LA": "22115",
-	"Washington Parish, LA": "22117",
-	"Webster Parish, LA": "22119",
-	"West Baton Rouge Parish, LA": "22121",
-	"West Carroll Parish, LA": "22123",
-	"West Feliciana Parish, LA": "22125",
-	"Winn Parish, LA": "22127",
-	"Androscoggin County, ME": "23001",
-	"Aroostook County, ME": "23003",
-	"Cumberland County, ME": "23005",
-	"Franklin County, ME": "23007",
-	"Hancock County, ME": "23009",
-	"Kennebec County, ME": "23011",
-	"Knox County, ME": "23013",
-	"Lincoln County, ME": "23015",
-	"Oxford County, ME": "23017",
-	"Penobscot County, ME": "23019",
-	"Piscataquis County, ME": "23021",
-	"Sagadahoc County, ME": "23023",
-	"Somerset County, ME": "23025",
-	"Waldo County, ME": "23027",
-	"Washington County, ME": "23029",
-	"York County, ME": "23031",
-	"Allegany County, MD": "24001",
-	"Anne Arundel County, MD": "24003",
-	"Baltimore County, MD": "24005",
-	"Calvert County, MD": "24009",
-	"Caroline County, MD": "24011",
-	"Carroll County, MD": "24013",
-	"Cecil County, MD": "24015",
-	"Charles County, MD": "24017",
-	"Dorchester County, MD": "24019",
-	"Frederick County, MD": "24021",
-	"Garrett County, MD": "24023",
-	"Harford County, MD": "24025",
-	"Howard County, MD": "24027",
-	"Kent County, MD": "24029",
-	"Montgomery County, MD": "24031",
-	"Prince George's County, MD": "24033",
-	"Queen Anne's County, MD": "24035",
-	"St. Mary's County, MD": "24037",
-	"Somerset County, MD": "24039",
-	"Talbot County, MD": "24041",
-	"Washington County, MD": "24043",
-	"Wicomico County, MD": "24045",
-	"Worcester County, MD": "24047",
-	"Baltimore city, MD": "24510",
-	"Barnstable County, MA": "25001",
-	"Berkshire County, MA": "25003",
-	"Bristol County, MA": "25005",
-	"Dukes County, MA": "25007",
-	"Essex County, MA": "25009",
-	"Franklin County, MA": "25011",
-	"Hampden County, MA": "25013",
-	"Hampshire County, MA": "25015",
-	"Middlesex County, MA": "25017",
-	"Nantucket County, MA": "25019",
-	"Norfolk County, MA": "25021",
-	"Plymouth County, MA": "25023",
-	"Suffolk County, MA": "25025",
-	"Worcester County, MA": "25027",
-	"Alcona County, MI": "26001",
-	"Alger County, MI": "26003",
-	"Allegan County, MI": "26005",
-	"Alpena County, MI": "26007",
-	"Antrim County, MI": "26009",
-	"Arenac County, MI": "26011",
-	"Baraga County, MI": "26013",
-	"Barry County, MI": "26015",
-	"Bay County, MI": "26017",
-	"Benzie County, MI": "26019",
-	"Berrien County, MI": "26021",
-	"Branch County, MI": "26023",
-	"Calhoun County, MI": "26025",
-	"Cass County, MI": "26027",
-	"Charlevoix County, MI": "26029",
-	"Cheboygan County, MI": "26031",
-	"Chippewa County, MI": "26033",
-	"Clare County, MI": "26035",
-	"Clinton County, MI": "26037",
-	"Crawford County, MI": "26039",
-	"Delta County, MI": "26041",
-	"Dickinson County, MI": "26043",
-	"Eaton County, MI": "26045",
-	"Emmet County, MI": "26047",
-	"Genesee County, MI": "26049",
-	"Gladwin County, MI": "26051",
-	"Gogebic County, MI": "26053",
-	"Grand Traverse County, MI": "26055",
-	"Gratiot County, MI": "26057",
-	"Hillsdale County, MI": "26059",
-	"Houghton County, MI": "26061",
-	"Huron County, MI": "26063",
-	"Ingham County, MI": "26065",
-	"Ionia County, MI": "26067",
-	"Iosco County, MI": "26069",
-	"Iron County, MI": "26071",
-	"Isabella County, MI": "26073",
-	"Jackson County, MI": "26075",
-	"Kalamazoo County, MI": "26077",
-	"Kalkaska County, MI": "26079",
-	"Kent County, MI": "26081",
-	"Keweenaw County, MI": "26083",
-	"Lake County, MI": "26085",
-	"Lapeer County, MI": "26087",
-	"Leelanau County, MI": "26089",
-	"Lenawee County, MI": "26091",
-	"Livingston County, MI": "26093",
-	"Luce County, MI": "26095",
-	"Mackinac County, MI": "26097",
-	"Macomb County, MI": "26099",
-	"Manistee County, MI": "26101",
-	"Marquette County, MI": "26103",
-	"Mason County, MI": "26105",
-	"Mecosta County, MI": "26107",
-	"Menominee County, MI": "26109",
-	"Midland County, MI": "26111",
-	"Missaukee County, MI": "26113",
-	"Monroe County, MI": "26115",
-	"Montcalm County, MI": "26117",
-	"Montmorency County, MI": "26119",
-	"Muskegon County, MI": "26121",
-	"Newaygo County, MI": "26123",
-	"Oakland County, MI": "26125",
-	"Oceana County, MI": "26127",
-	"Ogemaw County, MI": "26129",
-	"Ontonagon County, MI": "26131",
-	"Osceola County, MI": "26133",
-	"Oscoda County, MI": "26135",
-	"Otsego County, MI": "26137",
-	"Ottawa County, MI": "26139",
-	"Presque Isle County, MI": "26141",
-	"Roscommon County, MI": "26143",
-	"Saginaw County, MI": "26145",
-	"St. Clair County, MI": "26147",
-	"St. Joseph County, MI": "26149",
-	"Sanilac County, MI": "26151",
-	"Schoolcraft County, MI": "26153",
-	"Shiawassee County, MI": "26155",
-	"Tuscola County, MI": "26157",
-	"Van Buren County, MI": "26159",
-	"Washtenaw County, MI": "26161",
-	"Wayne County, MI": "26163",
-	"Wexford County, MI": "26165",
-	"Aitkin County, MN": "27001",
-	"Anoka County, MN": "27003",
-	"Becker County, MN": "27005",
-	"Beltrami County, MN": "27007",
-	"Benton County, MN": "27009",
-	"Big Stone County, MN": "27011",
-	"Blue Earth County, MN": "27013",
-	"Brown County, MN": "27015",
-	"Carlton County, MN": "27017",
-	"Carver County, MN": "27019",
-	"Cass County, MN": "27021",
-	"Chippewa County, MN": "27023",
-	"Chisago County, MN": "27025",
-	"Clay County, MN": "27027",
-	"Clearwater County, MN": "27029",
-	"Cook County, MN": "27031",
-	"Cottonwood County, MN": "27033",
-	"Crow Wing County, MN": "27035",
-	"Dakota County, MN": "27037",
-	"Dodge County, MN": "27039",
-	"Douglas County, MN": "27041",
-	"Faribault County, MN": "27043",
-	"Fillmore County, MN": "27045",
-	"Freeborn County, MN": "27047",
-	"Goodhue County, MN": "27049",
-	"Grant County, MN": "27051",
-	"Hennepin County, MN": "27053",
-	"Houston County, MN": "27055",
-	"Hubbard County, MN": "27057",
-	"Isanti County, MN": "27059",
-	"Itasca County, MN": "27061",
-	"Jackson County, MN": "27063",
-	"Kanabec County, MN": "27065",
-	"Kandiyohi County, MN": "27067",
-	"Kittson County, MN": "27069",
-	"Koochiching County, MN": "27071",
-	"Lac qui Parle County, MN": "27073",
-	"Lake County, MN": "27075",
-	"Lake of the Woods County, MN": "27077",
-	"Le Sueur County, MN": "27079",
-	"Lincoln County, MN": "27081",
-	"Lyon County, MN": "27083",
-	"McLeod County, MN": "27085",
-	"Mahnomen County, MN": "27087",
-	"Marshall County, MN": "27089",
-	"Martin County, MN": "27091",
-	"Meeker County, MN": "27093",
-	"Mille Lacs County, MN": "27095",
-	"Morrison County, MN": "27097",
-	"Mower County, MN": "27099",
-	"Murray County, MN": "27101",
-	"Nicollet County, MN": "27103",
-	"Nobles County, MN": "27105",
-	"Norman County, MN": "27107",
-	"Olmsted County, MN": "27109",
-	"Otter Tail County, MN": "27111",
-	"Pennington County, MN": "27113",
-	"Pine County, MN": "27115",
-	"Pipestone County, MN": "27117",
-	"Polk County, MN": "27119",
-	"Pope County, MN": "27121",
-	"Ramsey County, MN": "27123",
-	"Red Lake County, MN": "27125",
-	"Redwood County, MN": "27127",
-	"Renville County, MN": "27129",
-	"Rice County, MN": "27131",
-	"Rock County, MN": "27133",
-	"Roseau County, MN": "27135",
-	"St. Louis County, MN": "27137",
-	"Scott County, MN": "27139",
-	"Sherburne County, MN": "27141",
-	"Sibley County, MN": "27143",
-	"Stearns County, MN": "27145",
-	"Steele County, MN": "27147",
-	"Stevens County, MN": "27149",
-	"Swift County, MN": "27151",
-	"Todd County, MN": "27153",
-	"Traverse County, MN": "27155",
-	"Wabasha County, MN": "27157",
-	"Wadena County, MN": "27159",
-	"Waseca County, MN": "27161",
-	"Washington County, MN": "27163",
-	"Watonwan County, MN": "27165",
-	"Wilkin County, MN": "27167",
-	"Winona County, MN": "27169",
-	"Wright County, MN": "27171",
-	"Yellow Medicine County, MN": "27173",
-	"Adams County, MS": "28001",
-	"Alcorn County, MS": "28003",
-	"Amite County, MS": "28005",
-	"Attala County, MS": "28007",
-	"Benton County, MS": "28009",
-	"Bolivar County, MS": "28011",
-	"Calhoun County, MS": "28013",
-	"Carroll County, MS": "28015",
-	"Chickasaw County, MS": "28017",
-	"Choctaw County, MS": "28019",
-	"Claiborne County, MS": "28021",
-	"Clarke County, MS": "28023",
-	"Clay County, MS": "28025",
-	"Coahoma County, MS": "28027",
-	"Copiah County, MS": "28029",
-	"Covington County, MS": "28031",
-	"DeSoto County, MS": "28033",
-	"Forrest County, MS": "28035",
-	"Franklin County, MS": "28037",
-	"George County, MS": "28039",
-	"Greene County, MS": "28041",
-	"Grenada County, MS": "28043",
-	"Hancock County, MS": "28045",
-	"Harrison County, MS": "28047",
-	"Hinds County, MS": "28049",
-	"Holmes County, MS": "28051",
-	"Humphreys County, MS": "28053",
-	"Issaquena County, MS": "28055",
-	"Itawamba County, MS": "28057",
-	"Jackson County, MS": "28059",
-	"Jasper County, MS": "28061",
-	"Jefferson County, MS": "28063",
-	"Jefferson Davis County, MS": "28065",
-	"Jones County, MS": "28067",
-	"Kemper County, MS": "28069",
-	"Lafayette County, MS": "28071",
-	"Lamar County, MS": "28073",
-	"Lauderdale County, MS": "28075",
-	"Lawrence County, MS": "28077",
-	"Leake County, MS": "28079",
-	"Lee County, MS": "28081",
-	"Leflore County, MS": "28083",
-	"Lincoln County, MS": "28085",
-	"Lowndes County, MS": "28087",
-	"Madison County, MS": "28089",
-	"Marion County, MS": "28091",
-	"Marshall County, MS": "28093",
-	"Monroe County, MS": "28095",
-	"Montgomery County, MS": "28097",
-	"Neshoba County, MS": "28099",
-	"Newton County, MS": "28101",
-	"Noxubee County, MS": "28103",
-	"Oktibbeha County, MS": "28105",
-	"Panola County, MS": "28107",
-	"Pearl River County, MS": "28109",
-	"Perry County, MS": "28111",
-	"Pike County, MS": "28113",
-	"Pontotoc County, MS": "28115",
-	"Prentiss County, MS": "28117",
-	"Quitman County, MS": "28119",
-	"Rankin County, MS": "28121",
-	"Scott County, MS": "28123",
-	"Sharkey County, MS": "28125",
-	"Simpson County, MS": "28127",
-	"Smith County, MS": "28129",
-	"Stone County, MS": "28131",
-	"Sunflower County, MS": "28133",
-	"Tallahatchie County, MS": "28135",
-	"Tate County, MS": "28137",
-	"Tippah County, MS": "28139",
-	"Tishomingo County, MS": "28141",
-	"Tunica County, MS": "28143",
-	"Union County, MS": "28145",
-	"Walthall County, MS": "28147",
-	"Warren County, MS": "28149",
-	"Washington County, MS": "28151",
-	"Wayne County, MS": "28153",
-	"Webster County, MS": "28155",
-	"Wilkinson County, MS": "28157",
-	"Winston County, MS": "28159",
-	"Yalobusha County, MS": "28161",
-	"Yazoo County, MS": "28163",
-	"Adair County, MO": "29001",
-	"Andrew County, MO": "29003",
-	"Atchison County, MO": "29005",
-	"Audrain County, MO": "29007",
-	"Barry County, MO": "29009",
-	"Barton County, MO": "29011",
-	"Bates County, MO": "29013",
-	"Benton County, MO": "29015",
-	"Bollinger County, MO": "29017",
-	"Boone County, MO": "29019",
-	"Buchanan County, MO": "29021",
-	"Butler County, MO": "29023",
-	"Caldwell County, MO": "29025",
-	"Callaway County, MO": "29027",
-	"Camden County, MO": "29029",
-	"Cape Girardeau County, MO": "29031",
-	"Carroll County, MO": "29033",
-	"Carter County, MO": "29035",
-	"Cass County, MO": "29037",
-	"Cedar County, MO": "29039",
-	"Chariton County, MO": "29041",
-	"Christian County, MO": "29043",
-	"Clark County, MO": "29045",
-	"Clay County, MO": "29047",
-	"Clinton County, MO": "29049",
-	"Cole County, MO": "29051",
-	"Cooper County, MO": "29053",
-	"Crawford County, MO": "29055",
-	"Dade County, MO": "29057",
-	"Dallas County, MO": "29059",
-	"Daviess County, MO": "29061",
-	"DeKalb County, MO": "29063",
-	"Dent County, MO": "29065",
-	"Douglas County, MO": "29067",
-	"Dunklin County, MO": "29069",
-	"Franklin County, MO": "29071",
-	"Gasconade County, MO": "29073",
-	"Gentry County, MO": "29075",
-	"Greene County, MO": "29077",
-	"Grundy County, MO": "29079",
-	"Harrison County, MO": "29081",
-	"Henry County, MO": "29083",
-	"Hickory County, MO": "29085",
-	"Holt County, MO": "29087",
-	"Howard County, MO": "29089",
-	"Howell County, MO": "29091",
-	"Iron County, MO": "29093",
-	"Jackson County, MO": "29095",
-	"Jasper County, MO": "29097",
-	"Jefferson County, MO": "29099",
-	"Johnson County, MO": "29101",
-	"Knox County, MO": "29103",
-	"Laclede County, MO": "29105",
-	"Lafayette County, MO": "29107",
-	"Lawrence County, MO": "29109",
-	"Lewis County, MO": "29111",
-	"Lincoln County, MO": "29113",
-	"Linn County, MO": "29115",
-	"Livingston County, MO": "29117",
-	"McDonald County, MO": "29119",
-	"Macon County, MO": "29121",
-	"Madison County, MO": "29123",
-	"Maries County, MO": "29125",
-	"Marion County, MO": "29127",
-	"Mercer County, MO": "29129",
-	"Miller County, MO": "29131",
-	"Mississippi County, MO": "29133",
-	"Moniteau County, MO": "29135",
-	"Monroe County, MO": "29137",
-	"Montgomery County, MO": "29139",
-	"Morgan County, MO": "29141",
-	"New Madrid County, MO": "29143",
-	"Newton County, MO": "29145",
-	"Nodaway County, MO": "29147",
-	"Oregon County, MO": "29149",
-	"Osage County, MO": "29151",
-	"Ozark County, MO": "29153",
-	"Pemiscot County, MO": "29155",
-	"Perry County, MO": "29157",
-	"Pettis County, MO": "29159",
-	"Phelps County, MO": "29161",
-	"Pike County, MO": "29163",
-	"Platte County, MO": "29165",
-	"Polk County, MO": "29167",
-	"Pulaski County, MO": "29169",
-	"Putnam County, MO": "29171",
-	"Ralls County, MO": "29173",
-	"Randolph County, MO": "29175",
-	"Ray County, MO": "29177",
-	"Reynolds County, MO": "29179",
-	"Ripley County, MO": "29181",
-	"St. Charles County, MO": "29183",
-	"St. Clair County, MO": "29185",
-	"Ste. Genevieve County, MO": "29186",
-	"St. Francois County, MO": "29187",
-	"St. Louis County, MO": "29189",
-	"Saline County, MO": "29195",
-	"Schuyler County, MO": "29197",
-	"Scotland County, MO": "29199",
-	"Scott County, MO": "29201",
-	"Shannon County, MO": "29203",
-	"Shelby County, MO": "29205",
-	"Stoddard County, MO": "29207",
-	"Stone County, MO": "29209",
-	"Sullivan County, MO": "29211",
-	"Taney County, MO": "29213",
-	"Texas County, MO": "29215",
-	"Vernon County, MO": "29217",
-	"Warren County, MO": "29219",
-	"Washington County, MO": "29221",
-	"Wayne County, MO": "29223",
-	"Webster County, MO": "29225",
-	"Worth County, MO": "29227",
-	"Wright County, MO": "29229",
-	"St. Louis city, MO": "29510",
-	"Beaverhead County, MT": "30001",
-	"Big Horn County, MT": "30003",
-	"Blaine County, MT": "30005",
-	"Broadwater County, MT": "30007",
-	"Carbon County, MT": "30009",
-	"Carter County, MT": "30011",
-	"Cascade County, MT": "30013",
-	"Chouteau County, MT": "30015",
-	"Custer County, MT": "30017",
-	"Daniels County, MT": "30019",
-	"Dawson County, MT": "30021",
-	"Deer Lodge County, MT": "30023",
-	"Fallon County, MT": "30025",
-	"Fergus County, MT": "30027",
-	"Flathead County, MT": "30029",
-	"Gallatin County, MT": "30031",
-	"Garfield County, MT": "30033",
-	"Glacier County, MT": "30035",
-	"Golden Valley County, MT": "30037",
-	"Granite County, MT": "30039",
-	"Hill County, MT": "30041",
-	"Jefferson County, MT": "30043",
-	"Judith Basin County, MT": "30045",
-	"Lake County, MT": "30047",
-	"Lewis and Clark County, MT": "30049",
-	"Liberty County, MT": "30051",
-	"Lincoln County, MT": "30053",
-	"McCone County, MT": "30055",
-	"Madison County, MT": "30057",
-	"Meagher County, MT": "30059",
-	"Mineral County, MT": "30061",
-	"Missoula County, MT": "30063",
-	"Musselshell County, MT": "30065",
-	"Park County, MT": "30067",
-	"Petroleum County, MT": "30069",
-	"Phillips County, MT": "30071",
-	"Pondera County, MT": "30073",
-	"Powder River County, MT": "30075",
-	"Powell County, MT": "30077",
-	"Prairie County, MT": "30079",
-	"Ravalli County, MT": "30081",
-	"Richland County, MT": "30083",
-	"Roosevelt County, MT": "30085",
-	"Rosebud County, MT": "30087",
-	"Sanders County, MT": "30089",
-	"Sheridan County, MT": "30091",
-	"Silver Bow County, MT": "30093",
-	"Stillwater County, MT": "30095",
-	"Sweet Grass County, MT": "30097",
-	"Teton County, MT": "30099",
-	"Toole County, MT": "30101",
-	"Treasure County, MT": "30103",
-	"Valley County, MT": "30105",
-	"Wheatland County, MT": "30107",
-	"Wibaux County, MT": "30109",
-	"Yellowstone County, MT": "30111",
-	"Adams County, NE": "31001",
-	"Antelope County, NE": "31003",
-	"Arthur County, NE": "31005",
-	"Banner County, NE": "31007",
-	"Blaine County, NE": "31009",
-	"Boone County, NE": "31011",
-	"Box Butte County, NE": "31013",
-	"Boyd County, NE": "31015",
-	"Brown County, NE": "31017",
-	"Buffalo County, NE": "31019",
-	"Burt County, NE": "31021",
-	"Butler County, NE": "31023",
-	"Cass County, NE": "31025",
-	"Cedar County, NE": "31027",
-	"Chase County, NE": "31029",
-	"Cherry County, NE": "31031",
-	"Cheyenne County, NE": "31033",
-	"Clay County, NE": "31035",
-	"Colfax County, NE": "31037",
-	"Cuming County, NE": "31039",
-	"Custer County, NE": "31041",
-	"Dakota County, NE": "31043",
-	"Dawes County, NE": "31045",
-	"Dawson County, NE": "31047",
-	"Deuel County, NE": "31049",
-	"Dixon County, NE": "31051",
-	"Dodge County, NE": "31053",
-	"Douglas County, NE": "31055",
-	"Dundy County, NE": "31057",
-	"Fillmore County, NE": "31059",
-	"Franklin County, NE": "31061",
-	"Frontier County, NE": "31063",
-	"Furnas County, NE": "31065",
-	"Gage County, NE": "31067",
-	"Garden County, NE": "31069",
-	"Garfield County, NE": "31071",
-	"Gosper County, NE": "31073",
-	"Grant County, NE": "31075",
-	"Greeley County, NE": "31077",
-	"Hall County, NE": "31079",
-	"Hamilton County, NE": "31081",
-	"Harlan County, NE": "31083",
-	"Hayes County, NE": "31085",
-	"Hitchcock County, NE": "31087",
-	"Holt County, NE": "31089",
-	"Hooker County, NE": "31091",
-	"Howard County, NE": "31093",
-	"Jefferson County, NE": "31095",
-	"Johnson County, NE": "31097",
-	"Kearney County, NE": "31099",
-	"Keith County, NE": "31101",
-	"Keya Paha County, NE": "31103",
-	"Kimball County, NE": "31105",
-	"Knox County, NE": "31107",
-	"Lancaster County, NE": "31109",
-	"Lincoln County, NE": "31111",
-	"Logan County, NE": "31113",
-	"Loup County, NE": "31115",
-	"McPherson County, NE": "31117",
-	"Madison County, NE": "31119",
-	"Merrick County, NE": "31121",
-	"Morrill County, NE": "31123",
-	"Nance County, NE": "31125",
-	"Nemaha County, NE": "31127",
-	"Nuckolls County, NE": "31129",
-	"Otoe County, NE": "31131",
-	"Pawnee County, NE": "31133",
-	"Perkins County, NE": "31135",
-	"Phelps County, NE": "31137",
-	"Pierce County, NE": "31139",
-	"Platte County, NE": "31141",
-	"Polk County, NE": "31143",
-	"Red Willow County, NE": "31145",
-	"Richardson County, NE": "31147",
-	"Rock County, NE": "31149",
-	"Saline County, NE": "31151",
-	"Sarpy County, NE": "31153",
-	"Saunders County, NE": "31155",
-	"Scotts Bluff County, NE": "31157",
-	"Seward County, NE": "31159",
-	"Sheridan County, NE": "31161",
-	"Sherman County, NE": "31163",
-	"Sioux County, NE": "31165",
-	"Stanton County, NE": "31167",
-	"Thayer County, NE": "31169",
-	"Thomas County, NE": "31171",
-	"Thurston County, NE": "31173",
-	"Valley County, NE": "31175",
-	"Washington County, NE": "31177",
-	"Wayne County, NE": "31179",
-	"Webster County, NE": "31181",
-	"Wheeler County, NE": "31183",
-	"York County, NE": "31185",
-	"Churchill County, NV": "32001",
-	"Clark County, NV": "32003",
-	"Douglas County, NV": "32005",
-	"Elko County, NV": "32007",
-	"Esmeralda County, NV": "32009",
-	"Eureka County, NV": "32011",
-	"Humboldt County, NV": "32013",
-	"Lander County, NV": "32015",
-	"Lincoln County, NV": "32017",
-	"Lyon County, NV": "32019",
-	"Mineral County, NV": "32021",
-	"Nye County, NV": "32023",
-	"Pershing County, NV": "32027",
-	"Storey County, NV": "32029",
-	"Washoe County, NV": "32031",
-	"White Pine County, NV": "32033",
-	"Carson City, NV": "32510",
-	"Belknap County, NH": "33001",
-	"Carroll County, NH": "33003",
-	"Cheshire County, NH": "33005",
-	"Coos County, NH": "33007",
-	"Grafton County, NH": "33009",
-	"Hillsborough County, NH": "33011",
-	"Merrimack County, NH": "33013",
-	"Rockingham County, NH": "33015",
-	"Strafford County, NH": "33017",
-	"Sullivan County, NH": "33019",
-	"Atlantic County, NJ": "34001",
-	"Bergen County, NJ": "34003",
-	"Burlington County, NJ": "34005",
-	"Camden County, NJ": "34007",
-	"Cape May County, NJ": "34009",
-	"Cumberland County, NJ": "34011",
-	"Essex County, NJ": "34013",
-	"Gloucester County, NJ": "34015",
-	"Hudson County, NJ": "34017",
-	"Hunterdon County, NJ": "34019",
-	"Mercer County, NJ": "34021",
-	"Middlesex County, NJ": "34023",
-	"Monmouth County, NJ": "34025",
-	"Morris County, NJ": "34027",
-	"Ocean County, NJ": "34029",
-	"Passaic County, NJ": "34031",
-	"Salem County, NJ": "34033",
-	"Somerset County, NJ": "34035",
-	"Sussex County, NJ": "34037",
-	"Union County, NJ": "34039",
-	"Warren County, NJ": "34041",
-	"Bernalillo County, NM": "35001",
-	"Catron County, NM": "35003",
-	"Chaves County, NM": "35005",
-	"Cibola County, NM": "35006",
-	"Colfax County, NM": "35007",
-	"Curry County, NM": "35009",
-	"De Baca County, NM": "35011",
-	"Doña Ana County, NM": "35013",
-	"Eddy County, NM": "35015",
-	"Grant County, NM": "35017",
-	"Guadalupe County, NM": "35019",
-	"Harding County, NM": "35021",
-	"Hidalgo County, NM": "35023",
-	"Lea County, NM": "35025",
-	"Lincoln County, NM": "35027",
-	"Los Alamos County, NM": "35028",
-	"Luna County, NM": "35029",
-	"McKinley County, NM": "35031",
-	"Mora County, NM": "35033",
-	"Otero County, NM": "35035",
-	"Quay County, NM": "35037",
-	"Rio Arriba County, NM": "35039",
-	"Roosevelt County, NM": "35041",
-	"Sandoval County, NM": "35043",
-	"San Juan County, NM": "35045",
-	"San Miguel County, NM": "35047",
-	"Santa Fe County, NM": "35049",
-	"Sierra County, NM": "35051",
-	"Socorro County, NM": "35053",
-	"Taos County, NM": "35055",
-	"Torrance County, NM": "35057",
-	"Union County, NM": "35059",
-	"Valencia County, NM": "35061",
-	"Albany County, NY": "36001",
-	"Allegany County, NY": "36003",
-	"Bronx County, NY": "36005",
-	"Broome County, NY": "36007",
-	"Cattaraugus County, NY": "36009",
-	"Cayuga County, NY": "36011",
-	"Chautauqua County, NY": "36013",
-	"Chemung County, NY": "36015",
-	"Chenango County, NY": "36017",
-	"Clinton County, NY": "36019",
-	"Columbia County, NY": "36021",
-	"Cortland County, NY": "36023",
-	"Delaware County, NY": "36025",
-	"Dutchess County, NY": "36027",
-	"Erie County, NY": "36029",
-	"Essex County, NY": "36031",
-	"Franklin County, NY": "36033",
-	"Fulton County, NY": "36035",
-	"Genesee County, NY": "36037",
-	"Greene County, NY": "36039",
-	"Hamilton County, NY": "36041",
-	"Herkimer County, NY": "36043",
-	"Jefferson County, NY": "36045",
-	"Kings County, NY": "36047",
-	"Lewis County, NY": "36049",
-	"Livingston County, NY": "36051",
-	"Madison County, NY": "36053",
-	"Monroe County, NY": "36055",
-	"Montgomery County, NY": "36057",
-	"Nassau County, NY": "36059",
-	"New York County, NY": "36061",
-	"Niagara County, NY": "36063",
-	"Oneida County, NY": "36065",
-	"Onondaga County, NY": "36067",
-	"Ontario County, NY": "36069",
-	"Orange County, NY": "36071",
-	"Orleans County, NY": "36073",
-	"Oswego County, NY": "36075",
-	"Otsego County, NY": "36077",
-	"Putnam County, NY": "36079",
-	"Queens County, NY": "36081",
-	"Rensselaer County, NY": "36083",
-	"Richmond County, NY": "36085",
-	"Rockland County, NY": "36087",
-	"St. Lawrence County, NY": "36089",
-	"Saratoga County, NY": "36091",
-	"Schenectady County, NY": "36093",
-	"Schoharie County, NY": "36095",
-	"Schuyler County, NY": "36097",
-	"Seneca County, NY": "36099",
-	"Steuben County, NY": "36101",
-	"Suffolk County, NY": "36103",
-	"Sullivan County, NY": "36105",
-	"Tioga County, NY": "36107",
-	"Tompkins County, NY": "36109",
-	"Ulster County, NY": "36111",
-	"Warren County, NY": "36113",
-	"Washington County, NY": "36115",
-	"Wayne County, NY": "36117",
-	"Westchester County, NY": "36119",
-	"Wyoming County, NY": "36121",
-	"Yates County, NY": "36123",
-	"Alamance County, NC": "37001",
-	"Alexander County, NC": "37003",
-	"Alleghany County, NC": "37005",
-	"Anson County, NC": "37007",
-	"Ashe County, NC": "37009",
-	"Avery County, NC": "37011",
-	"Beaufort County, NC": "37013",
-	"Bertie County, NC": "37015",
-	"Bladen County, NC": "37017",
-	"Brunswick County, NC": "37019",
-	"Buncombe County, NC": "37021",
-	"Burke County, NC": "37023",
-	"Cabarrus County, NC": "37025",
-	"Caldwell County, NC": "37027",
-	"Camden County, NC": "37029",
-	"Carteret County, NC": "37031",
-	"Caswell County, NC": "37033",
-	"Catawba County, NC": "37035",
-	"Chatham County, NC": "37037",
-	"Cherokee County, NC": "37039",
-	"Chowan County, NC": "37041",
-	"Clay County, NC": "37043",
-	"Cleveland County, NC": "37045",
-	"Columbus County, NC": "37047",
-	"Craven County, NC": "37049",
-	"Cumberland County, NC": "37051",
-	"Currituck County, NC": "37053",
-	"Dare County, NC": "37055",
-	"Davidson County, NC": "37057",
-	"Davie County, NC": "37059",
-	"Duplin County, NC": "37061",
-	"Durham County, NC": "37063",
-	"Edgecombe County, NC": "37065",
-	"Forsyth County, NC": "37067",
-	"Franklin County, NC": "37069",
-	"Gaston County, NC": "37071",
-	"Gates County, NC": "37073",
-	"Graham County, NC": "37075",
-	"Granville County, NC": "37077",
-	"Greene County, NC": "37079",
-	"Guilford County, NC": "37081",
-	"Halifax County, NC": "37083",
-	"Harnett County, NC": "37085",
-	"Haywood County, NC": "37087",
-	"Henderson County, NC": "37089",
-	"Hertford County, NC": "37091",
-	"Hoke County, NC": "37093",
-	"Hyde County, NC": "37095",
-	"Iredell County, NC": "37097",
-	"Jackson County, NC": "37099",
-	"Johnston County, NC": "37101",
-	"Jones County, NC": "37103",
-	"Lee County, NC": "37105",
-	"Lenoir County, NC": "37107",
-	"Lincoln County, NC": "37109",
-	"McDowell County, NC": "37111",
-	"Macon County, NC": "37113",
-	"Madison County, NC": "37115",
-	"Martin County, NC": "37117",
-	"Mecklenburg County, NC": "37119",
-	"Mitchell County, NC": "37121",
-	"Montgomery County, NC": "37123",
-	"Moore County, NC": "37125",
-	"Nash County, NC": "37127",
-	"New Hanover County, NC": "37129",
-	"Northampton County, NC": "37131",
-	"Onslow County, NC": "37133",
-	"Orange County, NC": "37135",
-	"Pamlico County, NC": "37137",
-	"Pasquotank County, NC": "37139",
-	"Pender County, NC": "37141",
-	"Perquimans County, NC": "37143",
-	"Person County, NC": "37145",
-	"Pitt County, NC": "37147",
-	"Polk County, NC": "37149",
-	"Randolph County, NC": "37151",
-	"Richmond County, NC": "37153",
-	"Robeson County, NC": "37155",
-	"Rockingham County, NC": "37157",
-	"Rowan County, NC": "37159",
-	"Rutherford County, NC": "37161",
-	"Sampson County, NC": "37163",
-	"Scotland County, NC": "37165",
-	"Stanly County, NC": "37167",
-	"Stokes County, NC": "37169",
-	"Surry County, NC": "37171",
-	"Swain County, NC": "37173",
-	"Transylvania County, NC": "37175",
-	"Tyrrell County, NC": "37177",
-	"Union County, NC": "37179",
-	"Vance County, NC": "37181",
-	"Wake County, NC": "37183",
-	"Warren County, NC": "37185",
-	"Washington County, NC": "37187",
-	"Watauga County, NC": "37189",
-	"Wayne County, NC": "37191",
-	"Wilkes County, NC": "37193",
-	"Wilson County, NC": "37195",
-	"Yadkin County, NC": "37197",
-	"Yancey County, NC": "37199",
-	"Adams County, ND": "38001",
-	"Barnes County, ND": "38003",
-	"Benson County, ND": "38005",
-	"Billings County, ND": "38007",
-	"Bottineau County, ND": "38009",
-	"Bowman County, ND": "38011",
-	"Burke County, ND": "38013",
-	"Burleigh County, ND": "38015",
-	"Cass County, ND": "38017",
-	"Cavalier County, ND": "38019",
-	"Dickey County, ND": "38021",
-	"Divide County, ND": "38023",
-	"Dunn County, ND": "38025",
-	"Eddy County, ND": "38027",
-	"Emmons County, ND": "38029",
-	"Foster County, ND": "38031",
-	"Golden Valley County, ND": "38033",
-	"Grand Forks County, ND": "38035",
-	"Grant County, ND": "38037",
-	"Griggs County, ND": "38039",
-	"Hettinger County, ND": "38041",
-	"Kidder County, ND": "38043",
-	"LaMoure County, ND": "38045",
-	"Logan County, ND": "38047",
-	"McHenry County, ND": "38049",
-	"McIntosh County, ND": "38051",
-	"McKenzie County, ND": "38053",
-	"McLean County, ND": "38055",
-	"Mercer County, ND": "38057",
-	"Morton County, ND": "38059",
-	"Mountrail County, ND": "38061",
-	"Nelson County, ND": "38063",
-	"Oliver County, ND": "38065",
-	"Pembina County, ND": "38067",
-	"Pierce County, ND": "38069",
-	"Ramsey County, ND": "38071",
-	"Ransom County, ND": "38073",
-	"Renville County, ND": "38075",
-	"Richland County, ND": "38077",
-	"Rolette County, ND": "38079",
-	"Sargent County, ND": "38081",
-	"Sheridan County, ND": "38083",
-	"Sioux County, ND": "38085",
-	"Slope County, ND": "38087",
-	"Stark County, ND": "38089",
-	"Steele County, ND": "38091",
-	"Stutsman County, ND": "38093",
-	"Towner County, ND": "38095",
-	"Traill County, ND": "38097",
-	"Walsh County, ND": "38099",
-	"Ward County, ND": "38101",
-	"Wells County, ND": "38103",
-	"Williams County, ND": "38105",
-	"Adams County, OH": "39001",
-	"Allen County, OH": "39003",
-	"Ashland County, OH": "39005",
-	"Ashtabula County, OH": "39007",
-	"Athens County, OH": "39009",
-	"Auglaize County, OH": "39011",
-	"Belmont County, OH": "39013",
-	"Brown County, OH": "39015",
-	"Butler County, OH": "39017",
-	"Carroll County, OH": "39019",
-	"Champaign County, OH": "39021",
-	"Clark County, OH": "39023",
-	"Clermont County, OH": "39025",
-	"Clinton County, OH": "39027",
-	"Columbiana County, OH": "39029",
-	"Coshocton County, OH": "39031",
-	"Crawford County, OH": "39033",
-	"Cuyahoga County, OH": "39035",
-	"Darke County, OH": "39037",
-	"Defiance County, OH": "39039",
-	"Delaware County, OH": "39041",
-	"Erie County, OH": "39043",
-	"Fairfield County, OH": "39045",
-	"Fayette County, OH": "39047",
-	"Franklin County, OH": "39049",
-	"Fulton County, OH": "39051",
-	"Gallia County, OH": "39053",
-	"Geauga County, OH": "39055",
-	"Greene County, OH": "39057",
-	"Guernsey County, OH": "39059",
-	"Hamilton County, OH": "39061",
-	"Hancock County, OH": "39063",
-	"Hardin County, OH": "39065",
-	"Harrison County, OH": "39067",
-	"Henry County, OH": "39069",
-	"Highland County, OH": "39071",
-	"Hocking County, OH": "39073",
-	"Holmes County, OH": "39075",
-	"Huron County, OH": "39077",
-	"Jackson County, OH": "39079",
-	"Jefferson County, OH": "39081",
-	"Knox County, OH": "39083",
-	"Lake County, OH": "39085",
-	"Lawrence County, OH": "39087",
-	"Licking County, OH": "39089",
-	"Logan County, OH": "39091",
-	"Lorain County, OH": "39093",
-	"Lucas County, OH": "39095",
-	"Madison County, OH": "39097",
-	"Mahoning County, OH": "39099",
-	"Marion County, OH": "39101",
-	"Medina County, OH": "39103",
-	"Meigs County, OH": "39105",
-	"Mercer County, OH": "39107",
-	"Miami County, OH": "39109",
-	"Monroe County, OH": "39111",
-	"Montgomery County, OH": "39113",
-	"Morgan County, OH": "39115",
-	"Morrow County, OH": "39117",
-	"Muskingum County, OH": "39119",
-	"Noble County, OH": "39121",
-	"Ottawa County, OH": "39123",
-	"Paulding County, OH": "39125",
-	"Perry County, OH": "39127",
-	"Pickaway County, OH": "39129",
-	"Pike County, OH": "39131",
-	"Portage County, OH": "39133",
-	"Preble County, OH": "39135",
-	"Putnam County, OH": "39137",
-	"Richland County, OH": "39139",
-	"Ross County, OH": "39141",
-	"Sandusky County, OH": "39143",
-	"Scioto County, OH": "39145",
-	"Seneca County, OH": "39147",
-	"Shelby County, OH": "39149",
-	"Stark County, OH": "39151",
-	"Summit County, OH": "39153",
-	"Trumbull County, OH": "39155",
-	"Tuscarawas County, OH": "39157",
-	"Union County, OH": "39159",
-	"Van Wert County, OH": "39161",
-	"Vinton County, OH": "39163",
-	"Warren County, OH": "39165",
-	"Washington County, OH": "39167",
-	"Wayne County, OH": "39169",
-	"Williams County, OH": "39171",
-	"Wood County, OH": "39173",
-	"Wyandot County, OH": "39175",
-	"Adair County, OK": "40001",
-	"Alfalfa County, OK": "40003",
-	"Atoka County, OK": "40005",
-	"Beaver County, OK": "40007",
-	"Beckham County, OK": "40009",
-	"Blaine County, OK": "40011",
-	"Bryan County, OK": "40013",
-	"Caddo County, OK": "40015",
-	"Canadian County, OK": "40017",
-	"Carter County, OK": "40019",
-	"Cherokee County, OK": "40021",
-	"Choctaw County, OK": "40023",
-	"Cimarron County, OK": "40025",
-	"Cleveland County, OK": "40027",
-	"Coal County, OK": "40029",
-	"Comanche County, OK": "40031",
-	"Cotton County, OK": "40033",
-	"Craig County, OK": "40035",
-	"Creek County, OK": "40037",
-	"Custer County, OK": "40039",
-	"Delaware County, OK": "40041",
-	"Dewey County, OK": "40043",
-	"Ellis County, OK": "40045",
-	"Garfield County, OK": "40047",
-	"Garvin County, OK": "40049",
-	"Grady County, OK": "40051",
-	"Grant County, OK": "40053",
-	"Greer County, OK": "40055",
-	"Harmon County, OK": "40057",
-	"Harper County, OK": "40059",
-	"Haskell County, OK": "40061",
-	"Hughes County, OK": "40063",
-	"Jackson County, OK": "40065",
-	"Jefferson County, OK": "40067",
-	"Johnston County, OK": "40069",
-	"Kay County, OK": "40071",
-	"Kingfisher County, OK": "40073",
-	"Kiowa County, OK": "40075",
-	"Latimer County, OK": "40077",
-	"Le Flore County, OK": "40079",
-	"Lincoln County, OK": "40081",
-	"Logan County, OK": "40083",
-	"Love County, OK": "40085",
-	"McClain County, OK": "40087",
-	"McCurtain County, OK": "40089",
-	"McIntosh County, OK": "40091",
-	"Major County, OK": "40093",
-	"Marshall County, OK": "40095",
-	"Mayes County, OK": "40097",
-	"Murray County, OK": "40099",
-	"Muskogee County, OK": "40101",
-	"Noble County, OK": "40103",
-	"Nowata County, OK": "40105",
-	"Okfuskee County, OK": "40107",
-	"Oklahoma County, OK": "40109",
-	"Okmulgee County, OK": "40111",
-	"Osage County, OK": "40113",
-	"Ottawa County, OK": "40115",
-	"Pawnee County, OK": "40117",
-	"Payne County, OK": "40119",
-	"Pittsburg County, OK": "40121",
-	"Pontotoc County, OK": "40123",
-	"Pottawatomie County, OK": "40125",
-	"Pushmataha County, OK": "40127",
-	"Roger Mills County, OK": "40129",
-	"Rogers County, OK": "40131",
-	"Seminole County, OK": "40133",
-	"Sequoyah County, OK": "40135",
-	"Stephens County, OK": "40137",
-	"Texas County, OK": "40139",
-	"Tillman County, OK": "40141",
-	"Tulsa County, OK": "40143",
-	"Wagoner County, OK": "40145",
-	"Washington County, OK": "40147",
-	"Washita County, OK": "40149",
-	"Woods County, OK": "40151",
-	"Woodward County, OK": "40153",
-	"Baker County, OR": "41001",
-	"Benton County, OR": "41003",
-	"Clackamas County, OR": "41005",
-	"Clatsop County, OR": "41007",
-	"Columbia County, OR": "41009",
-	"Coos County, OR": "41011",
-	"Crook County, OR": "41013",
-	"Curry County, OR": "41015",
-	"Deschutes County, OR": "41017",
-	"Douglas County, OR": "41019",
-	"Gilliam County, OR": "41021",
-	"Grant County, OR": "41023",
-	"Harney County, OR": "41025",
-	"Hood River County, OR": "41027",
-	"Jackson County, OR": "41029",
-	"Jefferson County, OR": "41031",
-	"Josephine County, OR": "41033",
-	"Klamath County, OR": "41035",
-	"Lake County, OR": "41037",
-	"Lane County, OR": "41039",
-	"Lincoln County, OR": "41041",
-	"Linn County, OR": "41043",
-	"Malheur County, OR": "41045",
-	"Marion County, OR": "41047",
-	"Morrow County, OR": "41049",
-	"Multnomah County, OR": "41051",
-	"Polk County, OR": "41053",
-	"Sherman County, OR": "41055",
-	"Tillamook County, OR": "41057",
-	"Umatilla County, OR": "41059",
-	"Union County, OR": "41061",
-	"Wallowa County, OR": "41063",
-	"Wasco County, OR": "41065",
-	"Washington County, OR": "41067",
-	"Wheeler County, OR": "41069",
-	"Yamhill County, OR": "41071",
-	"Adams County, PA": "42001",
-	"Allegheny County, PA": "42003",
-	"Armstrong County, PA": "42005",
-	"Beaver County, PA": "42007",
-	"Bedford County, PA": "42009",
-	"Berks County, PA": "42011",
-	"Blair County, PA": "42013",
-	"Bradford County, PA": "42015",
-	"Bucks County, PA": "42017",
-	"Butler County, PA": "42019",
-	"Cambria County, PA": "42021",
-	"Cameron County, PA": "42023",
-	"Carbon County, PA": "42025",
-	"Centre County, PA": "42027",
-	"Chester County, PA": "42029",
-	"Clarion County, PA": "42031",
-	"Clearfield County, PA": "42033",
-	"Clinton County, PA": "42035",
-	"Columbia County, PA": "42037",
-	"Crawford County, PA": "42039",
-	"Cumberland County, PA": "42041",
-	"Dauphin County, PA": "42043",
-	"Delaware County, PA": "42045",
-	"Elk County, PA": "42047",
-	"Erie County, PA": "42049",
-	"Fayette County, PA": "42051",
-	"Forest County, PA": "42053",
-	"Franklin County, PA": "42055",
-	"Fulton County, PA": "42057",
-	"Greene County, PA": "42059",
-	"Huntingdon County, PA": "42061",
-	"Indiana County, PA": "42063",
-	"Jefferson County, PA": "42065",
-	"Juniata County, PA": "42067",
-	"Lackawanna County, PA": "42069",
-	"Lancaster County, PA": "42071",
-	"Lawrence County, PA": "42073",
-	"Lebanon County, PA": "42075",
-	"Lehigh County, PA": "42077",
-	"Luzerne County, PA": "42079",
-	"Lycoming County, PA": "42081",
-	"McKean County, PA": "42083",
-	"Mercer County, PA": "42085",
-	"Mifflin County, PA": "42087",
-	"Monroe County, PA": "42089",
-	"Montgomery County, PA": "42091",
-	"Montour County, PA": "42093",
-	"Northampton County, PA": "42095",
-	"Northumberland County, PA": "42097",
-	"Perry County, PA": "42099",
-	"Philadelphia County, PA": "42101",
-	"Pike County, PA": "42103",
-	"Potter County, PA": "42105",
-	"Schuylkill County, PA": "42107",
-	"Snyder County, PA": "42109",
-	"Somerset County, PA": "42111",
-	"Sullivan County, PA": "42113",
-	"Susquehanna County, PA": "42115",
-	"Tioga County, PA": "42117",
-	"Union County, PA": "42119",
-	"Venango County, PA": "42121",
-	"Warren County, PA": "42123",
-	"Washington County, PA": "42125",
-	"Wayne County, PA": "42127",
-	"Westmoreland County, PA": "42129",
-	"Wyoming County, PA": "42131",
-	"York County, PA": "42133",
-	"Bristol County, RI": "44001",
-	"Kent County, RI": "44003",
-	"Newport County, RI": "44005",
-	"Providence County, RI": "44007",
-	"Washington County, RI": "44009",
-	"Abbeville County, SC": "45001",
-	"Aiken County, SC": "45003",
-	"Allendale County, SC": "45005",
-	"Anderson County, SC": "45007",
-	"Bamberg County, SC": "45009",
-	"Barnwell County, SC": "45011",
-	"Beaufort County, SC": "45013",
-	"Berkeley County, SC": "45015",
-	"Calhoun County, SC": "45017",
-	"Charleston County, SC": "45019",
-	"Cherokee County, SC": "45021",
-	"Chester County, SC": "45023",
-	"Chesterfield County, SC": "45025",
-	"Clarendon County, SC": "45027",
-	"Colleton County, SC": "45029",
-	"Darlington County, SC": "45031",
-	"Dillon County, SC": "45033",
-	"Dorchester County, SC": "45035",
-	"Edgefield County, SC": "45037",
-	"Fairfield County, SC": "45039",
-	"Florence County, SC": "45041",
-	"Georgetown County, SC": "45043",
-	"Greenville County, SC": "45045",
-	"Greenwood County, SC": "45047",
-	"Hampton County, SC": "45049",
-	"Horry County, SC": "45051",
-	"Jasper County, SC": "45053",
-	"Kershaw County, SC": "45055",
-	"Lancaster County, SC": "45057",
-	"Laurens County, SC": "45059",
-	"Lee County, SC": "45061",
-	"Lexington County, SC": "45063",
-	"McCormick County, SC": "45065",
-	"Marion County, SC": "45067",
-	"Marlboro County, SC": "45069",
-	"Newberry County, SC": "45071",
-	"Oconee County, SC": "45073",
-	"Orangeburg County, SC": "45075",
-	"Pickens County, SC": "45077",
-	"Richland County, SC": "45079",
-	"Saluda County, SC": "45081",
-	"Spartanburg County, SC": "45083",
-	"Sumter County, SC": "45085",
-	"Union County, SC": "45087",
-	"Williamsburg County, SC": "45089",
-	"York County, SC": "45091",
-	"Aurora County, SD": "46003",
-	"Beadle County, SD": "46005",
-	"Bennett County, SD": "46007",
-	"Bon Homme County, SD": "46009",
-	"Brookings County, SD": "46011",
-	"Brown County, SD": "46013",
-	"Brule County, SD": "46015",
-	"Buffalo County, SD": "46017",
-	"Butte County, SD": "46019",
-	"Campbell County, SD": "46021",
-	"Charles Mix County, SD": "46023",
-	"Clark County, SD": "46025",
-	"Clay County, SD": "46027",
-	"Codington County, SD": "46029",
-	"Corson County, SD": "46031",
-	"Custer County, SD": "46033",
-	"Davison County, SD": "46035",
-	"Day County, SD": "46037",
-	"Deuel County, SD": "46039",
-	"Dewey County, SD": "46041",
-	"Douglas County, SD": "46043",
-	"Edmunds County, SD": "46045",
-	"Fall River County, SD": "46047",
-	"Faulk County, SD": "46049",
-	"Grant County, SD": "46051",
-	"Gregory County, SD": "46053",
-	"Haakon County, SD": "46055",
-	"Hamlin County, SD": "46057",
-	"Hand County, SD": "46059",
-	"Hanson County, SD": "46061",
-	"Harding County, SD": "46063",
-	"Hughes County, SD": "46065",
-	"Hutchinson County, SD": "46067",
-	"Hyde County, SD": "46069",
-	"Jackson County, SD": "46071",
-	"Jerauld County, SD": "46073",
-	"Jones County, SD": "46075",
-	"Kingsbury County, SD": "46077",
-	"Lake County, SD": "46079",
-	"Lawrence County, SD": "46081",
-	"Lincoln County, SD": "46083",
-	"Lyman County, SD": "46085",
-	"McCook County, SD": "46087",
-	"McPherson County, SD": "46089",
-	"Marshall County, SD": "46091",
-	"Meade County, SD": "46093",
-	"Mellette County, SD": "46095",
-	"Miner County, SD": "46097",
-	"Minnehaha County, SD": "46099",
-	"Moody County, SD": "46101",
-	"Pennington County, SD": "46103",
-	"Perkins County, SD": "46105",
-	"Potter County, SD": "46107",
-	"Roberts County, SD": "46109",
-	"Sanborn County, SD": "46111",
-	"Oglala Lakota County, SD": "46113",
-	"Spink County, SD": "46115",
-	"Stanley County, SD": "46117",
-	"Sully County, SD": "46119",
-	"Todd County, SD": "46121",
-	"Tripp County, SD": "46123",
-	"Turner County, SD": "46125",
-	"Union County, SD": "46127",
-	"Walworth County, SD": "46129",
-	"Yankton County, SD": "46135",
-	"Ziebach County, SD": "46137",
-	"Anderson County, TN": "47001",
-	"Bedford County, TN": "47003",
-	"Benton County, TN": "47005",
-	"Bledsoe County, TN": "47007",
-	"Blount County, TN": "47009",
-	"Bradley County, TN": "47011",
-	"Campbell County, TN": "47013",
-	"Cannon County, TN": "47015",
-	"Carroll County, TN": "47017",
-	"Carter County, TN": "47019",
-	"Cheatham County, TN": "47021",
-	"Chester County, TN": "47023",
-	"Claiborne County, TN": "47025",
-	"Clay County, TN": "47027",
-	"Cocke County, TN": "47029",
-	"Coffee County, TN": "47031",
-	"Crockett County, TN": "47033",
-	"Cumberland County, TN": "47035",
-	"Davidson County, TN": "47037",
-	"Decatur County, TN": "47039",
-	"DeKalb County, TN": "47041",
-	"Dickson County, TN": "47043",
-	"Dyer County, TN": "47045",
-	"Fayette County, TN": "47047",
-	"Fentress County, TN": "47049",
-	"Franklin County, TN": "47051",
-	"Gibson County, TN": "47053",
-	"Giles County, TN": "47055",
-	"Grainger County, TN": "47057",
-	"Greene County, TN": "47059",
-	"Grundy County, TN": "47061",
-	"Hamblen County, TN": "47063",
-	"Hamilton County, TN": "47065",
-	"Hancock County, TN": "47067",
-	"Hardeman County, TN": "47069",
-	"Hardin County, TN": "47071",
-	"Hawkins County, TN": "47073",
-	"Haywood County, TN": "47075",
-	"Henderson County, TN": "47077",
-	"Henry County, TN": "47079",
-	"Hickman County, TN": "47081",
-	"Houston County, TN": "47083",
-	"Humphreys County, TN": "47085",
-	"Jackson County, TN": "47087",
-	"Jefferson County, TN": "47089",
-	"Johnson County, TN": "47091",
-	"Knox County, TN": "47093",
-	"Lake County, TN": "47095",
-	"Lauderdale County, TN": "47097",
-	"Lawrence County, TN": "47099",
-	"Lewis County, TN": "47101",
-	"Lincoln County, TN": "47103",
-	"Loudon County, TN": "47105",
-	"McMinn County, TN": "47107",
-	"McNairy County, TN": "47109",
-	"Macon County, TN": "47111",
-	"Madison County, TN": "47113",
-	"Marion County, TN": "47115",
-	"Marshall County, TN": "47117",
-	"Maury County, TN": "47119",
-	"Meigs County, TN": "47121",
-	"Monroe County, TN": "47123",
-	"Montgomery County, TN": "47125",
-	"Moore County, TN": "47127",
-	"Morgan County, TN": "47129",
-	"Obion County, TN": "47131",
-	"Overton County, TN": "47133",
-	"Perry County, TN": "47135",
-	"Pickett County, TN": "47137",
-	"Polk County, TN": "47139",
-	"Putnam County, TN": "47141",
-	"Rhea County, TN": "47143",
-	"Roane County, TN": "47145",
-	"Robertson County, TN": "47147",
-	"Rutherford County, TN": "47149",
-	"Scott County, TN": "47151",
-	"Sequatchie County, TN": "47153",
-	"Sevier County, TN": "47155",
-	"Shelby County, TN": "47157",
-	"Smith County, TN": "47159",
-	"Stewart County, TN": "47161",
-	"Sullivan County, TN": "47163",
-	"Sumner County, TN": "47165",
-	"Tipton County, TN": "47167",
-	"Trousdale County, TN": "47169",
-	"Unicoi County, TN": "47171",
-	"Union County, TN": "47173",
-	"Van Buren County, TN": "47175",
-	"Warren County, TN": "47177",
-	"Washington County, TN": "47179",
-	"Wayne County, TN": "47181",
-	"Weakley County, TN": "47183",
-	"White County, TN": "47185",
-	"Williamson County, TN": "47187",
-	"Wilson County, TN": "47189",
-	"Anderson County, TX": "48001",
-	"Andrews County, TX": "48003",
-	"Angelina County, TX": "48005",
-	"Aransas County, TX": "48007",
-	"Archer County, TX": "48009",
-	"Armstrong County, TX": "48011",
-	"Atascosa County, TX": "48013",
-	"Austin County, TX": "48015",
-	"Bailey County, TX": "48017",
-	"Bandera County, TX": "48019",
-	"Bastrop County, TX": "48021",
-	"Baylor County, TX": "48023",
-	"Bee County, TX": "48025",
-	"Bell County, TX": "48027",
-	"Bexar County, TX": "48029",
-	"Blanco County, TX": "48031",
-	"Borden County, TX": "48033",
-	"Bosque County, TX": "48035",
-	"Bowie County, TX": "48037",
-	"Brazoria County, TX": "48039",
-	"Brazos County, TX": "48041",
-	"Brewster County, TX": "48043",
-	"Briscoe County, TX": "48045",
-	"Brooks County, TX": "48047",
-	"Brown County, TX": "48049",
-	"Burleson County, TX": "48051",
-	"Burnet County, TX": "48053",
-	"Caldwell County, TX": "48055",
-	"Calhoun County, TX": "48057",
-	"Callahan County, TX": "48059",
-	"Cameron County, TX": "48061",
-	"Camp County, TX": "48063",
-	"Carson County, TX": "48065",
-	"Cass County, TX": "48067",
-	"Castro County, TX": "48069",
-	"Chambers County, TX": "48071",
-	"Cherokee County, TX": "48073",
-	"Childress County, TX": "48075",
-	"Clay County, TX": "48077",
-	"Cochran County, TX": "48079",
-	"Coke County, TX": "48081",
-	"Coleman County, TX": "48083",
-	"Collin County, TX": "48085",
-	"Collingsworth County, TX": "48087",
-	"Colorado County, TX": "48089",
-	"Comal County, TX": "48091",
-	"Comanche County, TX": "48093",
-	"Concho County, TX": "48095",
-	"Cooke County, TX": "48097",
-	"Coryell County, TX": "48099",
-	"Cottle County, TX": "48101",
-	"Crane County, TX": "48103",
-	"Crockett County, TX": "48105",
-	"Crosby County, TX": "48107",
-	"Culberson County, TX": "48109",
-	"Dallam County, TX": "48111",
-	"Dallas County, TX": "48113",
-	"Dawson County, TX": "48115",
-	"Deaf Smith County, TX": "48117",
-	"Delta County, TX": "48119",
-	"Denton County, TX": "48121",
-	"DeWitt County, TX": "48123",
-	"Dickens County, TX": "48125",
-	"Dimmit County, TX": "48127",
-	"Donley County, TX": "48129",
-	"Duval County, TX": "48131",
-	"Eastland County, TX": "48133",
-	"Ector County, TX": "48135",
-	"Edwards County, TX": "48137",
-	"Ellis County, TX": "48139",
-	"El Paso County, TX": "48141",
-	"Erath County, TX": "48143",
-	"Falls County, TX": "48145",
-	"Fannin County, TX": "48147",
-	"Fayette County, TX": "48149",
-	"Fisher County, TX": "48151",
-	"Floyd County, TX": "48153",
-	"Foard County, TX": "48155",
-	"Fort Bend County, TX": "48157",
-	"Franklin County, TX": "48159",
-	"Freestone County, TX": "48161",
-	"Frio County, TX": "48163",
-	"Gaines County, TX": "48165",
-	"Galveston County, TX": "48167",
-	"Garza County, TX": "48169",
-	"Gillespie County, TX": "48171",
-	"Glasscock County, TX": "48173",
-	"Goliad County, TX": "48175",
-	"Gonzales County, TX": "48177",
-	"Gray County, TX": "48179",
-	"Grayson County, TX": "48181",
-	"Gregg County, TX": "48183",
-	"Grimes County, TX": "48185",
-	"Guadalupe County, TX": "48187",
-	"Hale County, TX": "48189",
-	"Hall County, TX": "48191",
-	"Hamilton County, TX": "48193",
-	"Hansford County, TX": "48195",
-	"Hardeman County, TX": "48197",
-	"Hardin County, TX": "48199",
-	"Harris County, TX": "48201",
-	"Harrison County, TX": "48203",
-	"Hartley County, TX": "48205",
-	"Haskell County, TX": "48207",
-	"Hays County, TX": "48209",
-	"Hemphill County, TX": "48211",
-	"Henderson County, TX": "48213",
-	"Hidalgo County, TX": "48215",
-	"Hill County, TX": "48217",
-	"Hockley County, TX": "48219",
-	"Hood County, TX": "48221",
-	"Hopkins County, TX": "48223",
-	"Houston County, TX": "48225",
-	"Howard County, TX": "48227",
-	"Hudspeth County, TX": "48229",
-	"Hunt County, TX": "48231",
-	"Hutchinson County, TX": "48233",
-	"Irion County, TX": "48235",
-	"Jack County, TX": "48237",
-	"Jackson County, TX": "48239",
-	"Jasper County, TX": "48241",
-	"Jeff Davis County, TX": "48243",
-	"Jefferson County, TX": "48245",
-	"Jim Hogg County, TX": "48247",
-	"Jim Wells County, TX": "48249",
-	"Johnson County, TX": "48251",
-	"Jones County, TX": "48253",
-	"Karnes County, TX": "48255",
-	"Kaufman County, TX": "48257",
-	"Kendall County, TX": "48259",
-	"Kenedy County, TX": "48261",
-	"Kent County, TX": "48263",
-	"Kerr County, TX": "48265",
-	"Kimble County, TX": "48267",
-	"King County, TX": "48269",
-	"Kinney County, TX": "48271",
-	"Kleberg County, TX": "48273",
-	"Knox County, TX": "48275",
-	"Lamar County, TX": "48277",
-	"Lamb County, TX": "48279",
-	"Lampasas County, TX": "48281",
-	"La Salle County, TX": "48283",
-	"Lavaca County, TX": "48285",
-	"Lee County, TX": "48287",
-	"Leon County, TX": "48289",
-	"Liberty County, TX": "48291",
-	"Limestone County, TX": "48293",
-	"Lipscomb County, TX": "48295",
-	"Live Oak County, TX": "48297",
-	"Llano County, TX": "48299",
-	"Loving County, TX": "48301",
-	"Lubbock County, TX": "48303",
-	"Lynn County, TX": "48305",
-	"McCulloch County, TX": "48307",
-	"McLennan County, TX": "48309",
-	"McMullen County, TX": "48311",
-	"Madison County, TX": "48313",
-	"Marion County, TX": "48315",
-	"Martin County, TX": "48317",
-	"Mason County, TX": "48319",
-	"Matagorda County, TX": "48321",
-	"Maverick County, TX": "48323",
-	"Medina County, TX": "48325",
-	"Menard County, TX": "48327",
-	"Midland County, TX": "48329",
-	"Milam County, TX": "48331",
-	"Mills County, TX": "48333",
-	"Mitchell County, TX": "48335",
-	"Montague County, TX": "48337",
-	"Montgomery County, TX": "48339",
-	"Moore County, TX": "48341",
-	"Morris County, TX": "48343",
-	"Motley County, TX": "48345",
-	"Nacogdoches County, TX": "48347",
-	"Navarro County, TX": "48349",
-	"Newton County, TX": "48351",
-	"Nolan County, TX": "48353",
-	"Nueces County, TX": "48355",
-	"Ochiltree County, TX": "48357",
-	"Oldham County, TX": "48359",
-	"Orange County, TX": "48361",
-	"Palo Pinto County, TX": "48363",
-	"Panola County, TX": "48365",
-	"Parker County, TX": "48367",
-	"Parmer County, TX": "48369",
-	"Pecos County, TX": "48371",
-	"Polk County, TX": "48373",
-	"Potter County, TX": "48375",
-	"Presidio County, TX": "48377",
-	"Rains County, TX": "48379",
-	"Randall County, TX": "48381",
-	"Reagan County, TX": "48383",
-	"Real County, TX": "48385",
-	"Red River County, TX": "48387",
-	"Reeves County, TX": "48389",
-	"Refugio County, TX": "48391",
-	"Roberts County, TX": "48393",
-	"Robertson County, TX": "48395",
-	"Rockwall County, TX": "48397",
-	"Runnels County, TX": "48399",
-	"Rusk County, TX": "48401",
-	"Sabine County, TX": "48403",
-	"San Augustine County, TX": "48405",
-	"San Jacinto County, TX": "48407",
-	"San Patricio County, TX": "48409",
-	"San Saba County, TX": "48411",
-	"Schleicher County, TX": "48413",
-	"Scurry County, TX": "48415",
-	"Shackelford County, TX": "48417",
-	"Shelby County, TX": "48419",
-	"Sherman County, TX": "48421",
-	"Smith County, TX": "48423",
-	"Somervell County, TX": "48425",
-	"Starr County, TX": "48427",
-	"Stephens County, TX": "48429",
-	"Sterling County, TX": "48431",
-	"Stonewall County, TX": "48433",
-	"Sutton County, TX": "48435",
-	"Swisher County, TX": "48437",
-	"Tarrant County, TX": "48439",
-	"Taylor County, TX": "48441",
-	"Terrell County, TX": "48443",
-	"Terry County, TX": "48445",
-	"Throckmorton County, TX": "48447",
-	"Titus County, TX": "48449",
-	"Tom Green County, TX": "48451",
-	"Travis County, TX": "48453",
-	"Trinity County, TX": "48455",
-	"Tyler County, TX": "48457",
-	"Upshur County, TX": "48459",
-	"Upton County, TX": "48461",
-	"Uvalde County, TX": "48463",
-	"Val Verde County, TX": "48465",
-	"Van Zandt County, TX": "48467",
-	"Victoria County, TX": "48469",
-	"Walker County, TX": "48471",
-	"Waller County, TX": "48473",
-	"Ward County, TX": "48475",
-	"Washington County, TX": "48477",
-	"Webb County, TX": "48479",
-	"Wharton County, TX": "48481",
-	"Wheeler County, TX": "48483",
-	"Wichita County, TX": "48485",
-	"Wilbarger County, TX": "48487",
-	"Willacy County, TX": "48489",
-	"Williamson County, TX": "48491",
-	"Wilson County, TX": "48493",
-	"Winkler County, TX": "48495",
-	"Wise County, TX": "48497",
-	"Wood County, TX": "48499",
-	"Yoakum County, TX": "48501",
-	"Young County, TX": "48503",
-	"Zapata County, TX": "48505",
-	"Zavala County, TX": "48507",
-	"Beaver County, UT": "49001",
-	"Box Elder County, UT": "49003",
-	"Cache County, UT": "49005",
-	"Carbon County, UT": "49007",
-	"Daggett County, UT": "49009",
-	"Davis County, UT": "49011",
-	"Duchesne County, UT": "49013",
-	"Emery County, UT": "49015",
-	"Garfield County, UT": "49017",
-	"Grand County, UT": "49019",
-	"Iron County, UT": "49021",
-	"Juab County, UT": "49023",
-	"Kane County, UT": "49025",
-	"Millard County, UT": "49027",
-	"Morgan County, UT": "49029",
-	"Piute County, UT": "49031",
-	"Rich County, UT": "49033",
-	"Salt Lake County, UT": "49035",
-	"San Juan County, UT": "49037",
-	"Sanpete County, UT": "49039",
-	"Sevier County, UT": "49041",
-	"Summit County, UT": "49043",
-	"Tooele County, UT": "49045",
-	"Uintah County, UT": "49047",
-	"Utah County, UT": "49049",
-	"Wasatch County, UT": "49051",
-	"Washington County, UT": "49053",
-	"Wayne County, UT": "49055",
-	"Weber County, UT": "49057",
-	"Addison County, VT": "50001",
-	"Bennington County, VT": "50003",
-	"Caledonia County, VT": "50005",
-	"Chittenden County, VT": "50007",
-	"Essex County, VT": "50009",
-	"Franklin County, VT": "50011",
-	"Grand Isle County, VT": "50013",
-	"Lamoille County, VT": "50015",
-	"Orange County, VT": "50017",
-	"Orleans County, VT": "50019",
-	"Rutland County, VT": "50021",
-	"Washington County, VT": "50023",
-	"Windham County, VT": "50025",
-	"Windsor County, VT": "50027",
-	"Accomack County, VA": "51001",
-	"Albemarle County, VA": "51003",
-	"Alleghany County, VA": "51005",
-	"Amelia County, VA": "51007",
-	"Amherst County, VA": "51009",
-	"Appomattox County, VA": "51011",
-	"Arlington County, VA": "51013",
-	"Augusta County, VA": "51015",
-	"Bath County, VA": "51017",
-	"Bedford County, VA": "51019",
-	"Bland County, VA": "51021",
-	"Botetourt County, VA": "51023",
-	"Brunswick County, VA": "51025",
-	"Buchanan County, VA": "51027",
-	"Buckingham County, VA": "51029",
-	"Campbell County, VA": "51031",
-	"Caroline County, VA": "51033",
-	"Carroll County, VA": "51035",
-	"Charles City County, VA": "51036",
-	"Charlotte County, VA": "51037",
-	"Chesterfield County, VA": "51041",
-	"Clarke County, VA": "51043",
-	"Craig County, VA": "51045",
-	"Culpeper County, VA": "51047",
-	"Cumberland County, VA": "51049",
-	"Dickenson County, VA": "51051",
-	"Dinwiddie County, VA": "51053",
-	"Essex County, VA": "51057",
-	"Fairfax County, VA": "51059",
-	"Fauquier County, VA": "51061",
-	"Floyd County, VA": "51063",
-	"Fluvanna County, VA": "51065",
-	"Franklin County, VA": "51067",
-	"Frederick County, VA": "51069",
-	"Giles County, VA": "51071",
-	"Gloucester County, VA": "51073",
-	"Goochland County, VA": "51075",
-	"Grayson County, VA": "51077",
-	"Greene County, VA": "51079",
-	"Greensville County, VA": "51081",
-	"Halifax County, VA": "51083",
-	"Hanover County, VA": "51085",
-	"Henrico County, VA": "51087",
-	"Henry County, VA": "51089",
-	"Highland County, VA": "51091",
-	"Isle of Wight County, VA": "51093",
-	"James City County, VA": "51095",
-	"King and Queen County, VA": "51097",
-	"King George County, VA": "51099",
-	"King William County, VA": "51101",
-	"Lancaster County, VA": "51103",
-	"Lee County, VA": "51105",
-	"Loudoun County, VA": "51107",
-	"Louisa County, VA": "51109",
-	"Lunenburg County, VA": "51111",
-	"Madison County, VA": "51113",
-	"Mathews County, VA": "51115",
-	"Mecklenburg County, VA": "51117",
-	"Middlesex County, VA": "51119",
-	"Montgomery County, VA": "51121",
-	"Nelson County, VA": "51125",
-	"New Kent County, VA": "51127",
-	"Northampton County, VA": "51131",
-	"Northumberland County, VA": "51133",
-	"Nottoway County, VA": "51135",
-	"Orange County, VA": "51137",
-	"Page County, VA": "51139",
-	"Patrick County, VA": "51141",
-	"Pittsylvania County, VA": "51143",
-	"Powhatan County, VA": "51145",
-	"Prince Edward County, VA": "51147",
-	"Prince George County, VA": "51149",
-	"Prince William County, VA": "51153",
-	"Pulaski County, VA": "51155",
-	"Rappahannock County, VA": "51157",
-	"Richmond County, VA": "51159",
-	"Roanoke County, VA": "51161",
-	"Rockbridge County, VA": "51163",
-	"Rockingham County, VA": "51165",
-	"Russell County, VA": "51167",
-	"Scott County, VA": "51169",
-	"Shenandoah County, VA": "51171",
-	"Smyth County, VA": "51173",
-	"Southampton County, VA": "51175",
-	"Spotsylvania County, VA": "51177",
-	"Stafford County, VA": "51179",
-	"Surry County, VA": "51181",
-	"Sussex County, VA": "51183",
-	"Tazewell County, VA": "51185",
-	"Warren County, VA": "51187",
-	"Washington County, VA": "51191",
-	"Westmoreland County, VA": "51193",
-	"Wise County, VA": "51195",
-	"Wythe County, VA": "51197",
-	"York County, VA": "51199",
-	"Alexandria city, VA": "51510",
-	"Bedford city, VA": "51515",
-	"Bristol city, VA": "51520",
-	"Buena Vista city, VA": "51530",
-	"Charlottesville city, VA": "51540",
-	"Chesapeake city, VA": "51550",
-	"Colonial Heights city, VA": "51570",
-	"Covington city, VA": "51580",
-	"Danville city, VA": "51590",
-	"Emporia city, VA": "51595",
-	"Fairfax city, VA": "51600",
-	"Falls Church city, VA": "51610",
-	"Franklin city, VA": "51620",
-	"Fredericksburg city, VA": "51630",
-	"Galax city, VA": "51640",
-	"Hampton city, VA": "51650",
-	"Harrisonburg city, VA": "51660",
-	"Hopewell city, VA": "51670",
-	"Lexington city, VA": "51678",
-	"Lynchburg city, VA": "51680",
-	"Manassas city, VA": "51683",
-	"Manassas Park city, VA": "51685",
-	"Martinsville city, VA": "51690",
-	"Newport News city, VA": "51700",
-	"Norfolk city, VA": "51710",
-	"Norton city, VA": "51720",
-	"Petersburg city, VA": "51730",
-	"Poquoson city, VA": "51735",
-	"Portsmouth city, VA": "51740",
-	"Radford city, VA": "51750",
-	"Richmond city, VA": "51760",
-	"Roanoke city, VA": "51770",
-	"Salem city, VA": "51775",
-	"Staunton city, VA": "51790",
-	"Suffolk city, VA": "51800",
-	"Virginia Beach city, VA": "51810",
-	"Waynesboro city, VA": "51820",
-	"Williamsburg city, VA": "51830",
-	"Winchester city, VA": "51840",
-	"Adams County, WA": "53001",
-	"Asotin County, WA": "53003",
-	"Benton County, WA": "53005",
-	"Chelan County, WA": "53007",
-	"Clallam County, WA": "53009",
-	"Clark County, WA": "53011",
-	"Columbia County, WA": "53013",
-	"Cowlitz County, WA": "53015",
-	"Douglas County, WA": "53017",
-	"Ferry County, WA": "53019",
-	"Franklin County, WA": "53021",
-	"Garfield County, WA": "53023",
-	"Grant County, WA": "53025",
-	"Grays Harbor County, WA": "53027",
-	"Island County, WA": "53029",
-	"Jefferson County, WA": "53031",
-	"King County, WA": "53033",
-	"Kitsap County, WA": "53035",
-	"Kittitas County, WA": "53037",
-	"Klickitat County, WA": "53039",
-	"Lewis County, WA": "53041",
-	"Lincoln County, WA": "53043",
-	"Mason County, WA": "53045",
-	"Okanogan County, WA": "53047",
-	"Pacific County, WA": "53049",
-	"Pend Oreille County, WA": "53051",
-	"Pierce County, WA": "53053",
-	"San Juan County, WA": "53055",
-	"Skagit County, WA": "53057",
-	"Skamania County, WA": "53059",
-	"Snohomish County, WA": "53061",
-	"Spokane County, WA": "53063",
-	"Stevens County, WA": "53065",
-	"Thurston County, WA": "53067",
-	"Wahkiakum County, WA": "53069",
-	"Walla Walla County, WA": "53071",
-	"Whatcom County, WA": "53073",
-	"Whitman County, WA": "53075",
-	"Yakima County, WA": "53077",
-	"Barbour County, WV": "54001",
-	"Berkeley County, WV": "54003",
-	"Boone County, WV": "54005",
-	"Braxton County, WV": "54007",
-	"Brooke County, WV": "54009",
-	"Cabell County, WV": "54011",
-	"Calhoun County, WV": "54013",
-	"Clay County, WV": "54015",
-	"Doddridge County, WV": "54017",
-	"Fayette County, WV": "54019",
-	"Gilmer County, WV": "54021",
-	"Grant County, WV": "54023",
-	"Greenbrier County, WV": "54025",
-	"Hampshire County, WV": "54027",
-	"Hancock County, WV": "54029",
-	"Hardy County, WV": "54031",
-	"Harrison County, WV": "54033",
-	"Jackson County, WV": "54035",
-	"Jefferson County, WV": "54037",
-	"Kanawha County, WV": "54039",
-	"Lewis County, WV": "54041",
-	"Lincoln County, WV": "54043",
-	"Logan County, WV": "54045",
-	"McDowell County, WV": "54047",
-	"Marion County, WV": "54049",
-	"Marshall County, WV": "54051",
-	"Mason County, WV": "54053",
-	"Mercer County, WV": "54055",
-	"Mineral County, WV": "54057",
-	"Mingo County, WV": "54059",
-	"Monongalia County, WV": "54061",
-	"Monroe County, WV": "54063",
-	"Morgan County, WV": "54065",
-	"Nicholas County, WV": "54067",
-	"Ohio County, WV": "54069",
-	"Pendleton County, WV": "54071",
-	"Pleasants County, WV": "54073",
-	"Pocahontas County, WV": "54075",
-	"Preston County, WV": "54077",
-	"Putnam County, WV": "54079",
-	"Raleigh County, WV": "54081",
-	"Randolph County, WV": "54083",
-	"Ritchie County, WV": "54085",
-	"Roane County, WV": "54087",
-	"Summers County, WV": "54089",
-	"Taylor County, WV": "54091",
-	"Tucker County, WV": "54093",
-	"Tyler County, WV": "54095",
-	"Upshur County, WV": "54097",
-	"Wayne County, WV": "54099",
-	"Webster County, WV": "54101",
-	"Wetzel County, WV": "54103",
-	"Wirt County, WV": "54105",
-	"Wood County, WV": "54107",
-	"Wyoming County, WV": "54109",
-	"Adams County, WI": "55001",
-	"Ashland County, WI": "55003",
-	"Barron County, WI": "55005",
-	"Bayfield County, WI": "55007",
-	"Brown County, WI": "55009",
-	"Buffalo County, WI": "55011",
-	"Burnett County, WI": "55013",
-	"Calumet County, WI": "55015",
-	"Chippewa County, WI": "55017",
-	"Clark County, WI": "55019",
-	"Columbia County, WI": "55021",
-	"Crawford County, WI": "55023",
-	"Dane County, WI": "55025",
-	"Dodge County, WI": "55027",
-	"Door County, WI": "55029",
-	"Douglas County, WI": "55031",
-	"Dunn County, WI": "55033",
-	"Eau Claire County, WI": "55035",
-	"Florence County, WI": "55037",
-	"Fond du Lac County, WI": "55039",
-	"Forest County, WI": "55041",
-	"Grant County, WI": "55043",
-	"Green County, WI": "55045",
-	"Green Lake County, WI": "55047",
-	"Iowa County, WI": "55049",
-	"Iron County, WI": "55051",
-	"Jackson County, WI": "55053",
-	"Jefferson County, WI": "55055",
-	"Juneau County, WI": "55057",
-	"Kenosha County, WI": "55059",
-	"Kewaunee County, WI": "55061",
-	"La Crosse County, WI": "55063",
-	"Lafayette County, WI": "55065",
-	"Langlade County, WI": "55067",
-	"Lincoln County, WI": "55069",
-	"Manitowoc County, WI": "55071",
-	"Marathon County, WI": "55073",
-	"Marinette County, WI": "55075",
-	"Marquette County, WI": "55077",
-	"Menominee County, WI": "55078",
-	"Milwaukee County, WI": "55079",
-	"Monroe County, WI": "55081",
-	"Oconto County, WI": "55083",
-	"Oneida County, WI": "55085",
-	"Outagamie County, WI": "55087",
-	"Ozaukee County, WI": "55089",
-	"Pepin County, WI": "55091",
-	"Pierce County, WI": "55093",
-	"Polk County, WI": "55095",
-	"Portage County, WI": "55097",
-	"Price County, WI": "55099",
-	"Racine County, WI": "55101",
-	"Richland County, WI": "55103",
-	"Rock County, WI": "55105",
-	"Rusk County, WI": "55107",
-	"St. Croix County, WI": "55109",
-	"Sauk County, WI": "55111",
-	"Sawyer County, WI": "55113",
-	"Shawano County, WI": "55115",
-	"Sheboygan County, WI": "55117",
-	"Taylor County, WI": "55119",
-	"Trempealeau County, WI": "55121",
-	"Vernon County, WI": "55123",
-	"Vilas County, WI": "55125",
-	"Walworth County, WI": "55127",
-	"Washburn County, WI": "55129",
-	"Washington County, WI": "55131",
-	"Waukesha County, WI": "55133",
-	"Waupaca County, WI": "55135",
-	"Waushara County, WI": "55137",
-	"Winnebago County, WI": "55139",
-	"Wood County, WI": "55141",
-	"Albany County, WY": "56001",
-	"Big Horn County, WY": "56003",
-	"Campbell County, WY": "56005",
-	"Carbon County, WY": "56007",
-	"Converse County, WY": "56009",
-	"Crook County, WY": "56011",
-	"Fremont County, WY": "56013",
-	"Goshen County, WY": "56015",
-	"Hot Springs County, WY": "56017",
-	"Johnson County, WY": "56019",
-	"Laramie County, WY": "56021",
-	"Lincoln County, WY": "56023",
-	"Natrona County, WY": "56025",
-	"Niobrara County, WY": "56027",
-	"Park County, WY": "56029",
-	"Platte County, WY": "56031",
-	"Sheridan County, WY": "56033",
-	"Sublette County, WY": "56035",
-	"Sweetwater County, WY": "56037",
-	"Teton County, WY": "56039",
-	"Uinta County, WY": "56041",
-	"Washakie County, WY": "56043",
-	"Weston County, WY": "56045",
-	"Adjuntas Municipio, PR": "72001",
-	"Aguada Municipio, PR": "72003",
-	"Aguadilla Municipio, PR": "72005",
-	"Aguas Buenas Municipio, PR": "72007",
-	"Aibonito Municipio, PR": "72009",
-	"Añasco Municipio, PR": "72011",
-	"Arecibo Municipio, PR": "72013",
-	"Arroyo Municipio, PR": "72015",
-	"Barceloneta Municipio, PR": "72017",
-	"Barranquitas Municipio, PR": "72019",
-	"Bayamón Municipio, PR": "72021",
-	"Cabo Rojo Municipio, PR": "72023",
-	"Caguas Municipio, PR": "72025",
-	"Camuy Municipio, PR": "72027",
-	"Canóvanas Municipio, PR": "72029",
-	"Carolina Municipio, PR": "72031",
-	"Cataño Municipio, PR": "72033",
-	"Cayey Municipio, PR": "72035",
-	"Ceiba Municipio, PR": "72037",
-	"Ciales Municipio, PR": "72039",
-	"Cidra Municipio, PR": "72041",
-	"Coamo Municipio, PR": "72043",
-	"Comerío Municipio, PR": "72045",
-	"Corozal Municipio, PR": "72047",
-	"Culebra Municipio, PR": "72049",
-	"Dorado Municipio, PR": "72051",
-	"Fajardo Municipio, PR": "72053",
-	"Florida Municipio, PR": "72054",
-	"Guánica Municipio, PR": "72055",
-	"Guayama Municipio, PR": "72057",
-	"Guayanilla Municipio, PR": "72059",
-	"Guaynabo Municipio, PR": "72061",
-	"Gurabo Municipio, PR": "72063",
-	"Hatillo Municipio, PR": "72065",
-	"Hormigueros Municipio, PR": "72067",
-	"Humacao Municipio, PR": "72069",
-	"Isabela Municipio, PR": "72071",
-	"Jayuya Municipio, PR": "72073",
-	"Juana Díaz Municipio, PR": "72075",
-	"Juncos Municipio, PR": "72077",
-	"Lajas Municipio, PR": "72079",
-	"Lares Municipio, PR": "72081",
-	"Las Marías Municipio, PR": "72083",
-	"Las Piedras Municipio, PR": "72085",
-	"Loíza Municipio, PR": "72087",
-	"Luquillo Municipio, PR": "72089",
-	"Manatí Municipio, PR": "72091",
-	"Maricao Municipio, PR": "72093",
-	"Maunabo Municipio, PR": "72095",
-	"Mayagüez Municipio, PR": "72097",
-	"Moca Municipio, PR": "72099",
-	"Morovis Municipio, PR": "72101",
-	"Naguabo Municipio, PR": "72103",
-	"Naranjito Municipio, PR": "72105",
-	"Orocovis Municipio, PR": "72107",
-	"Patillas Municipio, PR": "72109",
-	"Peñuelas Municipio, PR": "72111",
-	"Ponce Municipio, PR": "72113",
-	"Quebradillas Municipio, PR": "72115",
-	"Rincón Municipio, PR": "72117",
-	"Río Grande Municipio, PR": "72119",
-	"Sabana Grande Municipio, PR": "72121",
-	"Salinas Municipio, PR": "72123",
-	"San Germán Municipio, PR": "72125",
-	"San Juan Municipio, PR": "72127",
-	"San Lorenzo Municipio, PR": "72129",
-	"San Sebastián Municipio, PR": "72131",
-	"Santa Isabel Municipio, PR": "72133",
-	"Toa Alta Municipio, PR": "72135",
-	"Toa Baja Municipio, PR": "72137",
-	"Trujillo Alto Municipio, PR": "72139",
-	"Utuado Municipio, PR": "72141",
-	"Vega Alta Municipio, PR": "72143",
-	"Vega Baja Municipio, PR": "72145",
-	"Vieques Municipio, PR": "72147",
-	"Villalba Municipio, PR": "72149",
-	"Yabucoa Municipio, PR": "72151",
-	"Yauco Municipio, PR": "72153",
-	"Eastern District, AS": "60010",
-	"Manu'a District, AS": "60020",
-	"Rose Island, AS": "60030",
-	"Swains Island, AS": "60040",
-	"Western District, AS": "60050",
-	"Guam, GU": "66010",
-	"Northern Islands Municipality, MP": "69085",
-	"Rota Municipality, MP": "69100",
-	"Saipan Municipality, MP": "69110",
-	"Tinian Municipality, MP": "69120",
-	"St. Croix Island, VI": "78010",
-	"St. John Island, VI": "78020",
-	"St. Thomas Island, VI": "78030",
-}
-
-abbrev_to_name = dict(map(reversed, name_to_abbrev.items()))
\ No newline at end of file
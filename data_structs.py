@@ -1,5 +1,15 @@
 import csv
-from typing import Iterator, Callable
+import mmap
+import os
+import struct
+import threading
+from array import array
+from collections.abc import Mapping
+from hashlib import blake2b
+from itertools import compress
+from operator import add
+from random import Random
+from typing import Iterable, Iterator, Callable, Sequence
 
 # --- Globals ----------------------------------------------------------------------------------------------------------
 
@@ -7,55 +17,169 @@ scales = ["states", "counties"]
 
 _unitlists: dict[str, list["Unit"]] = {}
 _metricNames: dict[str, list[str]] = {}
+_metrics: dict[str, array] = {}
+_unitCounts: dict[str, int] = {}
+_bundles: dict[str, "Bundle"] = {}
+# Units are shared by every State of their scale, so solves in different threads must never load two copies of them
+_loading = threading.Lock()
 
 
-def unitlist(scale: str) -> list:
+def load(scale: str) -> None:
     global _unitlists, _metricNames
+    with _loading:
+        if any(scale not in cache for cache in (_unitlists, _metricNames, _metrics)):
+            registerScale(scale, *Bundle.load(scale).read(scale))
+
+
+def unitlist(scale: str) -> list:
+    global _unitlists
     try:
         return _unitlists[scale]
     except:
-        _unitlists[scale], _metricNames[scale] = readFile(scale)
+        load(scale)
         return _unitlists[scale]
 
 
+def isLoaded(scale: str) -> bool:
+    return scale in _unitlists
+
+
 def metricNames(scale: str) -> list[str]:
-    global _unitlists, _metricNames
+    # Only needs the header of the scale's data, so listing metrics never loads the graph
+    global _metricNames, _unitCounts
     try:
         return _metricNames[scale]
     except:
-        _unitlists[scale], _metricNames[scale] = readFile(scale)
+        _metricNames[scale], _unitCounts[scale] = readHeader(scale)
         return _metricNames[scale]
 
 
-_converters: dict[str, dict[str, str]] = {}
+def unitCount(scale: str) -> int:
+    global _metricNames, _unitCounts
+    if scale in _unitlists:
+        return len(_unitlists[scale])
+    try:
+        return _unitCounts[scale]
+    except:
+        _metricNames[scale], _unitCounts[scale] = readHeader(scale)
+        return _unitCounts[scale]
+
+
+def metricColumn(scale: str, metricID: str) -> array:
+    # Every unit's value for one metric, in unitlist order: a slice of the scale's metric table
+    count = len(unitlist(scale))
+    start = metricNames(scale).index(metricID) * count
+    return _metrics[scale][start : start + count]
+
 
+def metricValues(scale: str, metricID: str) -> Sequence[float]:
+    # Every unit's value for one metric, in no particular order. Only reads that one column if the scale isn't loaded
+    return metricColumn(scale, metricID) if isLoaded(scale) else readColumn(scale, metricNames(scale).index(metricID))
 
-def abbrev_to_name(scale: str) -> dict[str, str]:
-    global _converters
+
+def registerScale(scale: str, units: list["Unit"], names: list[str], metrics: array) -> None:
+    # Make a generated unit graph (e.g. a coarsened one) solvable by name, just like the scales on disk. Metrics are one
+    # column per name, one after the other, each in the same order as the units. Each unit's index is its position in
+    # the list
+    global _unitlists, _metricNames, _metrics
+    for i, unit in enumerate(units):
+        unit.index = i
+    _unitlists[scale] = units
+    _metricNames[scale] = names
+    _metrics[scale] = metrics
+
+
+def unregisterScale(scale: str) -> None:
+    # Forget everything cached for a generated scale, so solving many of them doesn't keep each one alive
+    global _unitlists, _metricNames, _metrics, _unitCounts, _names, _distanceRows
+    _unitlists.pop(scale, None)
+    _metricNames.pop(scale, None)
+    _metrics.pop(scale, None)
+    _unitCounts.pop(scale, None)
+    _names.pop(scale, None)
+    _distanceRows.pop(scale, None)
+
+
+_names: dict[str, dict[str, str]] = {}
+
+
+def unitNames(scale: str) -> dict[str, str]:
+    # Display names by code. Nothing a solve does needs them, so they're only read the first time one is asked for
+    global _names
     try:
-        return _converters[scale]
+        return _names[scale]
     except:
-        _converters[scale] = __import__(
-            f"assets.{scale}.name_to_abbrev", globals(), locals(), ["abbrev_to_name"]
-        ).abbrev_to_name
-        return _converters[scale]
+        if scale in _bundles:
+            lines = bytes(_bundles[scale]["names"]).decode().splitlines()
+        else:
+            with open(f"assets/{scale}/names.tsv", encoding="utf8", newline="") as file:
+                lines = file.read().splitlines()
+        reader = csv.reader(lines, delimiter="\t")
+        next(reader)
+        _names[scale] = dict(reader)
+        return _names[scale]
+
+
+_distanceRows: dict[str, list[Sequence[int]]] = {}
+
+
+def distanceTotals(scale: str, units: Iterable["Unit"]) -> dict["Unit", int]:
+    # Every unit's total distance to the given units, found by adding up rows of the distance matrix rather than
+    # walking each unit's distance dict. Scales without a bundle have their rows built the first time, and kept
+    global _distanceRows
+    order = unitlist(scale)
+    try:
+        rows = _distanceRows[scale]
+    except:
+        if scale in _bundles:
+            rows = [_bundles[scale].row(i) for i in range(len(order))]
+        else:
+            rows = [array("H", (unit.distances.get(other, 0) for other in order)) for unit in order]
+        _distanceRows[scale] = rows
+
+    totals = [0] * len(order)
+    for unit in units:
+        totals = list(map(add, totals, rows[unit.index]))
+    return {unit: total for unit, total in zip(order, totals) if total}
+
+
+_zobristKeys: dict[tuple[str, int], int] = {}
+
+
+def zobrist(unit: "Unit", index: int) -> int:
+    # A fixed pseudo-random key per (unit, group) pair - XORing together the keys of every placement hashes the whole
+    # plan. Keys come from the code itself, so hashes agree between runs and processes
+    global _zobristKeys
+    try:
+        return _zobristKeys[(unit.code, index)]
+    except:
+        digest = blake2b(f"{unit.code}:{index}".encode(), digest_size=8).digest()
+        _zobristKeys[(unit.code, index)] = key = int.from_bytes(digest, "little")
+        return key
 
 
 # --- Data structures --------------------------------------------------------------------------------------------------
 
 
 class Unit:
-    def __init__(self, code: str, metrics: dict[str, float], scale: str):
+    def __init__(self, code: str, scale: str, name: str | None = None):
         self.code = code
-        self.metrics = metrics
+        self.scale = scale
+        self._name = name
         self.adj = set[Unit]()
-        self.name = abbrev_to_name(scale)[code]
         self.hash = hash(code)
-        self.distances = dict[Unit, int]()
-        self.metric = metrics[next(iter(metrics))]
+        self.distances: Mapping[Unit, int] = dict[Unit, int]()
+        # Position in the scale's unitlist, set when the scale is registered. Metrics live in the scale's table, so
+        # Units shared between States never hold on to which one is being solved for
+        self.index = 0
+        # Which connected piece of the map the unit is in
+        self.component = 0
 
-    def setCurrentMetric(self, metricID: str) -> None:
-        self.metric = self.metrics[metricID]
+    @property
+    def name(self) -> str:
+        if self._name is None:
+            self._name = unitNames(self.scale)[self.code]
+        return self._name
 
     def __str__(self) -> str:
         return self.code
@@ -70,23 +194,66 @@ class Unit:
         return self.hash
 
 
+class Distances(Mapping):
+    # A unit's distances as a read-only view of its row in a bundle's distance matrix, so a loaded scale is never copied
+    # into dicts and processes forked after loading share the same pages. Like the dicts it stands in for, it leaves out
+    # the unit itself and units in other pieces of the map
+    def __init__(self, units: list[Unit], row: Sequence[int]):
+        self.units = units
+        self.row = row
+        self.count: int | None = None
+
+    def __getitem__(self, unit: Unit) -> int:
+        if not (dist := self.row[unit.index]):
+            raise KeyError(unit)
+        return dist
+
+    def get(self, unit: Unit, default=None):
+        return self.row[unit.index] or default
+
+    def __contains__(self, unit: Unit) -> bool:
+        return self.row[unit.index] != 0
+
+    def __iter__(self) -> Iterator[Unit]:
+        return compress(self.units, self.row)
+
+    def __len__(self) -> int:
+        if self.count is None:
+            self.count = len(self.row) - self.row.tolist().count(0)
+        return self.count
+
+    def items(self) -> Iterator[tuple[Unit, int]]:
+        return zip(compress(self.units, self.row), filter(None, self.row))
+
+
 class Group:
-    def __init__(self, index: int) -> None:
+    def __init__(self, index: int, unitMetrics: Sequence[float]) -> None:
         self.units = set[Unit]()
         self.adj = set[Unit]()
         self.metric = 0
         self.index = index
         self.distanceSum = {}
+        # The metric of every unit in the scale, by unit index - shared with the State the group belongs to
+        self.unitMetrics = unitMetrics
 
     def __gt__(self, other: "Group") -> bool:
         return self.metric > other.metric
 
+    def copy(self) -> "Group":
+        group = Group(self.index, self.unitMetrics)
+        group.units = set(self.units)
+        group.adj = set(self.adj)
+        group.metric = self.metric
+        group.distanceSum = dict(self.distanceSum)
+        return group
+
     @property
     def empty(self) -> bool:
         return len(self.units) == 0
 
     @property
-    def isContiguous(self) -> bool:
+    def zones(self) -> list[set[Unit]]:
+        # Split the group into its connected pieces
         units = set(self.units)
         zones = []
         while units:
@@ -100,19 +267,20 @@ class Group:
                 toCheck = ((next.adj & self.units) - zone) | toCheck
             zones.append(zone)
 
-        def firstOf(zone: int) -> Unit:
-            return list(zones[zone])[0]
+        return zones
 
-        return all(
-            all(firstOf(i) not in firstOf(j).distances for j in range(i + 1, len(zones))) for i in range(len(zones))
-        )
+    @property
+    def isContiguous(self) -> bool:
+        # Contiguous as long as no two pieces of the group are in the same piece of the map
+        zones = self.zones
+        return len({next(iter(zone)).component for zone in zones}) == len(zones)
 
     # TODO: hyper-optimize this. Fully half of our time is spent in this one method
     def addUnit(self, unit: Unit):
         # append the unit into this group
         self.units.add(unit)
         # add the unit's metric to the group's metric
-        self.metric += unit.metric
+        self.metric += self.unitMetrics[unit.index]
         # remove this unit from the adjacency list
         self.adj.discard(unit)
         # for each adjacent unit, add it to the adjacency list if it's not already in the group
@@ -121,11 +289,25 @@ class Group:
             if dist != 0:
                 self.distanceSum[u] = dist + self.distanceSum.get(u, 0)
 
+    def addUnits(self, units: Iterable[Unit], distanceSum: dict[Unit, int] | None = None):
+        # Bulk version of addUnit: the adjacency is settled once at the end rather than after every unit. An empty group
+        # can be handed its distance sums ready-made
+        units = [unit for unit in units if unit not in self.units]
+        if distanceSum is not None and self.empty:
+            self.distanceSum = distanceSum
+        else:
+            for unit in units:
+                for u, dist in unit.distances.items():
+                    self.distanceSum[u] = dist + self.distanceSum.get(u, 0)
+        self.units.update(units)
+        self.metric += sum(self.unitMetrics[unit.index] for unit in units)
+        self.adj = self.adj.union(*(unit.adj for unit in units)) - self.units
+
     def removeUnit(self, unit: Unit):
         # remove the unit from this group
         self.units.remove(unit)
         # remove the unit's metric from the group's metric
-        self.metric -= unit.metric
+        self.metric -= self.unitMetrics[unit.index]
         # if this unit is adjacent to the group, add it to the adjacency list
         if any(adjunit in self.units for adjunit in unit.adj):
             self.adj.add(unit)
@@ -140,7 +322,12 @@ class Group:
                 self.distanceSum[u] -= dist
 
     def canLose(self, unit: Unit) -> bool:
-        border = unit.adj & self.units
+        return Group.connectedWithout(self.units, unit)
+
+    @staticmethod
+    def connectedWithout(units: set[Unit], unit: Unit) -> bool:
+        # Check whether the units adjacent to this one can still reach each other once it's gone
+        border = unit.adj & units
         if not border:
             return True
         toCheck = {border.pop()}
@@ -154,6 +341,9 @@ class Group:
 
 
 class State:
+    # How far from the average a group may be, as a fraction of it
+    tolerance = 0.05
+
     @staticmethod
     def parseScale(scale: str | int) -> str:
         # Enable MetricID to be set as a string or an index
@@ -182,28 +372,115 @@ class State:
 
         self._callback = callback
 
-        for unit in unitlist(self.scale):
-            unit.setCurrentMetric(self.metricID)
+        # This state's own copy of the metric being solved for, by unit index, so States never interfere
+        self.unitMetrics = metricColumn(self.scale, self.metricID)
 
         self.placements = {unit: 0 for unit in unitlist(self.scale)}
         self.unplacedUnits = set(unitlist(self.scale))
-        self.groups = [Group(i + 1) for i in range(numGroup)]
-
-        unitMetrics = [unit.metric for unit in unitlist(self.scale)]
-        self.sumUnitMetrics = sum(unitMetrics)
+        self.groups = [Group(i + 1, self.unitMetrics) for i in range(numGroup)]
+        self.placementHash = 0
+        self._owned = set(range(1, numGroup + 1))
+        self.journal: list[tuple[Unit, int]] | None = None
+        self.locked = frozenset[Unit]()
+        self.lockedGroups = frozenset[int]()
+
+        self.sumUnitMetrics = sum(self.unitMetrics)
         self.avgGroupMetric = self.sumUnitMetrics / numGroup
-        self.deviation = self.avgGroupMetric * 0.05
+        self.deviation = self.avgGroupMetric * State.tolerance
+
+    def placeAll(self, placements: dict[str, int]):
+        # Place a whole plan at once, keyed by unit or code, building each group's aggregates in one pass. Units that
+        # are already placed, or whose group doesn't exist, are left as they are
+        members: list[list[Unit]] = [[] for _ in self.groups]
+        for unit in unitlist(self.scale):
+            if self.placements[unit] == 0 and 0 < (index := placements.get(unit, 0)) <= len(self.groups):
+                members[index - 1].append(unit)
+
+        for group, units in zip(list(self.groups), members):
+            self._own(group.index).addUnits(units, distanceTotals(self.scale, units) if group.empty else None)
+            for unit in units:
+                self.placements[unit] = group.index
+                self.unplacedUnits.remove(unit)
+                self.placementHash ^= zobrist(unit, group.index)
+                if self._callback:
+                    self._callback(unit.code, group.index)
+
+    def lock(self, units: Iterable[Unit | str] = (), groups: Iterable[int] = ()):
+        # Fix placed units where they are, by unit or code: the solver won't move them, but they still count towards
+        # their groups. Locking a group locks every unit in it and keeps new units out of it too
+        self.lockedGroups |= frozenset(groups)
+        wanted = set(units)
+        self.locked |= frozenset(
+            unit
+            for unit, placement in self.placements.items()
+            if placement != 0 and (unit in wanted or placement in self.lockedGroups)
+        )
+
+    def fork(self) -> "State":
+        # A copy that can be changed independently. Groups are shared until one side changes them, since copying their
+        # distance sums is what makes a full copy expensive. Either side may swap in a fresh Group on its next change,
+        # so look groups up by index rather than holding on to them. Placements and unplaced units are copied in full:
+        # every fork beam search makes is moved straight away, so sharing them until the first change would save nothing
+        state = object.__new__(State)
+        state.__dict__.update(self.__dict__)
+        state.placements = dict(self.placements)
+        state.unplacedUnits = set(self.unplacedUnits)
+        state.groups = list(self.groups)
+        state._owned = set()
+        state.journal = None
+        self._owned = set()
+        return state
+
+    def rewind(self):
+        # Undo every move recorded in the journal, newest first, and start it afresh
+        journal, self.journal = self.journal or [], None
+        for unit, placement in reversed(journal):
+            if placement:
+                self.addToGroup(unit, self.groups[placement - 1])
+            else:
+                self.removeFromGroup(unit)
+        journal.clear()
+        self.journal = journal
+
+    def detach(self):
+        # Take private copies of any groups still shared with other forks, so Group references stay valid from here on
+        for group in self.groups:
+            self._own(group.index)
+
+    def _own(self, index: int) -> Group:
+        if index not in self._owned:
+            self.groups[index - 1] = self.groups[index - 1].copy()
+            self._owned.add(index)
+        return self.groups[index - 1]
 
     def addToGroup(self, unit: Unit, group: Group):
+        if self.placements[unit] == group.index:
+            return
+        group = self._own(group.index)
         group.addUnit(unit)
+        if self.journal is not None:
+            self.journal.append((unit, self.placements[unit]))
         if (placement := self.placements[unit]) == 0:
             self.unplacedUnits.remove(unit)
         else:
-            self.groups[placement - 1].removeUnit(unit)
+            self._own(placement).removeUnit(unit)
+            self.placementHash ^= zobrist(unit, placement)
         self.placements[unit] = group.index
+        self.placementHash ^= zobrist(unit, group.index)
         if self._callback:
             self._callback(unit.code, group.index)
 
+    def removeFromGroup(self, unit: Unit):
+        if (placement := self.placements[unit]) != 0:
+            if self.journal is not None:
+                self.journal.append((unit, placement))
+            self._own(placement).removeUnit(unit)
+            self.placements[unit] = 0
+            self.placementHash ^= zobrist(unit, placement)
+            self.unplacedUnits.add(unit)
+            if self._callback:
+                self._callback(unit.code, 0)
+
     def getGroupFor(self, unit: Unit) -> Group:
         return self.groups[self.placements[unit] - 1]
 
@@ -242,10 +519,324 @@ class State:
             yield border
 
 
+# --- Checkpoints ------------------------------------------------------------------------------------------------------
+
+
+class Checkpoint:
+    # Everything needed to carry on a solve exactly where it stopped: the placements, each group's aggregates (so they
+    # don't have to be rebuilt), the recent moves the solver checks for cycles, the locked units and groups, which phase
+    # the solve was in and its spread at the time, and optionally an RNG's state. Arrays are stored in native byte order
+    magic = b"DSCP"
+    header = struct.Struct("<4sBHIIIQBHH")
+    phases = ("greedy", "swap", "done")
+
+    def __init__(
+        self,
+        state: State,
+        previousMoves: list[tuple[Unit, int, int]] | None = None,
+        passes: int = 0,
+        steps: int = 0,
+        rng: Random | None = None,
+        phase: str = "greedy",
+        spread: float = 0.0,
+    ):
+        self.state = state
+        self.previousMoves = previousMoves or []
+        self.passes = passes
+        self.steps = steps
+        self.rng = rng
+        self.phase = phase
+        self.spread = spread
+
+    def write(self, path: str):
+        # Write to a temporary file and swap it in, so a crash mid-write leaves the last checkpoint intact
+        state = self.state
+        units = unitlist(state.scale)
+        index = {unit: i for i, unit in enumerate(units)}
+        scale, metricID = state.scale.encode(), state.metricID.encode()
+
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(
+                Checkpoint.header.pack(
+                    Checkpoint.magic,
+                    4,
+                    len(state.groups),
+                    len(units),
+                    self.passes,
+                    self.steps,
+                    state.placementHash,
+                    self.rng is not None,
+                    len(scale),
+                    len(metricID),
+                )
+            )
+            file.write(scale + metricID)
+            file.write(array("H", (state.placements[unit] for unit in units)).tobytes())
+            file.write(array("d", (group.metric for group in state.groups)).tobytes())
+            for group in state.groups:
+                file.write(array("I", (group.distanceSum.get(unit, 0) for unit in units)).tobytes())
+
+            file.write(struct.pack("<H", len(self.previousMoves)))
+            file.write(array("I", (x for u, a, b in self.previousMoves for x in (index[u], a, b))).tobytes())
+            file.write(struct.pack("<HI", len(state.lockedGroups), len(state.locked)))
+            file.write(array("H", sorted(state.lockedGroups)).tobytes())
+            file.write(array("I", sorted(index[unit] for unit in state.locked)).tobytes())
+            file.write(struct.pack("<Bd", Checkpoint.phases.index(self.phase), self.spread))
+
+            if self.rng is not None:
+                version, internal, gauss = self.rng.getstate()
+                file.write(struct.pack("<Bd", version, float("nan") if gauss is None else gauss))
+                file.write(array("I", internal).tobytes())
+
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+
+    @staticmethod
+    def read(path: str, callback: Callable[[str, int], None] | None = None) -> "Checkpoint":
+        with open(path, "rb") as file:
+            data = file.read()
+
+        magic, version, numGroup, count, passes, steps, placementHash, hasRng, scaleLen, metricLen = (
+            Checkpoint.header.unpack_from(data)
+        )
+        if magic != Checkpoint.magic:
+            raise ValueError(f"{path} is not a checkpoint")
+        offset = Checkpoint.header.size
+
+        def take(typecode: str, length: int) -> array:
+            nonlocal offset
+            values = array(typecode)
+            values.frombytes(data[offset : offset + length * values.itemsize])
+            offset += length * values.itemsize
+            return values
+
+        scale = data[offset : offset + scaleLen].decode()
+        metricID = data[offset + scaleLen : offset + scaleLen + metricLen].decode()
+        offset += scaleLen + metricLen
+        units = unitlist(scale)
+        if len(units) != count:
+            raise ValueError(f"{path} was written for a different version of {scale}")
+
+        # Fill the state in directly, rather than replaying every placement
+        state = State(numGroup=numGroup, metricID=metricID, scale=scale, callback=callback)
+        placements = take("H", count)
+        metrics = take("d", numGroup)
+        for group, metric in zip(state.groups, metrics):
+            group.metric = metric
+            group.distanceSum = {unit: dist for unit, dist in zip(units, take("I", count)) if dist}
+        for unit, placement in zip(units, placements):
+            state.placements[unit] = placement
+            if placement:
+                state.unplacedUnits.discard(unit)
+                state.groups[placement - 1].units.add(unit)
+        for group in state.groups:
+            group.adj = set().union(*(unit.adj for unit in group.units)) - group.units
+        state.placementHash = placementHash
+
+        (moveCount,) = struct.unpack_from("<H", data, offset)
+        offset += 2
+        # Version 2 and older checkpoints stored moves in 16 bits, which only fit scales of up to 65,535 units
+        moves = take("I" if version >= 3 else "H", 3 * moveCount)
+        previousMoves = [(units[moves[i]], moves[i + 1], moves[i + 2]) for i in range(0, len(moves), 3)]
+
+        # Version 1 checkpoints predate locking
+        if version >= 2:
+            groupCount, unitCount = struct.unpack_from("<HI", data, offset)
+            offset += struct.calcsize("<HI")
+            state.lockedGroups = frozenset(take("H", groupCount))
+            state.locked = frozenset(units[i] for i in take("I", unitCount))
+
+        # Version 3 and older checkpoints didn't record the phase, so they carry on from the start of the main loop
+        phase, spread = "greedy", 0.0
+        if version >= 4:
+            phaseIndex, spread = struct.unpack_from("<Bd", data, offset)
+            offset += struct.calcsize("<Bd")
+            phase = Checkpoint.phases[phaseIndex]
+
+        rng = None
+        if hasRng:
+            version, gauss = struct.unpack_from("<Bd", data, offset)
+            offset += struct.calcsize("<Bd")
+            rng = Random()
+            rng.setstate((version, tuple(take("I", (len(data) - offset) // 4)), None if gauss != gauss else gauss))
+
+        return Checkpoint(state, previousMoves, passes, steps, rng, phase, spread)
+
+
+# --- Results ----------------------------------------------------------------------------------------------------------
+
+
+class SolveResult:
+    # What a solve sends back from another process: the placements in unitlist order, each group's metric, and how long
+    # it took. Pickling a State would drag the whole unit graph along with it, so this holds none of it, but the full
+    # State can be rebuilt from the scale whenever it's needed
+    def __init__(self, state: State, seconds: float = 0.0):
+        self.scale = state.scale
+        self.metricID = state.metricID
+        self.placements = array("H", (state.placements[unit] for unit in unitlist(state.scale)))
+        self.metrics = array("d", (group.metric for group in state.groups))
+        self.unplaced = len(state.unplacedUnits)
+        self.seconds = seconds
+
+    @property
+    def numGroup(self) -> int:
+        return len(self.metrics)
+
+    @property
+    def spread(self) -> float:
+        return max(self.metrics) - min(self.metrics) if self.metrics else 0
+
+    def toState(self, callback: Callable[[str, int], None] | None = None) -> State:
+        state = State(numGroup=self.numGroup, metricID=self.metricID, scale=self.scale, callback=callback)
+        state.placeAll(dict(zip(unitlist(self.scale), self.placements)))
+        return state
+
+    def __str__(self) -> str:
+        return (
+            f"{self.numGroup} groups of {self.scale} by {self.metricID}: spread {self.spread:,.2f}, "
+            f"{self.unplaced} unplaced, {self.seconds:.2f}s"
+        )
+
+
+# --- Scale bundles ----------------------------------------------------------------------------------------------------
+
+
+def sources(scale: str) -> bytes:
+    # The size and modification time of everything a bundle is built from, so it can tell when it's out of date
+    stats = []
+    for name in ("adjacency.csv", "data.tsv", "names.tsv"):
+        if os.path.exists(path := f"assets/{scale}/{name}"):
+            stat = os.stat(path)
+            stats.append(f"{name}:{stat.st_size}:{stat.st_mtime_ns}")
+    return "\n".join(stats).encode()
+
+
+class Bundle:
+    # A whole scale compiled into one file: unit codes, metric names and columns, display names, CSR adjacency,
+    # component labels and the full distance matrix. Opening it is a single mmap, so nothing is parsed, and processes
+    # forked after loading share its pages. After the header comes a table of named sections, each an array of one
+    # typecode, stored in native byte order and aligned to 8 bytes
+    magic = b"DSSB"
+    header = struct.Struct("<4sBH")
+    section = struct.Struct("<8scQQ")
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = Bundle.header.unpack_from(self.map)
+        if magic != Bundle.magic or version != 1:
+            raise ValueError(f"{path} is not a scale bundle")
+
+        view = memoryview(self.map)
+        self.sections: dict[str, memoryview] = {}
+        for i in range(count):
+            name, typecode, offset, size = Bundle.section.unpack_from(
+                self.map, Bundle.header.size + i * Bundle.section.size
+            )
+            self.sections[name.rstrip(b"\0").decode()] = view[offset : offset + size].cast(typecode.decode())
+        self.count = len(self.sections["indptr"]) - 1
+
+    def __getitem__(self, name: str) -> memoryview:
+        return self.sections[name]
+
+    def row(self, index: int) -> memoryview:
+        # One unit's distance to every other, 0 for itself and for anything in another piece of the map
+        return self.sections["distance"][index * self.count : (index + 1) * self.count]
+
+    def read(self, scale: str) -> tuple[list[Unit], list[str], array]:
+        # Units built from the bundle, in the same form as readFile's, except that their distances stay in the file
+        codes = bytes(self["codes"]).decode().split("\n")
+        units = [Unit(code, scale) for code in codes]
+        indptr, indices, labels = self["indptr"], self["indices"], self["labels"]
+        for i, unit in enumerate(units):
+            unit.index = i
+            unit.component = labels[i]
+            unit.adj = {units[j] for j in indices[indptr[i] : indptr[i + 1]]}
+            unit.distances = Distances(units, self.row(i))
+
+        metrics = array("d")
+        metrics.frombytes(self["metrics"].cast("B"))
+        return units, bytes(self["columns"]).decode().split("\t"), metrics
+
+    @staticmethod
+    def write(path: str, sections: dict[str, array | bytes]):
+        # Write to a temporary file and swap it in, so a reader never sees half a bundle. Each process and thread gets
+        # its own temporary file, so two rebuilding the same stale bundle at once can't truncate each other's, and
+        # whichever swaps in last wins with a complete bundle of the same sources
+        offset = Bundle.header.size + len(sections) * Bundle.section.size
+        table = []
+        for name, data in sections.items():
+            offset += -offset % 8
+            typecode = data.typecode if isinstance(data, array) else "B"
+            size = len(data) * (data.itemsize if isinstance(data, array) else 1)
+            table.append(Bundle.section.pack(name.encode(), typecode.encode(), offset, size))
+            offset += size
+
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(Bundle.header.pack(Bundle.magic, 1, len(sections)))
+            file.write(b"".join(table))
+            for data in sections.values():
+                file.write(bytes(-file.tell() % 8))
+                file.write(data.tobytes() if isinstance(data, array) else data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+
+    @staticmethod
+    def load(scale: str) -> "Bundle":
+        # Open the scale's bundle, building it first if it's missing or older than its sources
+        global _bundles, _distanceRows
+        try:
+            bundle = Bundle(f"assets/{scale}/scale.bin")
+            if bytes(bundle["source"]) != sources(scale):
+                bundle = buildScale(scale)
+        except (OSError, ValueError, KeyError):
+            bundle = buildScale(scale)
+        _bundles[scale] = bundle
+        _distanceRows.pop(scale, None)
+        return bundle
+
+
+def buildScale(scale: str) -> Bundle:
+    # Compile a scale's source files into its bundle. This is the slow path, only taken when the bundle is missing or
+    # out of date
+    signature = sources(scale)
+    units, metricNames, metrics = readFile(scale)
+    indptr = array("I", [0])
+    indices = array("I")
+    distance = array("H")
+    for unit in units:
+        indices.extend(sorted(adj.index for adj in unit.adj))
+        indptr.append(len(indices))
+        distance.extend(unit.distances.get(other, 0) for other in units)
+    with open(f"assets/{scale}/names.tsv", "rb") as file:
+        names = file.read()
+
+    path = f"assets/{scale}/scale.bin"
+    Bundle.write(
+        path,
+        {
+            "source": signature,
+            "codes": "\n".join(unit.code for unit in units).encode(),
+            "columns": "\t".join(metricNames).encode(),
+            "metrics": metrics,
+            "names": names,
+            "indptr": indptr,
+            "indices": indices,
+            "labels": array("H", (unit.component for unit in units)),
+            "distance": distance,
+        },
+    )
+    return Bundle(path)
+
+
 # --- Helper file reading function -------------------------------------------------------------------------------------
 
 
-def getDistanceStep(startUnit: Unit, units: dict[str, Unit]) -> dict[Unit, int]:
+def getDistanceStep(startUnit: Unit, units: dict[str, Unit], doPrint: bool = True) -> dict[Unit, int]:
     distances = {startUnit: 0}
     dist = 1
     lastRow = [startUnit]
@@ -257,7 +848,9 @@ def getDistanceStep(startUnit: Unit, units: dict[str, Unit]) -> dict[Unit, int]:
                 changed.append(adjUnit)
         dist += 1
         lastRow = changed
-        print(f"Calculating distances: {100 * list(units.keys()).index(startUnit.code) / len(units):10.4f}%", end="\r")
+        if doPrint:
+            progress = 100 * list(units.keys()).index(startUnit.code) / len(units)
+            print(f"Calculating distances: {progress:10.4f}%", end="\r")
 
     distances.pop(startUnit)
     return distances
@@ -285,35 +878,66 @@ def populateDistances(scale: str, units: dict[str, Unit]) -> dict[str, Unit]:
     return units
 
 
-def readFile(scale: str) -> tuple[list[Unit], list[str]]:
+def readHeader(scale: str) -> tuple[list[str], int]:
+    # The metric names and number of units, without parsing any metrics or touching adjacency and distances
+    with open(f"assets/{scale}/data.tsv", encoding="utf8", newline="") as file:
+        metricNames = file.readline().rstrip("\r\n").split("\t")[1:]
+        count = sum(1 for line in file if line.strip() and not line.startswith("Total\t"))
+    return metricNames, count
+
+
+def readColumn(scale: str, column: int) -> array:
+    # One metric's values, in file order, without parsing the rest of the data or touching adjacency and distances
+    with open(f"assets/{scale}/data.tsv", encoding="utf8", newline="") as file:
+        file.readline()
+        return array(
+            "d",
+            (
+                float(line.split("\t")[column + 1].replace(",", ""))
+                for line in file
+                if line.strip() and not line.startswith("Total\t")
+            ),
+        )
+
+
+def readFile(scale: str) -> tuple[list[Unit], list[str], array]:
     # Read in adjacency
     adj = {}
     with open(f"assets/{scale}/adjacency.csv", encoding="utf8", newline="") as csvfile:
         for row in csv.reader(csvfile, delimiter=","):
             adj[row[0]] = row[1:]
 
-    # Read in units
-    units = {}
-    metricNames: list[str] = []
-    with open(f"assets/{scale}/data.tsv", encoding="utf8", newline="") as csvfile:
-        for row in csv.DictReader(csvfile, delimiter="\t"):
-            if not metricNames:
-                metricNames = list(filter(lambda k: k != "Unit", row.keys()))
-            code = row["Unit"]
-            # Skip the Totals row
-            if code == "Total":
-                continue
-            # add the unit and metrics
-            unitMetrics = {
-                key: float(value.strip().replace(",", "")) for (key, value) in row.items() if key in metricNames
-            }
-            units[code] = Unit(code, unitMetrics, scale)
-
-    # Put adjacency in the units
+    # Read in units, sorted by code, and their metrics a whole column at a time (skipping the Totals row)
+    with open(f"assets/{scale}/data.tsv", encoding="utf8", newline="") as file:
+        header, *lines = file.read().replace(",", "").splitlines()
+    metricNames = header.split("\t")[1:]
+    codes, *columns = zip(*sorted(line.split("\t") for line in lines if line and not line.startswith("Total\t")))
+    metrics = array("d")
+    for column in columns:
+        metrics.extend(map(float, column))
+    units = {code: Unit(code, scale) for code in codes}
+
+    # Put adjacency in the units, ignoring the odd unit that's listed as bordering itself
     for unit in units.values():
         for adjacent in adj[unit]:
-            unit.adj.add(units[adjacent])
+            if adjacent != unit.code:
+                unit.adj.add(units[adjacent])
+
+    # Label the connected pieces of the map
+    unlabelled = set(units.values())
+    component = 0
+    while unlabelled:
+        toCheck = [min(unlabelled, key=lambda unit: unit.code)]
+        unlabelled.remove(toCheck[0])
+        for unit in toCheck:
+            unit.component = component
+            toCheck.extend(unit.adj & unlabelled)
+            unlabelled -= unit.adj
+        component += 1
 
     populateDistances(scale, units)
 
-    return sorted(units.values(), key=lambda u: u.code), metricNames
+    ordered = list(units.values())
+    for i, unit in enumerate(ordered):
+        unit.index = i
+    return ordered, metricNames, metrics
@@ -0,0 +1,176 @@
+from collections import deque
+from heapq import heappop, heappush
+from contextlib import nullcontext
+from itertools import starmap
+from multiprocessing import Pool
+from typing import Callable
+
+import data_structs as ds
+import logic_iterative as logic
+from data_structs import State, Unit, Group
+
+# --- Bisection --------------------------------------------------------------------------------------------------------
+
+
+def components(units: set[Unit]) -> list[set[Unit]]:
+    # Split a set of units into the pieces that are connected within that set
+    remaining = set(units)
+    zones = []
+    while remaining:
+        zone = {remaining.pop()}
+        toCheck = list(zone)
+        while toCheck:
+            for adj in toCheck.pop().adj & remaining:
+                remaining.remove(adj)
+                zone.add(adj)
+                toCheck.append(adj)
+        zones.append(zone)
+
+    return sorted(zones, key=lambda zone: (-len(zone), min(unit.code for unit in zone)))
+
+
+def peripheral(zone: set[Unit]) -> Unit:
+    # Two sweeps of "farthest unit from here" land on the edge of the zone, which makes a good place to grow from
+    unit = min(zone, key=lambda unit: unit.code)
+    for _ in range(2):
+        unit = max(zone, key=lambda other: (unit.distances.get(other, 0), other.code))
+    return unit
+
+
+def staysConnected(region: set[Unit], unit: Unit) -> bool:
+    # The cheap local check is conservative, so fall back to searching outwards from every neighbour at once. Pieces
+    # merge as their searches meet, and the first search to run dry has found a piece that would be cut off - which
+    # is usually the small one, so this stays cheap on big regions
+    if Group.connectedWithout(region, unit):
+        return True
+
+    border = list(unit.adj & region)
+    owner = {adj: i for i, adj in enumerate(border)}
+    parent = list(range(len(border)))
+    toCheck = [deque([adj]) for adj in border]
+    pieces = len(border)
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    while pieces > 1:
+        for i in range(len(border)):
+            if parent[i] != i:
+                continue
+            elif not toCheck[i]:
+                return False
+
+            for adj in toCheck[i].popleft().adj & region:
+                if adj is unit:
+                    continue
+                elif adj not in owner:
+                    owner[adj] = i
+                    toCheck[i].append(adj)
+                elif (j := find(owner[adj])) != i:
+                    parent[j] = i
+                    toCheck[i].extend(toCheck[j])
+                    toCheck[j].clear()
+                    pieces -= 1
+
+    return True
+
+
+def bisect(scale: str, metricID: str, codes: list[str], numGroup: int) -> list[tuple[list[str], int]]:
+    # Split the units into two contiguous halves whose metrics are in the ratio floor(k/2):ceil(k/2)
+    codeSet = set(codes)
+    units = {unit for unit in ds.unitlist(scale) if unit.code in codeSet}
+    column = ds.metricColumn(scale, metricID)
+    metric = {unit: column[unit.index] for unit in units}
+    numGroupA = numGroup // 2
+    target = sum(metric.values()) * numGroupA / numGroup
+
+    regionA = set[Unit]()
+    regionB = set(units)
+    added: list[Unit] = []
+    total = 0.0
+    zones = components(units)
+    for zone in zones:
+        if total >= target and regionA:
+            break
+
+        # Grow a ball outwards from the edge of this zone until it holds enough
+        seed = peripheral(zone)
+        toCheck = [(0, seed.code, seed)]
+        while toCheck and (total < target or not regionA) and len(regionB) > 1:
+            _, _, unit = heappop(toCheck)
+            if unit in regionA:
+                continue
+
+            regionA.add(unit)
+            regionB.remove(unit)
+            added.append(unit)
+            total += metric[unit]
+            for adj in unit.adj & regionB:
+                heappush(toCheck, (seed.distances.get(adj, 0), adj.code, adj))
+
+    # The ball can wall off pockets of the other half - fold those in, keeping only the biggest piece of each zone
+    zoneOf = {unit: i for i, zone in enumerate(zones) for unit in zone}
+    keptZones = set[int]()
+    for piece in components(regionB):
+        if (zone := zoneOf[next(iter(piece))]) in keptZones:
+            regionA |= piece
+            regionB -= piece
+            total += sum(metric[unit] for unit in piece)
+        else:
+            keptZones.add(zone)
+
+    # Then hand units on the far edge back while that lands closer to the target
+    for unit in reversed(added):
+        if total <= target or len(regionA) == 1:
+            break
+        elif abs(total - metric[unit] - target) < abs(total - target) and unit.adj & regionB:
+            if staysConnected(regionA, unit):
+                regionA.remove(unit)
+                regionB.add(unit)
+                total -= metric[unit]
+
+    return [
+        (sorted(unit.code for unit in regionA), numGroupA),
+        (sorted(unit.code for unit in regionB), numGroup - numGroupA),
+    ]
+
+
+# --- Solver -----------------------------------------------------------------------------------------------------------
+
+
+def solve(
+    numGroup: int,
+    metricID: str | int = 0,
+    scale: str | int = 0,
+    callback: Callable[[str, int], None] | None = None,
+    doPrint: bool = False,
+    processes: int | None = None,
+) -> State:
+    scale = State.parseScale(scale)
+    metricID = State.parseMetricID(scale, metricID)
+    units = ds.unitlist(scale)
+
+    # Split level by level; every piece on a level is independent, so they're farmed out together
+    parts: list[tuple[list[str], int]] = [([unit.code for unit in units], numGroup)]
+    with Pool(processes) if processes != 1 else nullcontext() as pool:
+        while any(count > 1 for _, count in parts):
+            done = [part for part in parts if part[1] == 1]
+            jobs = [(scale, metricID, codes, count) for codes, count in parts if count > 1]
+            halves = pool.starmap(bisect, jobs) if pool else list(starmap(bisect, jobs))
+            parts = done + [half for split in halves for half in split]
+            if doPrint:
+                print(f"Split into {len(parts)} parts")
+
+    state = State(numGroup=numGroup, metricID=metricID, scale=scale, callback=callback)
+    byCode = {unit.code: unit for unit in units}
+    for group, (codes, _) in zip(state.groups, sorted(parts, key=lambda part: part[0])):
+        for code in codes:
+            state.addToGroup(byCode[code], group)
+
+    return state
+
+
+if __name__ == "__main__":
+    logic.Log.state(solve(435, "Population", scale="counties"))
@@ -0,0 +1,259 @@
+from itertools import combinations, product
+from math import ceil, floor
+from time import perf_counter
+from typing import Callable, Iterator
+
+import data_structs as ds
+import logic_iterative as logic
+import logic_bisection as bisection
+from data_structs import State, Unit
+
+# --- Bit masks --------------------------------------------------------------------------------------------------------
+
+
+def bits(mask: int) -> Iterator[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+# --- Search -----------------------------------------------------------------------------------------------------------
+
+
+class Timeout(Exception):
+    pass
+
+
+class Search:
+    # Branch and bound over contiguous plans, looking for anything with a smaller spread than the best so far. Groups
+    # are built one at a time, each grown from the lowest-ordered unit nobody holds yet, so every plan is only reached
+    # once whichever way its groups are numbered. Units of the main piece of the map are bits of a mask, ordered
+    # outwards from its edge. Outlying pieces are kept whole and handed out once the main piece is split up, either to
+    # groups of the main piece or to groups of their own, so every plan isContiguous allows is covered. A group's share
+    # of the outlying pieces is one of their subset sums, so its main-piece part has to land within the window less
+    # one of those
+    def __init__(self, state: State, best: float, timeBudget: float | None = None):
+        pieces = bisection.components(set(ds.unitlist(state.scale)))
+        start = bisection.peripheral(pieces[0])
+        self.units: list[Unit] = [start]
+        for unit in self.units:
+            self.units.extend(sorted(unit.adj & pieces[0] - set(self.units), key=lambda adj: adj.code))
+
+        index = {unit: i for i, unit in enumerate(self.units)}
+        self.metric = [state.unitMetrics[unit.index] for unit in self.units]
+        self.adjMask = [sum(1 << index[adj] for adj in unit.adj) for unit in self.units]
+        self.full = (1 << len(self.units)) - 1
+        self.islands = pieces[1:]
+        self.islandMetrics = [sum(state.unitMetrics[unit.index] for unit in piece) for piece in self.islands]
+        self.slack = sum(self.islandMetrics)
+        self.sums = sorted(
+            {
+                sum(chosen)
+                for count in range(len(self.islands) + 1)
+                for chosen in combinations(self.islandMetrics, count)
+            }
+        )
+
+        self.numGroup = len(state.groups)
+        # How many of the groups are being grown from the main piece, the rest being made of outlying pieces only
+        self.mainGroups = self.numGroup
+        self.avg = state.avgGroupMetric
+        self.best = best
+        self.bestPlan: tuple[list[int], tuple[int, ...]] | None = None
+        self.nodes = 0
+        self.deadline = perf_counter() + timeBudget if timeBudget is not None else None
+
+    def maskMetric(self, mask: int) -> float:
+        return sum(self.metric[i] for i in bits(mask))
+
+    def components(self, mask: int) -> list[int]:
+        result = []
+        while mask:
+            component = frontier = mask & -mask
+            while frontier:
+                grown = 0
+                for i in bits(frontier):
+                    grown |= self.adjMask[i]
+                frontier = grown & mask & ~component
+                component |= frontier
+            result.append(component)
+            mask &= ~component
+        return result
+
+    def window(self, metrics: list[float]) -> tuple[float, float]:
+        # Bounds on the whole metric of any further group in a plan that beats the best. Every group of such a plan is
+        # within the best spread of the average and of every other group, whose outlying pieces aren't known yet
+        low = max(self.avg, max(metrics, default=0)) - self.best
+        high = min(self.avg, min(metrics, default=float("inf")) + self.slack) + self.best
+        return low, high
+
+    def fits(self, metric: float, low: float, high: float) -> bool:
+        # Whether a main-piece part can be topped up with some of the outlying pieces to land within the window
+        return any(low < metric + extra < high for extra in self.sums)
+
+    def feasible(self, rest: int, groupsLeft: int, low: float, high: float) -> bool:
+        # Every piece left over has to be split into a whole number of groups, and those have to add up to what's left
+        fewest = most = 0
+        for component in self.components(rest):
+            metric = self.maskMetric(component)
+            least = max(1, ceil(metric / high)) if high > 0 else groupsLeft + 1
+            greatest = floor(metric / low) if low > 0 else groupsLeft
+            if least > greatest:
+                return False
+            fewest += least
+            most += greatest
+        return fewest <= groupsLeft <= most
+
+    def viable(self, group: int, frontier: int, excluded: int, assigned: int, groupCount: int) -> bool:
+        # Growing the group can only split what's left into more pieces, never join them. Pieces the group can't reach
+        # any more are final, and pieces holding a ruled-out unit can't be swallowed whole, so each of those needs
+        # groups of its own
+        low, high = self.window([])
+        low -= self.slack
+        groupsLeft = self.mainGroups - groupCount - 1
+        needed = 0
+        for component in self.components(self.full & ~assigned & ~group):
+            if not component & frontier:
+                metric = self.maskMetric(component)
+                least = max(1, ceil(metric / high))
+                if low > 0 and least > floor(metric / low):
+                    return False
+                needed += least
+            elif component & excluded:
+                needed += 1
+            if needed > groupsLeft:
+                return False
+        return True
+
+    def tick(self):
+        self.nodes += 1
+        if self.deadline is not None and self.nodes % 1000 == 0 and perf_counter() > self.deadline:
+            raise Timeout()
+
+    def run(self):
+        # Groups of outlying pieces only are tried last, and only if some of the pieces add up to a group's worth
+        for mainGroups in range(self.numGroup, max(1, self.numGroup - len(self.islands)) - 1, -1):
+            low, high = self.window([])
+            if mainGroups == self.numGroup or any(low < extra < high for extra in self.sums[1:]):
+                self.mainGroups = mainGroups
+                self.place(0, [], [])
+
+    def place(self, assigned: int, groups: list[int], metrics: list[float]):
+        rest = self.full & ~assigned
+        groupsLeft = self.mainGroups - len(groups)
+        low, high = self.window(metrics)
+        if groupsLeft == 1:
+            # The last group is whatever is left, as long as that's in one piece
+            if rest and len(self.components(rest)) == 1 and self.fits(metric := self.maskMetric(rest), low, high):
+                self.finish(groups + [rest], metrics + [metric])
+        elif rest and self.feasible(rest, groupsLeft, low - self.slack, high):
+            root = rest & -rest
+            self.grow(
+                root,
+                self.metric[root.bit_length() - 1],
+                self.adjMask[root.bit_length() - 1] & rest,
+                0,
+                assigned,
+                groups,
+                metrics,
+            )
+
+    def grow(
+        self,
+        group: int,
+        metric: float,
+        frontier: int,
+        excluded: int,
+        assigned: int,
+        groups: list[int],
+        metrics: list[float],
+        fresh: bool = True,
+    ):
+        # Every connected set holding the root comes up exactly once: each frontier unit is either taken, or ruled out
+        # for this group. A set only counts as a group when it's first reached
+        self.tick()
+        if not self.viable(group, frontier, excluded, assigned, len(groups)):
+            return
+        low, high = self.window(metrics)
+        if fresh and self.fits(metric, low, high):
+            self.place(assigned | group, groups + [group], metrics + [metric])
+            low, high = self.window(metrics)
+
+        if not frontier:
+            return
+        unit = frontier & -frontier
+        i = unit.bit_length() - 1
+
+        if metric + self.metric[i] < high:
+            taken = group | unit
+            newFrontier = (frontier | self.adjMask[i]) & ~taken & ~excluded & ~assigned & self.full
+            self.grow(taken, metric + self.metric[i], newFrontier, excluded, assigned, groups, metrics)
+
+        # Ruling the unit out only helps if the group can still reach enough without it
+        excluded |= unit
+        reachable = next(c for c in self.components(self.full & ~assigned & ~excluded) if c & group)
+        if metric + self.maskMetric(reachable & ~group) > self.window(metrics)[0] - self.slack:
+            self.grow(group, metric, frontier & ~unit, excluded, assigned, groups, metrics, False)
+
+    def finish(self, groups: list[int], metrics: list[float]):
+        # Hand the outlying pieces to whichever groups give the smallest spread. Groups after the main-piece ones have
+        # nothing else, so each needs at least one piece
+        ownerless = set(range(len(groups), self.numGroup))
+        for owners in product(range(self.numGroup), repeat=len(self.islands)):
+            if not ownerless <= set(owners):
+                continue
+            totals = metrics + [0] * len(ownerless)
+            for owner, metric in zip(owners, self.islandMetrics):
+                totals[owner] += metric
+            if (spread := max(totals) - min(totals)) < self.best:
+                self.best = spread
+                self.bestPlan = (groups, owners)
+
+
+# --- Solver -----------------------------------------------------------------------------------------------------------
+
+
+def search(state: State, timeBudget: float | None = None, doPrint: bool = False) -> tuple[State, bool]:
+    # Improve on a finished plan until it's provably optimal, or until time runs out. Returns the best plan found, and
+    # whether it's certified optimal. Certifying is only practical on small maps: on states the best plans are so
+    # close to even that proving nothing beats them means going through nearly every balanced contiguous split, which
+    # takes far more than minutes, so there it's an improver with a time budget rather than a gold standard
+    spread = max(state.groups).metric - min(state.groups).metric if state.groups else 0
+    finder = Search(state, spread, timeBudget)
+    try:
+        finder.run()
+        optimal = True
+    except Timeout:
+        optimal = False
+
+    if doPrint:
+        print(f"Searched {finder.nodes:,} nodes: spread {finder.best:,.2f}{'' if optimal else ' (not certified)'}")
+
+    if finder.bestPlan:
+        masks, owners = finder.bestPlan
+        for group, mask in zip(state.groups, masks):
+            for i in bits(mask):
+                state.addToGroup(finder.units[i], group)
+        for owner, piece in zip(owners, finder.islands):
+            for unit in piece:
+                state.addToGroup(unit, state.groups[owner])
+
+    return state, optimal
+
+
+def solve(
+    numGroup: int,
+    metricID: str | int = 0,
+    scale: str | int = 0,
+    callback: Callable[[str, int], None] | None = None,
+    doPrint: bool = False,
+    timeBudget: float | None = None,
+) -> State:
+    # The regular solver's plan sets the bar the search has to beat
+    state = logic.solve(numGroup, metricID, scale, callback)
+    return search(state, timeBudget, doPrint)[0]
+
+
+if __name__ == "__main__":
+    logic.Log.state(solve(4, "Population", scale="states", doPrint=True))
@@ -0,0 +1,116 @@
+from array import array
+from collections import Counter
+from contextlib import nullcontext
+from itertools import starmap
+from multiprocessing import Pool
+from random import Random
+from typing import Callable
+
+import data_structs as ds
+import logic_iterative as logic
+import logic_medoids as medoids
+from data_structs import State
+
+# --- Plans ------------------------------------------------------------------------------------------------------------
+
+
+def toPlan(state: State) -> array:
+    # A state's placements as a flat vector, in unitlist order
+    return array("H", (state.placements[unit] for unit in ds.unitlist(state.scale)))
+
+
+def fromPlan(
+    scale: str, metricID: str, numGroup: int, plan: array, callback: Callable[[str, int], None] | None = None
+) -> State:
+    state = State(numGroup=numGroup, metricID=metricID, scale=scale, callback=callback)
+    state.placeAll(dict(zip(ds.unitlist(scale), plan)))
+    return state
+
+
+def fitness(state: State) -> float:
+    # Lower is better: the spread between groups, with anything left unplaced counting against it in full
+    metrics = [group.metric for group in state.groups]
+    return max(metrics) - min(metrics) + sum(state.unitMetrics[unit.index] for unit in state.unplacedUnits)
+
+
+# --- Operators --------------------------------------------------------------------------------------------------------
+
+
+def align(planA: array, planB: array, numGroup: int) -> list[int]:
+    # Group numbers are arbitrary, so relabel B's groups to match whichever of A's they overlap most, biggest first
+    overlap = Counter(zip(planA, planB))
+    mapping = [0] * (numGroup + 1)
+    takenA, takenB = set(), set()
+    for (groupA, groupB), _ in sorted(overlap.items(), key=lambda item: (-item[1], item[0])):
+        if groupA and groupB and groupA not in takenA and groupB not in takenB:
+            mapping[groupB] = groupA
+            takenA.add(groupA)
+            takenB.add(groupB)
+
+    spare = iter(sorted(set(range(1, numGroup + 1)) - takenA))
+    for groupB in range(1, numGroup + 1):
+        if groupB not in takenB:
+            mapping[groupB] = next(spare)
+    return mapping
+
+
+def crossover(scale: str, metricID: str, numGroup: int, planA: array, planB: array) -> tuple[array, float]:
+    # The child keeps every unit its parents agree on. The rest are unplaced, stray pieces of the overlay are cut
+    # loose, and the regular solver grows the groups back over the gaps
+    mapping = align(planA, planB, numGroup)
+    child = array("H", (a if a == mapping[b] else 0 for a, b in zip(planA, planB)))
+    state = logic.iterate(logic.unplaceStrays(fromPlan(scale, metricID, numGroup, child)))
+    return toPlan(state), fitness(state)
+
+
+def seedPlan(scale: str, metricID: str, numGroup: int, seed: int) -> tuple[array, float]:
+    state = medoids.solve(numGroup, metricID, scale, seed=seed)
+    return toPlan(state), fitness(state)
+
+
+# --- Solver -----------------------------------------------------------------------------------------------------------
+
+
+def solve(
+    numGroup: int,
+    metricID: str | int = 0,
+    scale: str | int = 0,
+    callback: Callable[[str, int], None] | None = None,
+    doPrint: bool = False,
+    populationSize: int = 8,
+    generations: int = 10,
+    seed: int = 0,
+    processes: int | None = None,
+) -> State:
+    scale = State.parseScale(scale)
+    metricID = State.parseMetricID(scale, metricID)
+    ds.unitlist(scale)
+    rng = Random(seed)
+
+    # Children are built and scored in the workers, so only plans and their fitness cross the process boundary
+    with Pool(processes) if processes != 1 else nullcontext() as pool:
+        run = pool.starmap if pool else lambda func, jobs: list(starmap(func, jobs))
+        population = run(seedPlan, [(scale, metricID, numGroup, seed + i) for i in range(populationSize)])
+
+        for generation in range(generations):
+            # Tournament selection: each parent is the fitter of two random picks
+            def pick() -> array:
+                return min(rng.choices(population, k=2), key=lambda member: member[1])[0]
+
+            jobs = [(scale, metricID, numGroup, pick(), pick()) for _ in range(populationSize)]
+            children = run(crossover, jobs)
+
+            # Keep the best distinct plans out of parents and children together
+            survivors = {}
+            for plan, score in sorted(population + children, key=lambda member: member[1]):
+                survivors.setdefault(plan.tobytes(), (plan, score))
+            population = list(survivors.values())[:populationSize]
+
+            if doPrint:
+                print(f"Generation {generation + 1}: best spread {population[0][1]:,.2f}")
+
+    return fromPlan(scale, metricID, numGroup, population[0][0], callback)
+
+
+if __name__ == "__main__":
+    logic.Log.state(solve(5, "Population", scale="states", doPrint=True))
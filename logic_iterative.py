@@ -1,8 +1,12 @@
 from shutil import get_terminal_size as term_size
+from time import perf_counter
 from itertools import chain
-from typing import Callable, Iterable
+from os.path import exists
+from typing import Callable, Iterable, Sequence
 
-from data_structs import State, Unit, Group
+import data_structs as ds
+import logic_bisection as bisection
+from data_structs import State, Unit, Group, Checkpoint, SolveResult
 
 # --- Solver -----------------------------------------------------------------------------------------------------------
 
@@ -14,7 +18,7 @@ def sorter(state: State, group: Group, unit: Unit) -> tuple:
         # Prioritize shorter distance
         -group.distanceSum.get(unit, float("inf")),
         # Prioritize units that bring this group as close as possible to the average
-        -abs(state.avgGroupMetric - unit.metric - group.metric),
+        -abs(state.avgGroupMetric - state.unitMetrics[unit.index] - group.metric),
     )
 
 
@@ -24,15 +28,17 @@ def getPlaceableUnitsFor(state: State, group: Group) -> Iterable[Unit]:
     elif unplacedAdjacent := group.adj & state.unplacedUnits:
         return unplacedAdjacent
     else:
+        # Unplaced units in pieces of the map the group isn't in yet are fair game too
+        pieces = {unit.component for unit in group.units}
         return chain(
-            (unit for unit in group.adj if state.getGroupFor(unit).canLose(unit)),
-            (unit for unit in state.unplacedUnits if all(u not in unit.distances for u in group.units)),
+            (unit for unit in group.adj - state.locked if state.getGroupFor(unit).canLose(unit)),
+            (unit for unit in state.unplacedUnits if unit.component not in pieces),
         )
 
 
 def getNext(state: State) -> Iterable[tuple[Unit | None, Group]]:
     for group in sorted(
-        state.groups,
+        (group for group in state.groups if group.index not in state.lockedGroups),
         key=lambda group: (
             # Prioritize groups that have at least one adjacent empty unit, are empty, or have no adjacent units at all
             -(state.hasAnyUnplacedAdjacent(group) or group.empty or not group.adj),
@@ -62,26 +68,434 @@ def doStep(
             else:
                 print(f"{group.index}: Stealing {unit} from {prevPlacement}")
 
-        state.addToGroup(unit, group)
+        applyMove(state, unit, group, doPrint)
+        return state, unit, group.index, prevPlacement
+
+    return state, None, None, None
+
+
+def applyMove(state: State, unit: Unit, group: Group, doPrint: bool = False):
+    state.addToGroup(unit, group)
+    group = state.groups[group.index - 1]
+
+    if doPrint:
+        print(Log.getPlacementStr(state))
+
+    # If half the units are placed, we can start checking for enclosures
+    if len(state.unplacedUnits) * 2 < len(state.placements):
+        for disconnectedCount in state.generateDisconnectedGroups(group):
+            if doPrint:
+                unplacedCount = len(disconnectedCount)
+                longEnough = term_size().columns > unplacedCount * 4 + 12
+                print(f"{group.index}: enclosed {disconnectedCount if longEnough else f'{unplacedCount} units'}")
+            for unplaced in disconnectedCount:
+                state.addToGroup(unplaced, group)
+            if doPrint:
+                Log.state(state)
+
+
+def unplaceStrays(state: State) -> State:
+    # Keep the biggest connected piece of each group (plus any pieces in unconnected parts of the map) and unplace the
+    # rest, so the solver can grow the groups back together
+    for group in state.groups:
+        kept = set[int]()
+        for zone in sorted(
+            group.zones, key=lambda zone: sum(state.unitMetrics[unit.index] for unit in zone), reverse=True
+        ):
+            if (component := next(iter(zone)).component) not in kept:
+                kept.add(component)
+            else:
+                for unit in zone - state.locked:
+                    state.removeFromGroup(unit)
+
+    return state
+
+
+def reconnectLocked(state: State) -> State:
+    # Locked units that freeing part of the map cuts off from the rest of their group can't move back, so grow the
+    # group out to them instead, along the shortest way through unplaced units. With no such way, there's no contiguous
+    # plan that keeps them locked
+    for index in range(1, len(state.groups) + 1):
+        while True:
+            group = state.groups[index - 1]
+            mainPieces: dict[int, set[Unit]] = {}
+            for zone in sorted(
+                group.zones, key=lambda zone: sum(state.unitMetrics[unit.index] for unit in zone), reverse=True
+            ):
+                if (component := next(iter(zone)).component) not in mainPieces:
+                    mainPieces[component] = zone
+                elif index in state.lockedGroups or (path := pathBetween(state, zone, mainPieces[component])) is None:
+                    raise ValueError(f"Locked units {Log.joinedUnits(zone)} are cut off from the rest of group {index}")
+                else:
+                    for unit in path:
+                        state.addToGroup(unit, group)
+                    break
+            else:
+                break
+
+    return state
+
+
+def pathBetween(state: State, start: set[Unit], end: set[Unit]) -> list[Unit] | None:
+    # The fewest unplaced units that join the two pieces up, by breadth-first search out of the first one
+    previous: dict[Unit, Unit | None] = {unit: None for unit in start}
+    lastRow = sorted(start, key=lambda unit: unit.code)
+    while lastRow:
+        nextRow = []
+        for unit in lastRow:
+            for adj in sorted(unit.adj, key=lambda adj: adj.code):
+                if adj in end:
+                    path = []
+                    while unit not in start:
+                        path.append(unit)
+                        unit = previous[unit]
+                    return path
+                elif adj not in previous and adj in state.unplacedUnits:
+                    previous[adj] = unit
+                    nextRow.append(adj)
+        lastRow = nextRow
+    return None
+
+
+# --- Bounds -----------------------------------------------------------------------------------------------------------
+
+
+def spreadBound(state: State) -> float:
+    # A floor on the spread of any plan, however the units are grouped
+    return metricSpreadBound(state.unitMetrics, len(state.groups))
+
+
+def metricSpreadBound(unitMetrics: Sequence[float], numGroup: int) -> float:
+    # spreadBound from the metric alone, so it needs no State or unit graph
+    metrics = sorted(unitMetrics, reverse=True)
+    if numGroup < 2 or not metrics:
+        return 0
+    elif len(metrics) < numGroup:
+        # Some group has to stay empty
+        return metrics[0]
+
+    # Of the k*j + 1 biggest units, some group has to take j + 1, so it's at least as big as the j + 1 smallest of them
+    totals = [0.0]
+    for metric in metrics:
+        totals.append(totals[-1] + metric)
+    largest = max(
+        totals[numGroup * j + 1] - totals[(numGroup - 1) * j] for j in range((len(metrics) - 1) // numGroup + 1)
+    )
+
+    # Sharing the rest out evenly between the other groups is the best the smallest group can do
+    return max(0, largest - (totals[-1] - largest) / (numGroup - 1))
+
+
+def isHopeless(state: State) -> bool:
+    # Whether no plan can fit every group inside the acceptable range
+    return spreadBound(state) > 2 * state.deviation
+
+
+def isHopelessFor(numGroup: int, metricID: str | int = 0, scale: str | int = 0) -> bool:
+    # isHopeless without building a State, reading only the one metric if the scale isn't loaded yet
+    scale = State.parseScale(scale)
+    metrics = ds.metricValues(scale, State.parseMetricID(scale, metricID))
+    return metricSpreadBound(metrics, numGroup) > 2 * sum(metrics) / numGroup * State.tolerance
+
+
+# --- Balancing --------------------------------------------------------------------------------------------------------
+
+balancePasses = 5
+
 
+def groupAdjacency(state: State) -> dict[Group, set[Group]]:
+    # Locked groups don't trade units with anyone
+    free = [group for group in state.groups if group.index not in state.lockedGroups]
+    adjacency = {group: set[Group]() for group in state.groups}
+    for group in free:
+        adjacency[group] = {state.getGroupFor(unit) for unit in group.adj if state.placements[unit] != 0} & set(free)
+    return adjacency
+
+
+def minCostFlow(state: State, adjacency: dict[Group, set[Group]]) -> dict[tuple[Group, Group], float]:
+    # Work out how much metric has to cross each border between groups to bring every group to the average, moving it
+    # over as few borders as possible. Successive shortest paths, where sending back along a border that already
+    # carries flow cancels it out
+    supply = {group: group.metric - state.avgGroupMetric for group in state.groups}
+    flow: dict[tuple[Group, Group], float] = {}
+    epsilon = state.deviation * 1e-3
+
+    def cost(source: Group, sink: Group) -> int:
+        return -1 if flow.get((sink, source), 0) > epsilon else 1
+
+    while any(amount > epsilon for amount in supply.values()):
+        # Bellman-Ford out of every group with metric to spare
+        distance = {group: 0 if supply[group] > epsilon else float("inf") for group in state.groups}
+        previous: dict[Group, Group] = {}
+        for _ in range(len(state.groups)):
+            changed = False
+            for group, dist in distance.items():
+                if dist == float("inf"):
+                    continue
+                for other in adjacency[group]:
+                    if dist + cost(group, other) < distance[other]:
+                        distance[other] = dist + cost(group, other)
+                        previous[other] = group
+                        changed = True
+            if not changed:
+                break
+
+        sinks = [group for group in state.groups if supply[group] < -epsilon and distance[group] < float("inf")]
+        if not sinks:
+            break
+        sink = min(sinks, key=lambda group: (distance[group], group.index))
+
+        # Trace back to the group with spare metric the path started from
+        path = [sink]
+        while path[-1] in previous and len(path) <= len(state.groups):
+            path.append(previous[path[-1]])
+        path.reverse()
+
+        amount = min(supply[path[0]], -supply[sink])
+        for source, dest in zip(path, path[1:]):
+            if cost(source, dest) < 0:
+                amount = min(amount, flow[(dest, source)])
+        for source, dest in zip(path, path[1:]):
+            if cost(source, dest) < 0:
+                flow[(dest, source)] -= amount
+            else:
+                flow[(source, dest)] = flow.get((source, dest), 0) + amount
+        supply[path[0]] -= amount
+        supply[sink] += amount
+
+    return {edge: amount for edge, amount in flow.items() if amount > epsilon}
+
+
+def transfer(state: State, source: Group, dest: Group, amount: float) -> float:
+    # Peel units off the border between two groups, a layer at a time, until about the right amount has moved. Going
+    # over by up to the deviation is fine: that still lands a group short by the amount inside the acceptable range
+    moved = 0.0
+    tolerance = state.deviation
+    while moved < amount - tolerance:
+        layer = sorted(
+            (source.units - state.locked) & dest.adj,
+            key=lambda unit: (dest.distanceSum.get(unit, float("inf")), unit.code),
+        )
+        taken = 0
+        for unit in layer:
+            metric = state.unitMetrics[unit.index]
+            if len(source.units) > 1 and moved + metric <= amount + tolerance and source.canLose(unit):
+                state.addToGroup(unit, dest)
+                moved += metric
+                taken += 1
+        if not taken:
+            break
+
+    return moved
+
+
+def balance(state: State, doPrint: bool = False) -> int:
+    # One global pass: solve for the flow between neighbouring groups, then realize it by moving border units in bulk
+    moves = 0
+    flows = minCostFlow(state, groupAdjacency(state))
+    for (source, dest), amount in sorted(flows.items(), key=lambda item: -item[1]):
+        if amount < state.deviation / 2:
+            continue
+        before = len(dest.units)
+        moved = transfer(state, source, dest, amount)
+        moves += len(dest.units) - before
         if doPrint:
-            print(Log.getPlacementStr(state))
-
-        # If half the units are placed, we can start checking for enclosures
-        if len(state.unplacedUnits) * 2 < len(state.placements):
-            for disconnectedCount in state.generateDisconnectedGroups(group):
-                if doPrint:
-                    unplacedCount = len(disconnectedCount)
-                    longEnough = term_size().columns > unplacedCount * 4 + 12
-                    print(f"{group.index}: enclosed {disconnectedCount if longEnough else f'{unplacedCount} units'}")
-                for unplaced in disconnectedCount:
-                    state.addToGroup(unplaced, group)
-                if doPrint:
-                    Log.state(state)
+            print(f"{dest.index}: Took {Log.numWithPercent(state, moved)} from {source.index}")
+
+    return moves
+
+
+def swap(state: State, bestSpread: float, doPrint: bool = False) -> float | None:
+    # Exchange one border unit each between two neighbouring groups, for when every single move would overshoot. All
+    # pairs along a border are scored together, then the best one that narrows the spread below the given one and keeps
+    # both groups connected is made. Returns the new spread, if a swap was made
+    candidates = []
+    for group, neighbours in groupAdjacency(state).items():
+        for other in (other for other in neighbours if other.index > group.index):
+            rest = [g.metric for g in state.groups if g is not group and g is not other]
+            restMax, restMin = max(rest, default=float("-inf")), min(rest, default=float("inf"))
+
+            outgoing = sorted((group.units - state.locked) & other.adj, key=lambda unit: unit.code)
+            incoming = sorted((other.units - state.locked) & group.adj, key=lambda unit: unit.code)
+            outMetrics = [state.unitMetrics[unit.index] for unit in outgoing]
+            outDistances = [other.distanceSum.get(unit, 0) for unit in outgoing]
+            inMetrics = [state.unitMetrics[unit.index] for unit in incoming]
+            inDistances = [group.distanceSum.get(unit, 0) for unit in incoming]
+            for j, inMetric in enumerate(inMetrics):
+                for i, outMetric in enumerate(outMetrics):
+                    newMetric = group.metric - outMetric + inMetric
+                    newOther = other.metric + outMetric - inMetric
+                    spread = max(restMax, newMetric, newOther) - min(restMin, newMetric, newOther)
+                    if spread < bestSpread:
+                        candidates.append(
+                            (spread, outDistances[i] + inDistances[j], outgoing[i], incoming[j], group, other)
+                        )
+
+    for spread, _, out, into, group, other in sorted(
+        candidates, key=lambda candidate: (candidate[0], candidate[1], candidate[2].code, candidate[3].code)
+    ):
+        # Each unit has to keep touching the rest of the group it joins, and the group it leaves has to stay in one
+        # piece - counting the unit that replaces it
+        if (
+            into.adj & (group.units - {out})
+            and out.adj & (other.units - {into})
+            and Group.connectedWithout((out.adj & group.units) | (out.adj & {into}), out)
+            and Group.connectedWithout((into.adj & other.units) | (into.adj & {out}), into)
+        ):
+            if doPrint:
+                print(f"{group.index}: Swapping {out} for {into} from {other.index}")
+            state.addToGroup(out, other)
+            state.addToGroup(into, group)
+            return spread
 
-        return state, unit, group.index, prevPlacement
+    return None
 
-    return state, None, None, None
+
+# --- Beam search ------------------------------------------------------------------------------------------------------
+
+compactnessWeight = 0.1
+
+
+def score(state: State) -> float:
+    # Lower is better. While units are still unplaced, only groups that have already overshot count against a state,
+    # since the rest can still grow; once everything is placed, the spread does. Either way, as a fraction of the
+    # average, plus how far apart each group's units are on average
+    metrics = [group.metric for group in state.groups]
+    if state.unplacedUnits:
+        imbalance = sum(max(0, metric - state.avgGroupMetric - state.deviation) for metric in metrics)
+    else:
+        imbalance = max(metrics) - min(metrics)
+    pairs = sum(len(group.units) ** 2 for group in state.groups)
+    distances = sum(group.distanceSum.get(unit, 0) for group in state.groups for unit in group.units)
+    return imbalance / state.avgGroupMetric + compactnessWeight * (distances / pairs if pairs else 0)
+
+
+def beamSearch(
+    state: State,
+    width: int,
+    doPrint: bool = False,
+    timeBudget: float | None = None,
+    maxSteps: int | None = None,
+    progress: Callable[[State, int], None] | None = None,
+) -> State:
+    # Rather than committing to the single best move, try the best few moves from each of the best few states. States
+    # reached by different routes are only kept once, and never revisited. Once any state has everything placed, the
+    # regular solver takes over. Every round of the beam counts as a step; with a budget, only the best state left in
+    # the beam is finished off, with whatever budget remains. The plain solver's own run is kept going alongside, one
+    # move per round, and finished off first, so a beam never ends up with a worse plan than beamWidth=1 would
+    steps = 0
+    lastProgress = start = perf_counter()
+    deadline = start + timeBudget if timeBudget is not None else None
+    budgeted = timeBudget is not None or maxSteps is not None
+
+    def expired() -> bool:
+        return (maxSteps is not None and steps >= maxSteps) or (deadline is not None and perf_counter() >= deadline)
+
+    # Branches that get dropped shouldn't be reported, so the callback only hears about the state that wins
+    callback, state._callback = state._callback, None
+    beam: list[tuple[State, list[tuple[Unit, int, int]]]] = [(state, [])]
+    greedy, greedyMoves, greedySteps, greedyDone = state, list[tuple[Unit, int, int]](), 0, False
+    seen = {state.placementHash}
+    for _ in range(2 * len(state.placements)):
+        if not all(current.unplacedUnits for current, _ in beam) or expired():
+            break
+        steps += 1
+
+        # The move the plain solver would make, until it runs out of units to place
+        if not greedyDone:
+            greedySteps += 1
+            greedy, unit, placement, prevPlacement = doStep(greedy.fork(), greedyMoves)
+            if unit and placement and prevPlacement is not None:
+                greedyMoves = (greedyMoves + [(unit, placement, prevPlacement)])[-5:]
+            greedyDone = not unit or not greedy.unplacedUnits
+
+        candidates: dict[int, tuple[float, State, list[tuple[Unit, int, int]]]] = {}
+        for current, previousMoves in beam:
+            tried = 0
+            for unit, group in getNext(current):
+                if not unit or tried >= width:
+                    break
+                elif (move := (unit, current.placements[unit], group.index)) in previousMoves:
+                    continue
+
+                tried += 1
+                child = current.fork()
+                applyMove(child, unit, group)
+                if child.placementHash not in seen and child.placementHash not in candidates:
+                    candidates[child.placementHash] = (score(child), child, (previousMoves + [move])[-5:])
+
+        if not candidates:
+            break
+        ranked = sorted(candidates.values(), key=lambda candidate: candidate[0])[:width]
+        seen.update(child.placementHash for _, child, _ in ranked)
+        beam = [(child, moves) for _, child, moves in ranked]
+        if doPrint:
+            print(f"Beam: {len(beam[0][0].unplacedUnits)} unplaced, best score {ranked[0][0]:.4f}")
+        if progress and (now := perf_counter()) - lastProgress >= progressInterval:
+            lastProgress = now
+            progress(beam[0][0], steps)
+
+    # The plain run is finished off first, carrying on exactly as it would have on its own, then the beam. The finished
+    # plan with the smallest spread wins, the plain run on a tie
+    greedy.detach()
+    timeLeft = max(0, deadline - perf_counter()) if deadline is not None else None
+    finished = [
+        iterate(greedy, doPrint, timeLeft, maxSteps, progress, resume=Checkpoint(greedy, greedyMoves, 0, greedySteps))
+    ]
+    for current, _ in beam[:1] if budgeted else beam:
+        if current is greedy:
+            continue
+        current.detach()
+        timeLeft = max(0, deadline - perf_counter()) if deadline is not None else None
+        stepsLeft = maxSteps - steps if maxSteps is not None else None
+        finished.append(iterate(current, doPrint, timeLeft, stepsLeft, progress))
+    best = min(finished, key=lambda current: (quality(current), score(current)))
+    if callback:
+        best._callback = callback
+        for unit, placement in best.placements.items():
+            if placement:
+                callback(unit.code, placement)
+    return best
+
+
+# --- Entry points -----------------------------------------------------------------------------------------------------
+
+progressInterval = 0.5
+checkpointInterval = 30.0
+
+
+def quality(state: State) -> tuple[int, float]:
+    # For picking the best state seen: fewer units unplaced first, then a smaller spread
+    return len(state.unplacedUnits), max(state.groups).metric - min(state.groups).metric
+
+
+def warmStart(
+    state: State,
+    placements: dict[Unit | str, int],
+    doPrint: bool = False,
+    locked: Iterable[Unit | str] = (),
+    lockedGroups: Iterable[int] = (),
+) -> State:
+    # Start from an existing plan rather than from scratch, with any of its units or groups locked in place. Groups the
+    # plan has no units for are carved out of the largest free group that has at least two free units to split, so the
+    # group they come out of is never left empty, and anything that ends up cut off is unplaced for the solver to sort
+    # out
+    state.placeAll(placements)
+    state.lock(locked, lockedGroups)
+    free = [group for group in state.groups if group.index not in state.lockedGroups]
+    for group in free:
+        if not group.empty:
+            continue
+        elif splittable := [other for other in free if len(other.units - state.locked) >= 2]:
+            largest = max(splittable)
+            byCode = {unit.code: unit for unit in largest.units - state.locked}
+            (kept, _), (codes, _) = bisection.bisect(state.scale, state.metricID, list(byCode), 2)
+            assert kept and codes, f"Splitting group {largest.index} left one half empty"
+            if doPrint:
+                print(f"Splitting {len(codes)} units off group {largest.index} into group {group.index}")
+            for code in codes:
+                state.addToGroup(byCode[code], state.groups[group.index - 1])
+    return reconnectLocked(unplaceStrays(state))
 
 
 def solve(
@@ -90,19 +504,142 @@ def solve(
     scale: str | int = 0,
     callback: Callable[[str, int], None] | None = None,
     doPrint: bool = False,
+    beamWidth: int = 1,
+    timeBudget: float | None = None,
+    maxSteps: int | None = None,
+    progress: Callable[[State, int], None] | None = None,
+    checkpoint: str | None = None,
+    initial: dict[Unit | str, int] | None = None,
+    locked: Iterable[Unit | str] = (),
+    lockedGroups: Iterable[int] = (),
 ) -> State:
-    # Start the solver!
+    # Pick up from the checkpoint if there is one, or from the initial plan if given, otherwise start the solver! Units
+    # and groups of the initial plan can be locked, so only the rest of the map is re-solved
+    if checkpoint and beamWidth > 1:
+        raise ValueError("A beam of states can't be checkpointed: solve with beamWidth=1 to use a checkpoint")
+    if checkpoint and exists(checkpoint):
+        resume = Checkpoint.read(checkpoint, callback)
+        scale = State.parseScale(scale)
+        wanted = (numGroup, State.parseMetricID(scale, metricID), scale)
+        if (found := (len(resume.state.groups), resume.state.metricID, resume.state.scale)) != wanted:
+            raise ValueError(f"{checkpoint} is a solve for {found}, not {wanted}")
+        return iterate(resume.state, doPrint, timeBudget, maxSteps, progress, checkpoint, resume)
+
     state: State = State(numGroup=numGroup, metricID=metricID, scale=scale, callback=callback)
-    previousMoves: list[tuple[Unit, int, int]] = []
-    while state.unplacedUnits or any(group.metric < state.avgGroupMetric - state.deviation for group in state.groups):
+    if initial:
+        state = warmStart(state, initial, doPrint, locked, lockedGroups)
+    if beamWidth > 1:
+        return beamSearch(state, beamWidth, doPrint, timeBudget, maxSteps, progress)
+    return iterate(state, doPrint, timeBudget, maxSteps, progress, checkpoint)
+
+
+def solveResult(numGroup: int, metricID: str | int = 0, scale: str | int = 0, **options) -> SolveResult:
+    # solve() for running in another process: only the compact result has to be sent back
+    start = perf_counter()
+    state = solve(numGroup, metricID, scale, **options)
+    return SolveResult(state, perf_counter() - start)
+
+
+def iterate(
+    state: State,
+    doPrint: bool = False,
+    timeBudget: float | None = None,
+    maxSteps: int | None = None,
+    progress: Callable[[State, int], None] | None = None,
+    checkpoint: str | None = None,
+    resume: Checkpoint | None = None,
+) -> State:
+    # Place and steal units until every group is acceptably sized, starting from whatever the state already holds. If
+    # the time or step budget runs out first, go back to the best state seen. Moves since then are journalled, so
+    # getting back is cheap. With a checkpoint path, progress is saved there every so often and once done, along with
+    # the phase the solve is in, so a resumed solve carries on with whatever it was doing
+    previousMoves: list[tuple[Unit, int, int]] = resume.previousMoves if resume else []
+    passes = resume.passes if resume else 0
+    phase = resume.phase if resume else "greedy"
+    spread = resume.spread if resume else 0.0
+    bound = spreadBound(state)
+
+    steps = resume.steps if resume else 0
+    lastProgress = lastCheckpoint = start = perf_counter()
+    deadline = start + timeBudget if timeBudget is not None else None
+    best = quality(state)
+    state.journal = []
+
+    def expired() -> bool:
+        return (maxSteps is not None and steps >= maxSteps) or (deadline is not None and perf_counter() >= deadline)
+
+    def save():
+        current = spread if phase == "swap" else max(state.groups).metric - min(state.groups).metric
+        Checkpoint(state, previousMoves, passes, steps, phase=phase, spread=current).write(checkpoint)
+
+    def record():
+        nonlocal best, lastProgress, lastCheckpoint
+        if (current := quality(state)) <= best:
+            best = current
+            state.journal.clear()
+        if progress and (now := perf_counter()) - lastProgress >= progressInterval:
+            lastProgress = now
+            progress(state, steps)
+        if checkpoint and (now := perf_counter()) - lastCheckpoint >= checkpointInterval:
+            lastCheckpoint = now
+            save()
+
+    while phase == "greedy":
+        if not state.unplacedUnits and all(
+            group.metric >= state.avgGroupMetric - state.deviation
+            for group in state.groups
+            if group.index not in state.lockedGroups
+        ):
+            phase = "done"
+            break
+
+        if expired():
+            # The checkpoint gets the state as it is, so a resume carries on from here rather than from the best state
+            if checkpoint:
+                save()
+            if quality(state) > best:
+                state.rewind()
+            break
+
+        # Nothing can beat a plan that's already down to the lower bound
+        if not state.unplacedUnits and max(state.groups).metric - min(state.groups).metric <= bound:
+            phase = "done"
+            break
+
+        # Once everything is placed, fix the imbalance with a few global passes before falling back to single steals
+        steps += 1
+        if not state.unplacedUnits and passes < balancePasses:
+            passes += 1
+            if balance(state, doPrint):
+                record()
+                continue
+            passes = balancePasses
+
         state, unit, placement, prevPlacement = doStep(state, previousMoves, doPrint)
         if not unit or not placement or prevPlacement == None:
+            # No single move left to make, so exchange pairs of units for as long as that narrows the spread
+            phase = "done" if state.unplacedUnits else "swap"
+            spread = max(state.groups).metric - min(state.groups).metric
             break
 
         previousMoves.append((unit, placement, prevPlacement))
         if len(previousMoves) > 5:
             previousMoves.pop(0)
-
+        record()
+
+    if phase == "swap":
+        while not expired():
+            if (swapped := swap(state, spread, doPrint)) is None:
+                phase = "done"
+                break
+            spread = swapped
+            steps += 1
+            record()
+
+    state.journal = None
+    # A solve that ran out of budget in the main loop has already saved where it stopped
+    if checkpoint and phase != "greedy":
+        save()
     return state
 
 
@@ -155,7 +692,7 @@ class Log:
             results.append(
                 (
                     "Unplaced",
-                    Log.percent(state, sum(unit.metric for unit in state.unplacedUnits)),
+                    Log.percent(state, sum(state.unitMetrics[unit.index] for unit in state.unplacedUnits)),
                     Log.joinedUnits(state.unplacedUnits),
                     f"{count} units ({100 * (count / len(state.placements)):.2f}% of total)",
                 )
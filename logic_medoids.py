@@ -0,0 +1,115 @@
+from heapq import heappop, heappush
+from random import Random
+from typing import Callable
+
+import data_structs as ds
+import logic_iterative as logic
+from data_structs import State, Unit, Group
+
+# --- Medoids ----------------------------------------------------------------------------------------------------------
+
+
+def hops(medoid: Unit, unit: Unit, unreachable: int) -> int:
+    return 0 if unit is medoid else medoid.distances.get(unit, unreachable)
+
+
+def initialMedoids(state: State, rng: Random) -> list[Unit]:
+    # k-medoids++ over the biggest connected piece of the map: each new medoid is drawn weighted by its metric and by
+    # how far it is from the medoids so far. Outlying pieces get picked up by the regular solver afterwards
+    hub = max(ds.unitlist(state.scale), key=lambda unit: (len(unit.distances), unit.code))
+    units = sorted(hub.distances, key=lambda unit: unit.code) + [hub]
+    metric = state.unitMetrics
+    medoids = [rng.choices(units, weights=[metric[unit.index] + 1e-9 for unit in units])[0]]
+    while len(medoids) < len(state.groups):
+        weights = [metric[unit.index] * min(hops(medoid, unit, 0) for medoid in medoids) ** 2 for unit in units]
+        if sum(weights) <= 0:
+            weights = [float(unit not in medoids) for unit in units]
+        medoids.append(rng.choices(units, weights=weights)[0])
+    return medoids
+
+
+def assign(state: State, medoids: list[Unit]) -> dict[Unit, Group | None]:
+    # Hand every unit to the nearest medoid that still has room, nearest first. Groups only reach units bordering what
+    # they already hold, so they come out contiguous. Pieces of the map no medoid can reach are left for the solver
+    units = ds.unitlist(state.scale)
+    unreachable = len(units)
+    capacity = state.avgGroupMetric + state.deviation
+    byCode = {unit.code: unit for unit in units}
+    assignment: dict[Unit, Group | None] = {unit: None for unit in units}
+    loads = [0.0] * len(medoids)
+    metric = state.unitMetrics
+
+    toCheck = [(0, -metric[medoid.index], medoid.code, index) for index, medoid in enumerate(medoids)]
+    while toCheck:
+        _, _, code, index = heappop(toCheck)
+        unit = byCode[code]
+        if assignment[unit] is not None:
+            continue
+        elif loads[index] + metric[unit.index] > capacity and unit is not medoids[index]:
+            continue
+
+        assignment[unit] = state.groups[index]
+        loads[index] += metric[unit.index]
+        for adj in unit.adj:
+            if assignment[adj] is None:
+                heappush(toCheck, (hops(medoids[index], adj, unreachable), -metric[adj.index], adj.code, index))
+
+    # Whatever didn't fit goes to the lightest group it borders, working inwards from the edges of the gaps
+    leftover = [unit for unit in units if assignment[unit] is None]
+    while leftover:
+        remaining = []
+        for unit in leftover:
+            if neighbours := [assignment[adj].index - 1 for adj in unit.adj if assignment[adj] is not None]:
+                index = min(neighbours, key=lambda index: loads[index])
+                assignment[unit] = state.groups[index]
+                loads[index] += metric[unit.index]
+            else:
+                remaining.append(unit)
+        if len(remaining) == len(leftover):
+            break
+        leftover = remaining
+
+    return assignment
+
+
+def updateMedoids(state: State) -> list[Unit]:
+    # The new medoid is the unit the rest of its group is closest to, which the group already keeps track of
+    return [min(group.units, key=lambda unit: (group.distanceSum.get(unit, 0), unit.code)) for group in state.groups]
+
+
+# --- Solver -----------------------------------------------------------------------------------------------------------
+
+
+def solve(
+    numGroup: int,
+    metricID: str | int = 0,
+    scale: str | int = 0,
+    callback: Callable[[str, int], None] | None = None,
+    doPrint: bool = False,
+    seed: int = 0,
+    maxIterations: int = 50,
+) -> State:
+    state = State(numGroup=numGroup, metricID=metricID, scale=scale, callback=callback)
+    medoids = initialMedoids(state, Random(seed))
+
+    # Alternate between assigning units and re-centring groups. Only units that change hands are moved, so the group
+    # aggregates are kept up to date incrementally
+    for iteration in range(maxIterations):
+        for unit, group in assign(state, medoids).items():
+            if group is None:
+                state.removeFromGroup(unit)
+            elif state.placements[unit] != group.index:
+                state.addToGroup(unit, group)
+
+        newMedoids = updateMedoids(state)
+        if doPrint:
+            print(f"Iteration {iteration + 1}: medoids {newMedoids}")
+        if newMedoids == medoids:
+            break
+        medoids = newMedoids
+
+    return logic.iterate(logic.unplaceStrays(state), doPrint)
+
+
+if __name__ == "__main__":
+    logic.Log.state(solve(5, "Population", scale="counties"))
@@ -0,0 +1,168 @@
+from array import array
+from itertools import count
+from random import Random
+from typing import Callable, Sequence
+
+import data_structs as ds
+import logic_iterative as logic
+from data_structs import State, Unit
+
+# --- Coarsening -------------------------------------------------------------------------------------------------------
+
+
+class SuperUnit(Unit):
+    def __init__(self, code: str, children: list[Unit]):
+        super().__init__(code, scale="", name=code)
+        self.children = children
+        self.component = children[0].component
+
+
+_solveIDs = count()
+
+
+def levelName(scale: str, metricID: str, solveID: int, level: int) -> str:
+    # Levels are registered like any other scale, so each solve gets names of its own: solves running side by side in
+    # threads would otherwise replace and unregister each other's levels
+    return f"{scale}#{metricID}.{solveID}.{level}"
+
+
+def coarsen(
+    units: list[Unit],
+    metric: Sequence[float],
+    weights: dict[Unit, dict[Unit, int]],
+    maxMetric: float,
+    level: int,
+    rng: Random,
+    radius: int,
+) -> tuple[list[SuperUnit], array, dict[Unit, dict[Unit, int]]]:
+    # Heavy-edge matching: visit units in random order and pair each with the unmatched neighbour it shares the most
+    # border with, as long as the pair doesn't get too heavy to balance later
+    order = list(units)
+    rng.shuffle(order)
+    matched = set[Unit]()
+    pairs: list[list[Unit]] = []
+    for unit in order:
+        if unit in matched:
+            continue
+        matched.add(unit)
+        candidates = [
+            adj for adj in unit.adj if adj not in matched and metric[unit.index] + metric[adj.index] <= maxMetric
+        ]
+        if candidates:
+            partner = max(candidates, key=lambda adj: (weights[unit][adj], -metric[adj.index]))
+            matched.add(partner)
+            pairs.append([unit, partner])
+        else:
+            pairs.append([unit])
+
+    # A super-unit carries the summed metric of every unit it was built from
+    supers = [SuperUnit(f"L{level}.{i}", children) for i, children in enumerate(pairs)]
+    newMetric = array("d", (sum(metric[child.index] for child in children) for children in pairs))
+    for i, sup in enumerate(supers):
+        sup.index = i
+    parent = {child: sup for sup in supers for child in sup.children}
+
+    # Super-units are adjacent when any of their children are; the edge weight is the number of fine edges between them
+    newWeights: dict[Unit, dict[Unit, int]] = {sup: {} for sup in supers}
+    for sup in supers:
+        for child in sup.children:
+            for adj in child.adj:
+                if (other := parent[adj]) is not sup:
+                    sup.adj.add(other)
+                    newWeights[sup][other] = weights[child][adj] + newWeights[sup].get(other, 0)
+
+    setDistances(supers, radius)
+    return supers, newMetric, newWeights
+
+
+def setDistances(units: list[Unit], radius: int) -> None:
+    # Breadth-first search over plain indices, only as far as radius steps out, so each level costs its size times the
+    # size of a neighbourhood rather than its size squared. Anything further out counts as radius + 1 away, so each
+    # distance is stored less radius + 1: a group's distance sum to a unit is then off by the same amount for every
+    # unit, so the solver ranks units exactly as it would with those far ones filled in, and a missing entry still
+    # ranks last. The offset also keeps every stored distance non-zero
+    index = {unit: i for i, unit in enumerate(units)}
+    adj = [[index[other] for other in unit.adj] for unit in units]
+    for start, unit in enumerate(units):
+        dist = {start: 0}
+        lastRow = [start]
+        for step in range(1, radius + 1):
+            changed = []
+            for i in lastRow:
+                for j in adj[i]:
+                    if j not in dist:
+                        dist[j] = step
+                        changed.append(j)
+            lastRow = changed
+        unit.distances = {units[j]: d - radius - 1 for j, d in dist.items() if d > 0}
+
+
+def buildLevels(
+    scale: str, numGroup: int, metricID: str, coarsestSize: int, seed: int, radius: int = 8
+) -> tuple[list[list[Unit]], list[array]]:
+    units: list[Unit] = ds.unitlist(scale)
+    metric = ds.metricColumn(scale, metricID)
+    maxMetric = sum(metric) / numGroup / 4
+    weights: dict[Unit, dict[Unit, int]] = {unit: {adj: 1 for adj in unit.adj} for unit in units}
+    rng = Random(seed)
+
+    levels = [units]
+    metrics = [metric]
+    while len(levels[-1]) > coarsestSize:
+        supers, metric, weights = coarsen(levels[-1], metrics[-1], weights, maxMetric, len(levels), rng, radius)
+        # Stop once matching stalls - everything left is too heavy or too isolated to pair up
+        if len(supers) > 0.9 * len(levels[-1]):
+            break
+        levels.append(supers)
+        metrics.append(metric)
+
+    return levels, metrics
+
+
+# --- Solver -----------------------------------------------------------------------------------------------------------
+
+
+def project(coarse: State, state: State) -> State:
+    # Place every fine unit in the group its super-unit ended up in
+    for sup, placement in coarse.placements.items():
+        if placement != 0:
+            for child in sup.children:
+                state.addToGroup(child, state.groups[placement - 1])
+    return state
+
+
+def solve(
+    numGroup: int,
+    metricID: str | int = 0,
+    scale: str | int = 0,
+    callback: Callable[[str, int], None] | None = None,
+    doPrint: bool = False,
+    coarsestSize: int | None = None,
+    seed: int = 0,
+    radius: int = 8,
+) -> State:
+    scale = State.parseScale(scale)
+    metricID = State.parseMetricID(scale, metricID)
+    levels, metrics = buildLevels(scale, numGroup, metricID, coarsestSize or max(100, 20 * numGroup), seed, radius)
+
+    # Coarse levels only carry the metric being solved for
+    solveID = next(_solveIDs)
+    names = [scale] + [levelName(scale, metricID, solveID, level) for level in range(1, len(levels))]
+    for name, units, metric in zip(names[1:], levels[1:], metrics[1:]):
+        ds.registerScale(name, units, [metricID], metric)
+
+    try:
+        # Solve the coarsest graph with the regular solver, then refine on the way back down
+        state = logic.solve(numGroup, metricID, names[-1], doPrint=doPrint)
+        for name in reversed(names[:-1]):
+            finer = State(numGroup, metricID, name, callback=callback if name == scale else None)
+            state = logic.iterate(project(state, finer), doPrint)
+    finally:
+        for name in names[1:]:
+            ds.unregisterScale(name)
+
+    return state
+
+
+if __name__ == "__main__":
+    logic.Log.state(solve(5, "Population", scale="counties"))
@@ -0,0 +1,339 @@
+import os
+import queue
+import socket
+import sys
+import threading
+import weakref
+from collections import Counter
+from collections.abc import Mapping
+from statistics import median
+from multiprocessing import AuthenticationError, Pool, current_process
+from multiprocessing.connection import Client, Connection, Listener, answer_challenge, deliver_challenge
+from typing import Iterable, Iterator
+
+import data_structs as ds
+import logic_iterative as logic
+from data_structs import State, SolveResult
+
+# --- Worker pool ------------------------------------------------------------------------------------------------------
+
+# A job is the arguments to solve(): (numGroup, metricID, scale), optionally followed by a dict of its keyword options
+Job = tuple
+
+
+def preload(scales: Iterable[str | int]):
+    for scale in scales:
+        ds.unitlist(State.parseScale(scale))
+
+
+def runJob(job: Job) -> tuple[int, bool, SolveResult]:
+    # Runs in a worker: returns which worker it was and whether it had to load the scale itself along with the result
+    numGroup, metricID, scale, *options = job
+    scale = State.parseScale(scale)
+    cold = not ds.isLoaded(scale)
+    return os.getpid(), cold, logic.solveResult(numGroup, metricID, scale, **dict(options[0] if options else ()))
+
+
+def runTagged(job: Job) -> tuple[Job, tuple[int, bool, SolveResult]]:
+    return job, runJob(job)
+
+
+class Workers:
+    # Bookkeeping shared by every way of running jobs: how many each worker has run and how many scales it had to load
+    processes: int
+
+    def __init__(self):
+        self.jobs: Counter = Counter()
+        self.loads: Counter = Counter()
+
+    def record(self, item: tuple[object, bool, SolveResult]) -> SolveResult:
+        worker, cold, result = item
+        self.jobs[worker] += 1
+        self.loads[worker] += cold
+        return result
+
+    @property
+    def stats(self) -> dict:
+        # How well workers are being reused: jobs run and scales loaded by each worker
+        jobs = sum(self.jobs.values())
+        return {
+            "processes": self.processes,
+            "workers": len(self.jobs),
+            "jobs": jobs,
+            "loads": sum(self.loads.values()),
+            "jobsPerWorker": jobs / len(self.jobs) if self.jobs else 0,
+            "perWorker": {worker: (self.jobs[worker], self.loads[worker]) for worker in self.jobs},
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SolverPool(Workers):
+    # Worker processes that outlive any one sweep. The given scales are loaded in the parent before forking so every
+    # worker starts with them (and loads them itself if processes are spawned rather than forked). Any other scale is
+    # loaded once by each worker that gets a job for it, then kept for every later job
+    def __init__(self, processes: int | None = None, scales: Iterable[str | int] = ()):
+        scales = tuple(scales)
+        preload(scales)
+        self.processes = processes or os.cpu_count()
+        self.pool = Pool(self.processes, preload, (scales,))
+        super().__init__()
+
+    def solve(self, numGroup: int, metricID: str | int = 0, scale: str | int = 0, **options) -> SolveResult:
+        return self.record(self.pool.apply(runJob, ((numGroup, metricID, scale, options),)))
+
+    def map(self, jobs: Iterable[Job]) -> list[SolveResult]:
+        # Results in the same order as the jobs
+        return [self.record(item) for item in self.pool.imap(runJob, jobs)]
+
+    def imap(self, jobs: Iterable[Job]) -> Iterator[SolveResult]:
+        return map(self.record, self.pool.imap(runJob, jobs))
+
+    def imapUnordered(self, jobs: Iterable[Job]) -> Iterator[tuple[Job, SolveResult]]:
+        # Each result as soon as it's done, with the job it came from. Jobs are handed out one at a time, so they start
+        # in the order given
+        for job, item in self.pool.imap_unordered(runTagged, jobs, chunksize=1):
+            yield job, self.record(item)
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+
+# --- Scheduling -------------------------------------------------------------------------------------------------------
+
+
+def jobKey(job: Job) -> Job:
+    # The same solve however it was asked for: scale and metric by name, options as sorted pairs
+    numGroup, metricID, scale, *options = job
+    scale = State.parseScale(scale)
+    return (
+        numGroup,
+        State.parseMetricID(scale, metricID),
+        scale,
+        tuple(sorted(dict(options[0] if options else ()).items(), key=lambda option: option[0])),
+    )
+
+
+def frozen(value: object) -> object:
+    # A hashable stand-in for a job, equal for equal jobs, even when options hold dicts, lists or sets (such as the
+    # initial placements and locks of a warm start)
+    if isinstance(value, Mapping):
+        return frozenset((frozen(key), frozen(item)) for key, item in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(map(frozen, value))
+    if isinstance(value, (list, tuple)):
+        return tuple(map(frozen, value))
+    return value
+
+
+def modelCost(job: Job) -> float:
+    # Relative work for a solve: every unit is weighed against every other, for each group
+    numGroup, _, scale, _ = job
+    return ds.unitCount(scale) ** 2 * numGroup
+
+
+class Scheduler:
+    # Runs sweeps on a SolverPool (or Coordinator) longest job first, so a big job never starts last and leaves the
+    # other workers idle. A job's cost is its own past time when it has run before, otherwise the cost model scaled by
+    # how long past jobs took against it (preferring ones on the same scale). Timings carry over from sweep to sweep,
+    # keyed by each job's frozen() form
+    def __init__(self, pool: Workers, timings: dict[Job, float] | None = None):
+        self.pool = pool
+        self.timings: dict[Job, float] = {} if timings is None else timings
+
+    def estimate(self, job: Job) -> float:
+        if (key := frozen(job)) in self.timings:
+            return self.timings[key]
+        past = [key for key in self.timings if key[2] == job[2]] or list(self.timings)
+        rate = median(self.timings[key] / modelCost(key) for key in past) if past else 1
+        return modelCost(job) * rate
+
+    def order(self, jobs: Iterable[Job]) -> list[Job]:
+        # Identical jobs are only run once
+        unique = {frozen(job): job for job in map(jobKey, jobs)}
+        return sorted(unique.values(), key=self.estimate, reverse=True)
+
+    def sweep(self, jobs: Iterable[Job]) -> Iterator[tuple[Job, SolveResult]]:
+        # Results stream back in the order they finish, each with its (normalised) job
+        for job, result in self.pool.imapUnordered(self.order(jobs)):
+            self.timings[frozen(job)] = result.seconds
+            yield job, result
+
+
+# --- Distributed sweeps -----------------------------------------------------------------------------------------------
+
+# Messages are pickles, so before anything is unpickled, each end of a connection proves to the other that it holds the
+# same key (an HMAC challenge each way). Processes started with multiprocessing share one already; workers on other
+# machines need the same key set in DISTRICTER_AUTHKEY on both ends
+authkeyVariable = "DISTRICTER_AUTHKEY"
+
+
+def defaultAuthkey() -> bytes:
+    return os.environ[authkeyVariable].encode() if authkeyVariable in os.environ else current_process().authkey
+
+
+def serveWorker(address: tuple[str, int], scales: Iterable[str | int] = (), authkey: bytes | None = None):
+    # Run jobs from a coordinator until it says to stop (sends None). The scales are loaded before connecting, so the
+    # worker never holds up a sweep loading them. Errors from a solve go back to the coordinator rather than killing
+    # the worker
+    preload(scales)
+    with Client(address, authkey=authkey or defaultAuthkey()) as connection:
+        connection.send((socket.gethostname(), os.getpid()))
+        while (job := connection.recv()) is not None:
+            try:
+                item = runJob(job)
+            except Exception as error:
+                item = error
+            connection.send(item)
+
+
+class Coordinator(Workers):
+    # Hands jobs out over TCP to workers on any machine, started with serveWorker((host, port)). It has the same methods
+    # as a SolverPool, so a Scheduler (or anything else) can run sweeps on either. A job whose worker dies or times out
+    # is given to another worker, up to retries times. Workers have to be connected before a sweep starts (see
+    # waitForWorkers), and if the last one dies, every sweep still running fails rather than waiting for another. Only
+    # workers with the same authkey are let in
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        retries: int = 2,
+        timeout: float | None = None,
+        authkey: bytes | None = None,
+    ):
+        super().__init__()
+        self.retries = retries
+        self.timeout = timeout
+        self.authkey = authkey or defaultAuthkey()
+        self.tasks: queue.Queue = queue.Queue()
+        self.workers: dict[tuple[str, int], Connection] = {}
+        self.lock = threading.Condition()
+        # The result queues of the sweeps still waiting on results, and of those that have given up on theirs
+        self.sweeps: set[queue.Queue] = set()
+        self.cancelled: weakref.WeakSet[queue.Queue] = weakref.WeakSet()
+        self.closed = False
+        self.server = Listener((host, port))
+        self.address = self.server.address
+        threading.Thread(target=self.accept, daemon=True).start()
+
+    @property
+    def processes(self) -> int:
+        return len(self.workers)
+
+    def accept(self):
+        while True:
+            try:
+                connection = self.server.accept()
+            except OSError:
+                if self.closed:
+                    return
+                continue
+            threading.Thread(target=self.admit, args=(connection,), daemon=True).start()
+
+    def admit(self, connection: Connection):
+        # The key is checked on a thread of its own, so a connection that never answers doesn't hold up the others
+        try:
+            deliver_challenge(connection, self.authkey)
+            answer_challenge(connection, self.authkey)
+            worker = connection.recv()
+        except (OSError, EOFError, AuthenticationError):
+            connection.close()
+            return
+        with self.lock:
+            self.workers[worker] = connection
+            self.lock.notify_all()
+        self.serve(worker, connection)
+
+    def waitForWorkers(self, count: int, timeout: float | None = None) -> bool:
+        with self.lock:
+            return self.lock.wait_for(lambda: len(self.workers) >= count, timeout)
+
+    def serve(self, worker: tuple[str, int], connection: Connection):
+        # Feed one worker jobs until it dies, takes longer than the timeout, or the coordinator closes
+        with connection:
+            while (task := self.tasks.get()) is not None:
+                results, index, job, attempts = task
+                if results in self.cancelled:
+                    continue
+                try:
+                    connection.send(job)
+                    if not connection.poll(self.timeout):
+                        raise TimeoutError(f"{job} took longer than {self.timeout}s")
+                    item = connection.recv()
+                except (OSError, EOFError):
+                    if attempts < self.retries:
+                        self.tasks.put((results, index, job, attempts + 1))
+                    else:
+                        results.put((index, job, ConnectionError(f"Lost the worker for {job} {attempts + 1} times")))
+                    with self.lock:
+                        del self.workers[worker]
+                        if not self.workers:
+                            for waiting in self.sweeps:
+                                waiting.put((None, None, ConnectionError("Every worker has disconnected")))
+                    return
+                if isinstance(item, Exception):
+                    results.put((index, job, item))
+                    continue
+                with self.lock:
+                    result = self.record((worker, *item[1:]))
+                results.put((index, job, result))
+            connection.send(None)
+
+    def run(self, jobs: Iterable[Job]) -> Iterator[tuple[int, Job, SolveResult]]:
+        # Each job's position, the job and its result, as they finish
+        results: queue.Queue = queue.Queue()
+        jobs = list(jobs)
+        if not jobs:
+            return
+        with self.lock:
+            if not self.workers:
+                raise ConnectionError("No workers are connected")
+            self.sweeps.add(results)
+        try:
+            for index, job in enumerate(jobs):
+                self.tasks.put((results, index, job, 0))
+            for _ in jobs:
+                index, job, result = results.get()
+                if isinstance(result, Exception):
+                    raise result
+                yield index, job, result
+        finally:
+            # Whatever of this sweep is still queued is skipped once it's no longer wanted
+            with self.lock:
+                self.sweeps.discard(results)
+                self.cancelled.add(results)
+
+    def solve(self, numGroup: int, metricID: str | int = 0, scale: str | int = 0, **options) -> SolveResult:
+        return self.map([(numGroup, metricID, scale, options)])[0]
+
+    def map(self, jobs: Iterable[Job]) -> list[SolveResult]:
+        # Results in the same order as the jobs
+        return [result for _, _, result in sorted(self.run(jobs), key=lambda item: item[0])]
+
+    def imap(self, jobs: Iterable[Job]) -> Iterator[SolveResult]:
+        return iter(self.map(jobs))
+
+    def imapUnordered(self, jobs: Iterable[Job]) -> Iterator[tuple[Job, SolveResult]]:
+        for _, job, result in self.run(jobs):
+            yield job, result
+
+    def close(self):
+        # Tell every worker to stop once the jobs already handed out are done
+        for _ in range(len(self.workers)):
+            self.tasks.put(None)
+        self.closed = True
+        self.server.close()
+
+
+if __name__ == "__main__":
+    # python logic_parallel.py host:port [scale ...] runs a worker for the coordinator at host:port, which has to have
+    # the key in DISTRICTER_AUTHKEY
+    if authkeyVariable not in os.environ:
+        sys.exit(f"Set {authkeyVariable} to the coordinator's authkey")
+    host, port = sys.argv[1].rsplit(":", 1)
+    serveWorker((host, int(port)), sys.argv[2:])
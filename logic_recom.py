@@ -0,0 +1,226 @@
+from array import array
+from multiprocessing import Pool
+from random import Random
+from time import perf_counter
+
+import data_structs as ds
+import logic_iterative as logic
+from data_structs import State
+
+# --- Shared graph -----------------------------------------------------------------------------------------------------
+
+
+class Graph:
+    # A read-only, array-backed copy of a scale for one metric. It's built once in the parent, and forked workers
+    # share its pages rather than each rebuilding the unit graph
+    def __init__(self, scale: str, metricID: str):
+        units = ds.unitlist(scale)
+        self.scale = scale
+        self.metricID = metricID
+        self.codes = [unit.code for unit in units]
+        self.indptr = array("i", [0])
+        self.indices = array("i")
+        for unit in units:
+            self.indices.extend(sorted(adj.index for adj in unit.adj))
+            self.indptr.append(len(self.indices))
+        self.metric = ds.metricColumn(scale, metricID)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def neighbours(self, i: int) -> array:
+        return self.indices[self.indptr[i] : self.indptr[i + 1]]
+
+
+_graph: Graph | None = None
+
+
+def attach(graph: Graph):
+    global _graph
+    _graph = graph
+
+
+# --- Chain ------------------------------------------------------------------------------------------------------------
+
+
+def pieces(graph: Graph, nodes: list[int], inside: bytearray) -> list[list[int]]:
+    # Connected pieces of the marked nodes, biggest first
+    seen = bytearray(len(graph))
+    result = []
+    for start in nodes:
+        if seen[start]:
+            continue
+        seen[start] = 1
+        piece = [start]
+        for i in piece:
+            for j in graph.neighbours(i):
+                if inside[j] and not seen[j]:
+                    seen[j] = 1
+                    piece.append(j)
+        result.append(piece)
+    return sorted(result, key=len, reverse=True)
+
+
+def spanningTree(graph: Graph, nodes: list[int], inside: bytearray, rng: Random) -> dict[int, list[int]]:
+    # Minimum spanning tree under random edge weights (Kruskal), as adjacency lists
+    edges = sorted((rng.random(), i, j) for i in nodes for j in graph.neighbours(i) if j > i and inside[j])
+    parent = {i: i for i in nodes}
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    tree: dict[int, list[int]] = {i: [] for i in nodes}
+    for _, i, j in edges:
+        if (rootI := find(i)) != (rootJ := find(j)):
+            parent[rootI] = rootJ
+            tree[i].append(j)
+            tree[j].append(i)
+    return tree
+
+
+def recombine(graph: Graph, plan: array, numGroup: int, tolerance: float, rng: Random, tries: int = 10) -> bool:
+    # One ReCom step: merge two neighbouring groups, draw a random spanning tree over them and cut it somewhere that
+    # leaves both sides balanced. Returns whether a balanced cut was found
+    cutEdges = [(i, j) for i in range(len(graph)) for j in graph.neighbours(i) if j > i and plan[i] != plan[j]]
+    if not cutEdges:
+        return False
+    i, j = rng.choice(cutEdges)
+    groupA, groupB = plan[i], plan[j]
+
+    merged = [k for k in range(len(graph)) if plan[k] == groupA or plan[k] == groupB]
+    inside = bytearray(len(graph))
+    for k in merged:
+        inside[k] = 1
+
+    # Only the piece the chosen edge sits in gets redrawn; outlying pieces keep their groups
+    piece = next(piece for piece in pieces(graph, merged, inside) if i in piece)
+    pieceSet = set(piece)
+    extraA = sum(graph.metric[k] for k in merged if plan[k] == groupA and k not in pieceSet)
+    extraB = sum(graph.metric[k] for k in merged if plan[k] == groupB and k not in pieceSet)
+    total = sum(graph.metric[k] for k in piece)
+    target = (sum(graph.metric) / numGroup) if numGroup else 0
+    low, high = target * (1 - tolerance), target * (1 + tolerance)
+
+    inside = bytearray(len(graph))
+    for k in piece:
+        inside[k] = 1
+
+    for _ in range(tries):
+        tree = spanningTree(graph, piece, inside, rng)
+
+        # Walk the tree from its root, then total up each subtree from the leaves in
+        root = piece[0]
+        parent = {root: -1}
+        order = [root]
+        for k in order:
+            for child in tree[k]:
+                if child not in parent:
+                    parent[child] = k
+                    order.append(child)
+        subtotal = {k: graph.metric[k] for k in order}
+        for k in reversed(order[1:]):
+            subtotal[parent[k]] += subtotal[k]
+
+        cuts = []
+        for k in order[1:]:
+            for side, other, extraSide, extraOther in (
+                (groupA, groupB, extraA, extraB),
+                (groupB, groupA, extraB, extraA),
+            ):
+                if low <= subtotal[k] + extraSide <= high and low <= total - subtotal[k] + extraOther <= high:
+                    cuts.append((k, side, other))
+        if not cuts:
+            continue
+
+        cut, side, other = rng.choice(cuts)
+        for k in piece:
+            plan[k] = other
+        toCheck = [cut]
+        for k in toCheck:
+            plan[k] = side
+            toCheck.extend(child for child in tree[k] if child != parent[k])
+        return True
+
+    return False
+
+
+def runChain(initial: array, numGroup: int, steps: int, seed: int, tolerance: float) -> tuple[list[array], int, float]:
+    # Runs in a worker against the shared graph. Rejected steps repeat the current plan, as usual for a Markov chain
+    rng = Random(seed)
+    plan = array("H", initial)
+    plans = []
+    accepted = 0
+    start = perf_counter()
+    for _ in range(steps):
+        accepted += recombine(_graph, plan, numGroup, tolerance, rng)
+        plans.append(array("H", plan))
+    return plans, accepted, perf_counter() - start
+
+
+# --- Ensemble ---------------------------------------------------------------------------------------------------------
+
+
+class Ensemble:
+    def __init__(self, graph: Graph, plans: list[array], proposed: int, accepted: int, seconds: float):
+        self.codes = graph.codes
+        self.plans = plans
+        self.proposed = proposed
+        self.accepted = accepted
+        self.seconds = seconds
+
+    @property
+    def acceptanceRate(self) -> float:
+        return self.accepted / self.proposed if self.proposed else 0
+
+    @property
+    def plansPerSecond(self) -> float:
+        return len(self.plans) / self.seconds if self.seconds else 0
+
+    def placements(self, plan: int) -> dict[str, int]:
+        return dict(zip(self.codes, self.plans[plan]))
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self.plans)} plans in {self.seconds:.2f}s ({self.plansPerSecond:,.1f} plans/s), "
+            f"{100 * self.acceptanceRate:.1f}% of proposals accepted"
+        )
+
+
+def ensemble(
+    numGroup: int,
+    metricID: str | int = 0,
+    scale: str | int = 0,
+    steps: int = 1000,
+    chains: int = 4,
+    seed: int = 0,
+    tolerance: float = 0.05,
+    processes: int | None = None,
+    initial: State | None = None,
+) -> Ensemble:
+    scale = State.parseScale(scale)
+    metricID = State.parseMetricID(scale, metricID)
+
+    # Every chain starts from the same solved plan
+    state = initial or logic.solve(numGroup, metricID, scale)
+    plan = array("H", (state.placements[unit] for unit in ds.unitlist(scale)))
+    graph = Graph(scale, metricID)
+    jobs = [(plan, numGroup, steps, seed + chain, tolerance) for chain in range(chains)]
+
+    start = perf_counter()
+    if processes == 1:
+        attach(graph)
+        results = [runChain(*job) for job in jobs]
+    else:
+        with Pool(processes, initializer=attach, initargs=(graph,)) as pool:
+            results = pool.starmap(runChain, jobs)
+    seconds = perf_counter() - start
+
+    plans = [plan for chainPlans, _, _ in results for plan in chainPlans]
+    return Ensemble(graph, plans, steps * chains, sum(accepted for _, accepted, _ in results), seconds)
+
+
+if __name__ == "__main__":
+    print(ensemble(5, "Population", "states", steps=1000))
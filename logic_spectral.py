@@ -0,0 +1,197 @@
+from array import array
+from itertools import chain
+from math import copysign, hypot, sqrt
+from operator import mul
+from random import Random
+from typing import Callable
+
+import data_structs as ds
+import logic_iterative as logic
+from data_structs import State, Unit
+
+# --- Globals ----------------------------------------------------------------------------------------------------------
+
+_eigenvectors: dict[str, list[list[float]]] = {}
+
+
+def eigenvectors(scale: str, count: int) -> list[list[float]]:
+    # The embedding only depends on the map, so it's shared by every metric and group count on a scale
+    global _eigenvectors
+    if len(_eigenvectors.get(scale, [])) < count:
+        _eigenvectors[scale] = fiedlerVectors(ds.unitlist(scale), count)
+    return _eigenvectors[scale][:count]
+
+
+# --- Linear algebra ---------------------------------------------------------------------------------------------------
+
+
+def dot(a: list[float], b: list[float]) -> float:
+    return sum(map(mul, a, b))
+
+
+def laplacian(units: list[Unit]) -> tuple[array, array, array]:
+    # Compressed sparse rows of the adjacency, plus the degree of each unit: L = D - A
+    index = {unit: i for i, unit in enumerate(units)}
+    indptr = array("i", [0])
+    indices = array("i")
+    for unit in units:
+        indices.extend(sorted(index[adj] for adj in unit.adj))
+        indptr.append(len(indices))
+    degrees = array("d", (indptr[i + 1] - indptr[i] for i in range(len(units))))
+    return indptr, indices, degrees
+
+
+def tridiagonalEigen(diag: list[float], offDiag: list[float]) -> tuple[list[float], list[list[float]]]:
+    # Implicit QL on a symmetric tridiagonal matrix. Returns the eigenvalues and, for each, its eigenvector
+    size = len(diag)
+    d = list(diag)
+    e = list(offDiag) + [0.0]
+    vectors = [[float(i == j) for i in range(size)] for j in range(size)]
+    for low in range(size):
+        for _ in range(64):
+            high = low
+            while high < size - 1 and abs(e[high]) > 1e-14 * (abs(d[high]) + abs(d[high + 1])):
+                high += 1
+            if high == low:
+                break
+
+            g = (d[low + 1] - d[low]) / (2.0 * e[low])
+            g = d[high] - d[low] + e[low] / (g + copysign(hypot(g, 1.0), g))
+            s = c = 1.0
+            p = 0.0
+            for i in range(high - 1, low - 1, -1):
+                f = s * e[i]
+                b = c * e[i]
+                e[i + 1] = r = hypot(f, g)
+                if r == 0.0:
+                    d[i + 1] -= p
+                    e[high] = 0.0
+                    break
+                s = f / r
+                c = g / r
+                g = d[i + 1] - p
+                r = (d[i] - g) * s + 2.0 * c * b
+                p = s * r
+                d[i + 1] = g + p
+                g = c * r - b
+                left, right = vectors[i], vectors[i + 1]
+                vectors[i + 1] = [s * x + c * y for x, y in zip(left, right)]
+                vectors[i] = [c * x - s * y for x, y in zip(left, right)]
+            else:
+                d[low] -= p
+                e[low] = g
+                e[high] = 0.0
+
+    return d, vectors
+
+
+def fiedlerVectors(units: list[Unit], count: int, steps: int = 120) -> list[list[float]]:
+    # The eigenvectors of the graph Laplacian with the smallest non-trivial eigenvalues, found with Lanczos
+    indptr, indices, degrees = laplacian(units)
+    size = len(units)
+
+    def matvec(x: list[float]) -> list[float]:
+        return [degrees[i] * x[i] - sum(x[j] for j in indices[indptr[i] : indptr[i + 1]]) for i in range(size)]
+
+    # Constant vectors on each connected piece of the map are the trivial eigenvectors - keep everything away from them
+    trivial = []
+    unseen = set(range(size))
+    while unseen:
+        members = [unseen.pop()]
+        for i in members:
+            for j in indices[indptr[i] : indptr[i + 1]]:
+                if j in unseen:
+                    unseen.remove(j)
+                    members.append(j)
+        vector = [0.0] * size
+        for i in members:
+            vector[i] = 1 / sqrt(len(members))
+        trivial.append(vector)
+
+    rng = Random(0)
+    q = [rng.random() - 0.5 for _ in range(size)]
+    basis: list[list[float]] = []
+    alpha: list[float] = []
+    beta: list[float] = []
+    for _ in range(min(steps, size - len(trivial))):
+        # Full reorthogonalization is affordable at this size and keeps the basis honest
+        for vector in chain(trivial, basis):
+            c = dot(q, vector)
+            q = [x - c * y for x, y in zip(q, vector)]
+        norm = sqrt(dot(q, q))
+        if norm < 1e-10:
+            break
+        if basis:
+            beta.append(norm)
+        q = [x / norm for x in q]
+        basis.append(q)
+        w = matvec(q)
+        alpha.append(dot(w, q))
+        q = w
+
+    values, ritz = tridiagonalEigen(alpha, beta)
+    order = sorted(range(len(values)), key=lambda i: values[i])[:count]
+    return [[dot(column, ritz[i]) for column in zip(*basis)] for i in order]
+
+
+# --- Partitioning -----------------------------------------------------------------------------------------------------
+
+
+def partition(state: State, numGroup: int) -> list[list[Unit]]:
+    # Recursive coordinate bisection in the spectral embedding: cut each part across whichever eigenvector spreads it
+    # out the most, at the point where the metric splits floor(k/2):ceil(k/2)
+    units = ds.unitlist(state.scale)
+    metric = state.unitMetrics
+    vectors = eigenvectors(state.scale, max(1, (numGroup - 1).bit_length()))
+
+    parts = [(list(range(len(units))), numGroup)]
+    done: list[list[int]] = []
+    while parts:
+        members, count = parts.pop()
+        if count == 1 or len(members) < 2:
+            done.append(members)
+            continue
+
+        def spread(vector: list[float]) -> float:
+            mean = sum(vector[i] for i in members) / len(members)
+            return sum((vector[i] - mean) ** 2 for i in members)
+
+        axis = max(vectors, key=spread)
+        members.sort(key=lambda i: (axis[i], i))
+        target = sum(metric[i] for i in members) * (count // 2) / count
+        total = 0.0
+        cut = 1
+        for cut, i in enumerate(members[:-1], start=1):
+            total += metric[i]
+            if total >= target:
+                if total - target > metric[i] / 2 and cut > 1:
+                    cut -= 1
+                break
+
+        parts.append((members[:cut], count // 2))
+        parts.append((members[cut:], count - count // 2))
+
+    return [[units[i] for i in members] for members in sorted(done)]
+
+
+# --- Solver -----------------------------------------------------------------------------------------------------------
+
+
+def solve(
+    numGroup: int,
+    metricID: str | int = 0,
+    scale: str | int = 0,
+    callback: Callable[[str, int], None] | None = None,
+    doPrint: bool = False,
+) -> State:
+    # Start from the spectral cut, then let the regular solver repair and balance it
+    state = State(numGroup=numGroup, metricID=metricID, scale=scale, callback=callback)
+    for group, part in zip(state.groups, partition(state, numGroup)):
+        for unit in part:
+            state.addToGroup(unit, group)
+
+    return logic.iterate(logic.unplaceStrays(state), doPrint)
+
+
+if __name__ == "__main__":
+    logic.Log.state(solve(5, "Population", scale="counties"))
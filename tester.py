@@ -1,7 +1,9 @@
 import cProfile
 import pstats
-from multiprocessing import Pool
+from time import perf_counter
 import logic_iterative as logic
+import logic_exact as exact
+import logic_parallel as parallel
 import data_structs as ds
 
 # --- Profiler ---------------------------------------------------------------------------------------------------------
@@ -51,6 +53,10 @@ def profile(string: str):
 def getNextParam(scale: str, range: range):
     for numGroup in range:
         for metricID in ds.metricNames(scale):
+            # Don't bother with configurations no plan could satisfy
+            if logic.isHopelessFor(numGroup, metricID, scale):
+                print(f"Skipping {numGroup} groups with criteria {metricID}: no plan can fit the acceptable range")
+                continue
             yield numGroup, metricID, scale
 
 
@@ -61,10 +67,46 @@ def doTests(scale: str | int, range: range):
         logic.Log.state(logic.solve(numGroup, metricID, scale))
 
 
-def doParallelTests(scale: str | int, range: range):
+def doParallelTests(
+    scale: str | int, range: range, scheduler: parallel.Scheduler | None = None
+) -> list[ds.SolveResult]:
+    # Pass a long-lived scheduler to run many sweeps on the same workers, each ordered by the timings of the last. Its
+    # workers can be a local SolverPool or a Coordinator handing jobs to other machines
     scale = logic.State.parseScale(scale)
-    with Pool(8) as p:
-        p.starmap(logic.solve, getNextParam(scale, range))
+    if scheduler is None:
+        with parallel.SolverPool(8, [scale]) as pool:
+            return doParallelTests(scale, range, parallel.Scheduler(pool))
+    results = []
+    for _, result in scheduler.sweep(getNextParam(scale, range)):
+        print(result)
+        results.append(result)
+    return results
+
+
+def benchmarkBeam(scale: str | int, range: range, widths: tuple[int, ...] = (1, 2, 4), metricID: str | int = 0):
+    # Compare plain solve() (width 1) against beam search on time, spread and compactness
+    scale = logic.State.parseScale(scale)
+    print(f"{'groups':>6} {'width':>5} {'seconds':>8} {'spread':>8} {'score':>8}")
+    for numGroup in range:
+        for width in widths:
+            start = perf_counter()
+            state = logic.solve(numGroup, metricID, scale, beamWidth=width)
+            seconds = perf_counter() - start
+            spread = (max(state.groups).metric - min(state.groups).metric) / state.avgGroupMetric
+            print(f"{numGroup:>6} {width:>5} {seconds:>8.2f} {spread:>8.2%} {logic.score(state):>8.4f}")
+
+
+def benchmarkExact(range: range, metricID: str | int = 0, timeBudget: float = 60):
+    # How far plain solve() lands from the best plan branch and bound can find on states
+    print(f"{'groups':>6} {'solve':>12} {'exact':>12} {'seconds':>8} certified")
+    for numGroup in range:
+        state = logic.solve(numGroup, metricID, "states")
+        spread = max(state.groups).metric - min(state.groups).metric
+        start = perf_counter()
+        state, optimal = exact.search(state, timeBudget)
+        seconds = perf_counter() - start
+        best = max(state.groups).metric - min(state.groups).metric
+        print(f"{numGroup:>6} {spread:>12,.0f} {best:>12,.0f} {seconds:>8.2f} {optimal}")
 
 
 def stepthrough(numGroup: int, metricID: str | int, scale: str | int):
@@ -78,4 +120,7 @@ if __name__ == "__main__":
     # printUnitTestMap()
     # printUnitTestPlacements(logic.solve(2, "T1", "test"))
     # stepthrough(3, "T1", "test")
+    # benchmarkBeam("states", range(2, 9))
+    # benchmarkBeam("counties", range(2, 6))
+    # benchmarkExact(range(2, 7))
     profile("doTests(1, range(1,6))")
@@ -1,7 +1,27 @@
-from os import remove as removeFile
-from itertools import starmap
+from array import array
+import os
+from os import remove as removeFile, utime
+from os.path import getmtime
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, product, starmap
+from multiprocessing import AuthenticationError, Pool, Process
+from multiprocessing.connection import Client, Connection
+from random import Random
+from statistics import median
+import pickle
+import subprocess
+import sys
+import threading
 import unittest
 import logic_iterative as logic
+import logic_multilevel as multilevel
+import logic_bisection as bisection
+import logic_spectral as spectral
+import logic_medoids as medoids
+import logic_recom as recom
+import logic_genetic as genetic
+import logic_exact as exact
+import logic_parallel as parallel
 import data_structs as ds
 
 # --- Unit tests -------------------------------------------------------------------------------------------------------
@@ -9,27 +29,29 @@ import data_structs as ds
 
 class UnitTests(unittest.TestCase):
     def test_init(self):
-        metrics = {"T1": 3.0, "T2": 5}
-        unit = logic.Unit(code="D", metrics=metrics, scale="test")
+        unit = logic.Unit(code="D", scale="test")
         self.assertEqual(unit.code, "D")
-        self.assertEqual(unit.metrics, metrics)
         self.assertEqual(unit.name, "D_Name")
-        self.assertEqual(unit.metric, 3)
+
+    def test_lazyName(self):
+        ds._names.pop("test", None)
+        unit = logic.Unit(code="D", scale="test")
+        self.assertNotIn("test", ds._names)
+        self.assertEqual(unit.name, "D_Name")
+        self.assertEqual(ds._names["test"]["J"], "J_Name")
+        self.assertEqual(logic.Unit(code="D", scale="test", name="Other").name, "Other")
 
     def test_strHelpers(self):
-        unit = logic.Unit(code="D", metrics={"T1": 3.0}, scale="test")
+        unit = logic.Unit(code="D", scale="test")
         self.assertEqual(f"String name: {unit}", "String name: D")
 
-    def test_setMetric(self):
-        metrics = {"T1": 3.0, "T2": 5}
-        unit = logic.Unit(code="D", metrics=metrics, scale="test")
-        self.assertEqual(unit.metric, metrics["T1"])
-        unit.setCurrentMetric("T2")
-        self.assertEqual(unit.metric, metrics["T2"])
+    def test_index(self):
+        units = ds.readFile("test")[0]
+        self.assertEqual([unit.index for unit in units], list(range(10)))
 
     def test_comparison(self):
-        unit1 = logic.Unit(code="D", metrics={"T1": 3.0}, scale="test")
-        unit2 = logic.Unit(code="D", metrics={"T2": 5}, scale="test")
+        unit1 = logic.Unit(code="D", scale="test")
+        unit2 = logic.Unit(code="D", scale="test", name="Other")
         self.assertEqual(unit1, unit2)
         self.assertEqual(unit1, "D")
         self.assertEqual(unit2, "D")
@@ -37,10 +59,10 @@ class UnitTests(unittest.TestCase):
 
 class FileReadTests(unittest.TestCase):
     def test_fileRead(self):
-        unitlist, metricNames = ds.readFile("test")
-        (a, b, c, d, e, f, g, h, i, j) = [logic.Unit(code, {"T1": i}, "test") for i, code in enumerate("ABCDEFGHIJ")]
+        unitlist, metricNames, metrics = ds.readFile("test")
+        a, b, c, d, e, f, g, h, i, j = [logic.Unit(code, "test") for code in "ABCDEFGHIJ"]
         self.assertEqual(unitlist, [a, b, c, d, e, f, g, h, i, j])
-        self.assertEqual([u.metrics["T1"] for u in unitlist], [0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
+        self.assertEqual(list(metrics), [0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
         self.assertEqual(
             [u.adj for u in unitlist],
             [
@@ -58,8 +80,20 @@ class FileReadTests(unittest.TestCase):
         )
         self.assertEqual(metricNames, ["T1"])
 
+    def test_metricColumn(self):
+        self.assertEqual(ds.metricColumn("test", "T1"), ds.array("d", range(10)))
+        population = ds.metricColumn("states", "Population")
+        self.assertEqual(len(population), len(ds.unitlist("states")))
+        self.assertEqual(population[ds.unitlist("states").index("WY")], 567025)
+        self.assertEqual(ds.metricColumn("states", "% Urban")[ds.unitlist("states").index("WY")], 64.8)
+
+    def test_readHeader(self):
+        self.assertEqual(ds.readHeader("test"), (["T1"], 10))
+        units, names, _ = ds.readFile("states")
+        self.assertEqual(ds.readHeader("states"), (names, len(units)))
+
     def test_lazyInit(self):
-        (a, b, c, d, e, f, g, h, i, j) = [logic.Unit(code, {"T1": i}, "test") for i, code in enumerate("ABCDEFGHIJ")]
+        a, b, c, d, e, f, g, h, i, j = [logic.Unit(code, "test") for code in "ABCDEFGHIJ"]
 
         self.assertEqual(ds._unitlists, {})
         self.assertEqual(ds._metricNames, {})
@@ -74,11 +108,13 @@ class FileReadTests(unittest.TestCase):
         ds._unitlists = {}
         ds._metricNames = {}
 
-        # Confirm that both lists are initialized in the opposite direction read
+        # Confirm that metric names and unit counts only need the header, leaving the units unread
         self.assertEqual(ds.metricNames("test"), ["T1"])
-        self.assertEqual(ds._unitlists, {"test": [a, b, c, d, e, f, g, h, i, j]})
+        self.assertEqual(ds.unitCount("test"), 10)
+        self.assertEqual(ds._unitlists, {})
         self.assertEqual(ds._metricNames, {"test": ["T1"]})
         self.assertEqual(ds.unitlist("test"), [a, b, c, d, e, f, g, h, i, j])
+        self.assertEqual(ds._unitlists, {"test": [a, b, c, d, e, f, g, h, i, j]})
 
         # clear lists to try again
         ds._unitlists = {}
@@ -103,28 +139,28 @@ class FileReadTests(unittest.TestCase):
             {"B": 3, "C": 3, "E": 3, "F": 2, "G": 2, "H": 1, "I": 1},
         ]
 
-        _, _ = ds.readFile("test")
-        unitlist, _ = ds.readFile("test")
+        _, _, _ = ds.readFile("test")
+        unitlist, _, _ = ds.readFile("test")
         self.assertEqual([u.distances for u in unitlist], distances)
         removeFile("assets/test/distance.csv")
-        unitlist, _ = ds.readFile("test")
+        unitlist, _, _ = ds.readFile("test")
         self.assertEqual([u.distances for u in unitlist], distances)
 
 
 class GroupTests(unittest.TestCase):
-    unitlist, metricNames = ds.readFile("test")
+    unitlist, metricNames, metrics = ds.readFile("test")
 
     def test_init(self):
-        group = logic.Group(index=0)
+        group = logic.Group(index=0, unitMetrics=GroupTests.metrics)
         self.assertEqual(group.index, 0)
         self.assertEqual(group.metric, 0)
         self.assertTrue(group.empty)
 
     def test_compare(self):
-        (a, b, c, d, e, f, g, h, i, j) = GroupTests.unitlist
-        g1 = logic.Group(index=0)
-        g2 = logic.Group(index=1)
-        g3 = logic.Group(index=2)
+        a, b, c, d, e, f, g, h, i, j = GroupTests.unitlist
+        g1 = logic.Group(index=0, unitMetrics=GroupTests.metrics)
+        g2 = logic.Group(index=1, unitMetrics=GroupTests.metrics)
+        g3 = logic.Group(index=2, unitMetrics=GroupTests.metrics)
 
         self.assertEqual(sorted([g1, g2, g3]), [g1, g2, g3])
 
@@ -133,8 +169,8 @@ class GroupTests(unittest.TestCase):
         self.assertEqual(sorted([g1, g2, g3]), [g1, g3, g2])
 
     def test_isContiguous(self):
-        (a, b, c, d, e, f, g, h, i, j) = GroupTests.unitlist
-        group = logic.Group(index=0)
+        a, b, c, d, e, f, g, h, i, j = GroupTests.unitlist
+        group = logic.Group(index=0, unitMetrics=GroupTests.metrics)
         self.assertTrue(group.isContiguous)
 
         group.addUnit(a)
@@ -168,8 +204,8 @@ class GroupTests(unittest.TestCase):
         self.assertTrue(group.isContiguous)
 
     def test_unitChanges(self):
-        (a, b, c, d, e, f, g, h, i, j) = GroupTests.unitlist
-        group = logic.Group(index=0)
+        a, b, c, d, e, f, g, h, i, j = GroupTests.unitlist
+        group = logic.Group(index=0, unitMetrics=GroupTests.metrics)
 
         self.assertTrue(group.empty)
         self.assertEqual(group.metric, 0)
@@ -220,8 +256,8 @@ class GroupTests(unittest.TestCase):
         self.assertEqual(group.distanceSum, {})
 
     def test_canLose(self):
-        (a, b, c, d, e, f, g, h, i, j) = GroupTests.unitlist
-        group = logic.Group(index=0)
+        a, b, c, d, e, f, g, h, i, j = GroupTests.unitlist
+        group = logic.Group(index=0, unitMetrics=GroupTests.metrics)
         group.addUnit(a)
         group.addUnit(c)
         group.addUnit(g)
@@ -264,8 +300,8 @@ class StateTests(unittest.TestCase):
 
     def test_addToGroup(self):
         state = logic.State(2, "T1", "test")
-        (a, b, c, d, e, f, g, h, i, j) = state.placements.keys()
-        (g1, g2) = state.groups
+        a, b, c, d, e, f, g, h, i, j = state.placements.keys()
+        g1, g2 = state.groups
 
         state.addToGroup(a, g1)
         self.assertEqual(g1.units, {a})
@@ -285,8 +321,8 @@ class StateTests(unittest.TestCase):
 
     def test_groupFor(self):
         state = logic.State(2, "T1", "test")
-        (a, b, c, d, e, f, g, h, i, j) = state.placements.keys()
-        (g1, g2) = state.groups
+        a, b, c, d, e, f, g, h, i, j = state.placements.keys()
+        g1, g2 = state.groups
 
         state.addToGroup(a, g1)
         state.addToGroup(b, g1)
@@ -300,8 +336,8 @@ class StateTests(unittest.TestCase):
 
     def test_anyUnplaced(self):
         state = logic.State(2, "T1", "test")
-        (a, b, c, d, e, f, g, h, i, j) = state.placements.keys()
-        (g1, g2) = state.groups
+        a, b, c, d, e, f, g, h, i, j = state.placements.keys()
+        g1, g2 = state.groups
 
         self.assertFalse(state.hasAnyUnplacedAdjacent(g1))
         g1.addUnit(a)
@@ -313,8 +349,8 @@ class StateTests(unittest.TestCase):
 
     def test_generateDisconnected(self):
         state = logic.State(2, "T1", "test")
-        (a, b, c, d, e, f, g, h, i, j) = state.placements.keys()
-        (g1, g2) = state.groups
+        a, b, c, d, e, f, g, h, i, j = state.placements.keys()
+        g1, g2 = state.groups
 
         state.addToGroup(a, g1)
         state.addToGroup(d, g1)
@@ -376,7 +412,7 @@ class SolverTests(unittest.TestCase):
     # TODO: test more complex scenarios
     def test_getNext(self):
         state = logic.State(1, "T1", "test")
-        (a, b, c, d, e, f, g, h, i, j) = state.placements.keys()
+        a, b, c, d, e, f, g, h, i, j = state.placements.keys()
         expected = {
             1: {"unit": [j, i, h], "group": [0, 0, 0]},
             2: {"unit": [j, i, h], "group": [0, 1, 1]},
@@ -395,7 +431,7 @@ class SolverTests(unittest.TestCase):
     # TODO: test more complex scenarios
     def test_singleGroup(self):
         state = logic.solve(1, "T1", "test")
-        (a, b, c, d, e, f, g, h, i, j) = state.placements.keys()
+        a, b, c, d, e, f, g, h, i, j = state.placements.keys()
         self.assertEqual(state.placements, {a: 1, b: 1, c: 1, d: 1, e: 1, f: 1, g: 1, h: 1, i: 1, j: 1})
 
     def test_valgrind(self):
@@ -420,3 +456,1133 @@ class SolverTests(unittest.TestCase):
                     g.isContiguous,
                     f"Group {g.index} discontiguous for {state.metricID}, {state.scale}, {len(state.groups)}",
                 )
+
+
+class MultilevelTests(unittest.TestCase):
+    def test_coarsen(self):
+        units, _, metric = ds.readFile("test")
+        weights = {unit: {adj: 1 for adj in unit.adj} for unit in units}
+        supers, newMetric, newWeights = multilevel.coarsen(
+            units, metric, weights, float("inf"), 1, multilevel.Random(0), 8
+        )
+
+        # Every unit lands in exactly one super-unit, and metrics are carried up
+        self.assertEqual(sorted(child.code for sup in supers for child in sup.children), list("ABCDEFGHIJ"))
+        self.assertTrue(all(1 <= len(sup.children) <= 2 for sup in supers))
+        self.assertEqual(sum(newMetric), 45)
+        for sup in supers:
+            self.assertEqual(newMetric[sup.index], sum(metric[child.index] for child in sup.children))
+            # Super-units are adjacent exactly when their children are
+            expected = {
+                other for other in supers if other is not sup and any(c.adj & set(other.children) for c in sup.children)
+            }
+            self.assertEqual(sup.adj, expected)
+            self.assertEqual(set(newWeights[sup]), expected)
+
+    def test_solve(self):
+        for numGroup in range(1, 4):
+            state = multilevel.solve(numGroup, "T1", "test", coarsestSize=4)
+            self.assertEqual(state.scale, "test")
+            self.assertEqual(state.unplacedUnits, set())
+            self.assertTrue(all(g.isContiguous for g in state.groups))
+            self.assertEqual(sum(g.metric for g in state.groups), 45)
+
+        # Generated levels don't linger in the scale cache
+        self.assertEqual([scale for scale in ds._unitlists if "#" in scale], [])
+
+    def test_threads(self):
+        # Solves running side by side each keep their own levels
+        jobs = [(numGroup, metricID, "states") for numGroup in (2, 3) for metricID in (0, 1)] * 5
+        expected = [multilevel.solve(*job, coarsestSize=10).placements for job in jobs]
+        # Switch threads often, so the solves interleave
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)
+        try:
+            with ThreadPoolExecutor(4) as executor:
+                results = list(executor.map(lambda job: multilevel.solve(*job, coarsestSize=10).placements, jobs))
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(results, expected)
+        for cache in (ds._unitlists, ds._names, ds._distanceRows):
+            self.assertEqual([scale for scale in cache if "#" in scale], [])
+
+
+class BisectionTests(unittest.TestCase):
+    def test_components(self):
+        a, b, c, d, e, f, g, h, i, j = ds.unitlist("test")
+        self.assertEqual(bisection.components({a, b, c, d, e, f, g, h, i, j}), [{b, c, e, f, g, h, i, j}, {a, d}])
+        self.assertEqual(bisection.components({a, b, e, h, i}), [{b, e}, {h, i}, {a}])
+
+    def test_staysConnected(self):
+        a, b, c, d, e, f, g, h, i, j = ds.unitlist("test")
+        self.assertTrue(bisection.staysConnected({b, c, e, f, g, h}, b))
+        self.assertTrue(bisection.staysConnected({b, c, e, f, g}, f))
+        self.assertFalse(bisection.staysConnected({b, c, e, f, g, h, i}, h))
+        self.assertFalse(bisection.staysConnected({e, f, g, h}, f))
+
+        # In a ring, the neighbours of a lost unit only meet the long way round
+        ring = [logic.Unit(str(n), "test", name=str(n)) for n in range(5)]
+        for n, unit in enumerate(ring):
+            unit.adj = {ring[n - 1], ring[(n + 1) % 5]}
+        self.assertFalse(logic.Group.connectedWithout(set(ring), ring[0]))
+        self.assertTrue(bisection.staysConnected(set(ring), ring[0]))
+        self.assertFalse(bisection.staysConnected(set(ring) - {ring[2]}, ring[0]))
+
+    def test_bisect(self):
+        for numGroup in range(2, 6):
+            (codesA, countA), (codesB, countB) = bisection.bisect("test", "T1", list("ABCDEFGHIJ"), numGroup)
+            self.assertEqual((countA, countB), (numGroup // 2, numGroup - numGroup // 2))
+            self.assertEqual(sorted(codesA + codesB), list("ABCDEFGHIJ"))
+            for codes in (codesA, codesB):
+                group = logic.Group(0, ds.metricColumn("test", "T1"))
+                for unit in ds.unitlist("test"):
+                    if unit.code in codes:
+                        group.addUnit(unit)
+                self.assertTrue(group.isContiguous, f"{codes} discontiguous for {numGroup} groups")
+
+    def test_solve(self):
+        for processes in (1, 2):
+            state = bisection.solve(4, "Population", "states", processes=processes)
+            self.assertEqual(state.unplacedUnits, set())
+            self.assertFalse(any(g.empty for g in state.groups))
+            self.assertTrue(all(g.isContiguous for g in state.groups))
+            self.assertEqual(sum(g.metric for g in state.groups), state.sumUnitMetrics)
+
+
+class SpectralTests(unittest.TestCase):
+    def test_laplacian(self):
+        indptr, indices, degrees = spectral.laplacian(ds.unitlist("test"))
+        self.assertEqual(list(degrees), [1, 3, 3, 1, 2, 5, 3, 4, 2, 2])
+        self.assertEqual(list(indices[indptr[7] : indptr[8]]), [5, 6, 8, 9])
+
+    def test_tridiagonalEigen(self):
+        values, vectors = spectral.tridiagonalEigen([2.0, 2.0, 2.0], [1.0, 1.0])
+        for value, expected in zip(sorted(values), [2 - 2**0.5, 2, 2 + 2**0.5]):
+            self.assertAlmostEqual(value, expected)
+        for value, vector in zip(values, vectors):
+            product = [2 * vector[0] + vector[1], vector[0] + 2 * vector[1] + vector[2], vector[1] + 2 * vector[2]]
+            for x, y in zip(product, vector):
+                self.assertAlmostEqual(x, value * y)
+
+    def test_fiedlerVectors(self):
+        units = ds.unitlist("test")
+        indptr, indices, degrees = spectral.laplacian(units)
+        (fiedler,) = spectral.fiedlerVectors(units, 1)
+
+        # Orthogonal to the constant vector on each connected piece of the map, and an eigenvector of the Laplacian
+        self.assertAlmostEqual(fiedler[0] + fiedler[3], 0)
+        self.assertAlmostEqual(sum(fiedler) - fiedler[0] - fiedler[3], 0)
+        product = [
+            degrees[i] * fiedler[i] - sum(fiedler[j] for j in indices[indptr[i] : indptr[i + 1]]) for i in range(10)
+        ]
+        value = spectral.dot(product, fiedler)
+        self.assertGreater(value, 1e-6)
+        for x, y in zip(product, fiedler):
+            self.assertAlmostEqual(x, value * y)
+
+        # The far ends of the map land on opposite sides of the cut
+        self.assertLess(fiedler[1] * fiedler[9], 0)
+
+    def test_partition(self):
+        state = logic.State(3, "T1", "test")
+        parts = spectral.partition(state, 3)
+        self.assertEqual(len(parts), 3)
+        self.assertEqual(sorted(unit.code for part in parts for unit in part), list("ABCDEFGHIJ"))
+        self.assertIn("test", spectral._eigenvectors)
+
+    def test_solve(self):
+        for numGroup in range(1, 6):
+            state = spectral.solve(numGroup, "Population", "states")
+            self.assertEqual(state.unplacedUnits, set())
+            self.assertTrue(all(g.isContiguous for g in state.groups))
+
+
+class StrayTests(unittest.TestCase):
+    def test_unplaceStrays(self):
+        state = logic.State(2, "T1", "test")
+        a, b, c, d, e, f, g, h, i, j = state.placements.keys()
+        g1, g2 = state.groups
+        for unit in (a, b, c, i, j):
+            state.addToGroup(unit, g1)
+        for unit in (e, f):
+            state.addToGroup(unit, g2)
+
+        logic.unplaceStrays(state)
+        # The A piece is on its own part of the map, so it stays; the smaller of the other two pieces goes
+        self.assertEqual(g1.units, {a, i, j})
+        self.assertEqual(g2.units, {e, f})
+        self.assertEqual(state.unplacedUnits, {b, c, d, g, h})
+        self.assertEqual(state.placements[b], 0)
+
+
+class MedoidTests(unittest.TestCase):
+    def test_initialMedoids(self):
+        state = logic.State(3, "T1", "test")
+        chosen = medoids.initialMedoids(state, medoids.Random(0))
+        self.assertEqual(len(set(chosen)), 3)
+        # Seeds come from the biggest connected piece of the map
+        self.assertTrue(all(unit.code not in "AD" for unit in chosen))
+        self.assertEqual(chosen, medoids.initialMedoids(state, medoids.Random(0)))
+
+    def test_assign(self):
+        state = logic.State(2, "T1", "test")
+        a, b, c, d, e, f, g, h, i, j = state.placements.keys()
+        g1, g2 = state.groups
+        assignment = medoids.assign(state, [b, j])
+
+        # Nearest first until full, then leftovers go to the lightest group they border
+        self.assertEqual({unit for unit, group in assignment.items() if group is g1}, {b, c, e, f, g, h})
+        self.assertEqual({unit for unit, group in assignment.items() if group is g2}, {i, j})
+        # Nothing reaches the A-D piece of the map
+        self.assertIsNone(assignment[a])
+        self.assertIsNone(assignment[d])
+
+    def test_updateMedoids(self):
+        state = logic.State(2, "T1", "test")
+        a, b, c, d, e, f, g, h, i, j = state.placements.keys()
+        g1, g2 = state.groups
+        for unit in (b, c, e, f, g):
+            state.addToGroup(unit, g1)
+        for unit in (h, i, j):
+            state.addToGroup(unit, g2)
+        self.assertEqual(medoids.updateMedoids(state), [f, h])
+
+    def test_solve(self):
+        for numGroup in range(1, 6):
+            state = medoids.solve(numGroup, "Population", "states", seed=numGroup)
+            self.assertEqual(state.unplacedUnits, set())
+            self.assertTrue(all(g.isContiguous for g in state.groups))
+
+
+class BalanceTests(unittest.TestCase):
+    def makeState(self) -> logic.State:
+        state = logic.State(3, "T1", "test")
+        a, b, c, d, e, f, g, h, i, j = state.placements.keys()
+        for group, units in zip(state.groups, [(a, b, c, d, e), (f, g), (h, i, j)]):
+            for unit in units:
+                state.addToGroup(unit, group)
+        return state
+
+    def test_groupAdjacency(self):
+        state = self.makeState()
+        g1, g2, g3 = state.groups
+        self.assertEqual(logic.groupAdjacency(state), {g1: {g2}, g2: {g1, g3}, g3: {g2}})
+
+    def test_minCostFlow(self):
+        state = self.makeState()
+        g1, g2, g3 = state.groups
+        flows = logic.minCostFlow(state, logic.groupAdjacency(state))
+        self.assertEqual(set(flows), {(g3, g2), (g2, g1)})
+        self.assertAlmostEqual(flows[(g3, g2)], 9)
+        self.assertAlmostEqual(flows[(g2, g1)], 5)
+
+    def test_transfer(self):
+        state = self.makeState()
+        a, b, c, d, e, f, g, h, i, j = state.placements.keys()
+        g1, g2, g3 = state.groups
+
+        self.assertEqual(logic.transfer(state, g3, g2, 7), 7)
+        self.assertEqual(g2.units, {f, g, h})
+        self.assertEqual(g3.units, {i, j})
+
+        # Overshoots by at most the deviation, and never empties a group
+        self.assertEqual(logic.transfer(state, g2, g1, 5), 5)
+        self.assertEqual(logic.transfer(state, g2, g1, 4), 0)
+        self.assertEqual(logic.transfer(state, g2, g1, 20), 6)
+        self.assertEqual(g2.units, {h})
+        self.assertTrue(all(group.isContiguous for group in state.groups))
+
+    def test_swap(self):
+        state = logic.State(2, "T1", "test")
+        a, b, c, d, e, f, g, h, i, j = state.placements.keys()
+        g1, g2 = state.groups
+        for group, units in zip(state.groups, [(a, b, c, d, e, f), (g, h, i, j)]):
+            for unit in units:
+                state.addToGroup(unit, group)
+
+        # Swapping C or F for H would split a group, so F for G is the best exchange left
+        self.assertEqual(logic.swap(state, 15), 13)
+        self.assertEqual(g1.units, {a, b, c, d, e, g})
+        self.assertEqual(g2.units, {f, h, i, j})
+        self.assertTrue(all(group.isContiguous for group in state.groups))
+        self.assertIsNone(logic.swap(state, 13))
+
+    def test_spreadBound(self):
+        self.assertEqual(logic.spreadBound(logic.State(1, "T1", "test")), 0)
+        self.assertEqual(logic.spreadBound(logic.State(4, "T1", "test")), 0)
+        # J alone outweighs what's left shared between the other seven groups
+        self.assertAlmostEqual(logic.spreadBound(logic.State(8, "T1", "test")), 9 - 36 / 7)
+        # More groups than units leaves one empty
+        self.assertEqual(logic.spreadBound(logic.State(12, "T1", "test")), 9)
+
+        for numGroup in range(2, 12, 3):
+            state = logic.solve(numGroup, "Population", "states")
+            self.assertGreaterEqual(max(state.groups).metric - min(state.groups).metric, logic.spreadBound(state))
+
+    def test_isHopeless(self):
+        self.assertFalse(logic.isHopeless(logic.State(2, "Population", "states")))
+        self.assertTrue(logic.isHopeless(logic.State(20, "Population", "states")))
+
+    def test_isHopelessFor(self):
+        # The same answer as isHopeless, from the one metric column and without loading the scale
+        ds.unregisterScale("states")
+        expected = [
+            logic.isHopelessFor(numGroup, metricID, "states") for numGroup in range(1, 25) for metricID in (0, 6)
+        ]
+        self.assertFalse(ds.isLoaded("states"))
+        self.assertEqual(
+            sorted(ds.metricValues("states", "Population")), sorted(ds.metricColumn("states", "Population"))
+        )
+        actual = [
+            logic.isHopeless(logic.State(numGroup, metricID, "states"))
+            for numGroup in range(1, 25)
+            for metricID in (0, 6)
+        ]
+        self.assertEqual(expected, actual)
+        self.assertIn(True, actual)
+        self.assertIn(False, actual)
+
+    def test_balance(self):
+        state = self.makeState()
+        self.assertEqual(logic.balance(state), 2)
+        self.assertEqual([group.metric for group in state.groups], [15, 13, 17])
+        self.assertTrue(all(group.isContiguous for group in state.groups))
+
+        for numGroup in range(2, 5):
+            state = logic.solve(numGroup, "Population", "states")
+            for group in state.groups:
+                self.assertLessEqual(abs(group.metric - state.avgGroupMetric), state.deviation)
+                self.assertTrue(group.isContiguous)
+
+
+class RecomTests(unittest.TestCase):
+    def test_graph(self):
+        graph = recom.Graph("test", "T1")
+        self.assertEqual(graph.codes, [unit.code for unit in ds.unitlist("test")])
+        self.assertEqual(len(graph.indptr), len(graph) + 1)
+        for i, unit in enumerate(ds.unitlist("test")):
+            self.assertEqual({graph.codes[j] for j in graph.neighbours(i)}, {adj.code for adj in unit.adj})
+            self.assertEqual(graph.metric[i], i)
+
+    def test_recombine(self):
+        graph = recom.Graph("states", "Population")
+        state = logic.solve(4, "Population", "states")
+        plan = recom.array("H", (state.placements[unit] for unit in ds.unitlist("states")))
+        rng = recom.Random(0)
+        for _ in range(20):
+            if recom.recombine(graph, plan, 4, 0.05, rng):
+                totals = [0.0] * 4
+                for i, group in enumerate(plan):
+                    totals[group - 1] += graph.metric[i]
+                for total in totals:
+                    self.assertLessEqual(abs(total - state.avgGroupMetric), state.avgGroupMetric * 0.05 + 1e-6)
+
+    def test_ensemble(self):
+        result = recom.ensemble(2, "T1", "test", steps=10, chains=2, tolerance=0.3, processes=1)
+        self.assertEqual(len(result.plans), 20)
+        self.assertEqual(result.proposed, 20)
+        self.assertGreater(result.acceptanceRate, 0)
+        self.assertGreater(result.plansPerSecond, 0)
+        self.assertEqual(set(result.placements(0)), {unit.code for unit in ds.unitlist("test")})
+
+        # Chains are seeded, so running them in workers gives the same plans
+        pooled = recom.ensemble(2, "T1", "test", steps=10, chains=2, tolerance=0.3, processes=2)
+        self.assertEqual(pooled.plans, result.plans)
+
+
+class GeneticTests(unittest.TestCase):
+    def test_plans(self):
+        state = logic.solve(3, "T1", "test")
+        plan = genetic.toPlan(state)
+        self.assertEqual(len(plan), len(ds.unitlist("test")))
+        rebuilt = genetic.fromPlan("test", "T1", 3, plan)
+        self.assertEqual(rebuilt.placements, state.placements)
+        self.assertEqual(genetic.fitness(rebuilt), genetic.fitness(state))
+
+    def test_align(self):
+        planA = genetic.array("H", [1, 1, 2, 2, 3, 3])
+        planB = genetic.array("H", [3, 3, 1, 1, 2, 2])
+        self.assertEqual(genetic.align(planA, planB, 3), [0, 2, 3, 1])
+
+    def test_crossover(self):
+        planA = genetic.toPlan(medoids.solve(4, "Population", "states", seed=0))
+        planB = genetic.toPlan(medoids.solve(4, "Population", "states", seed=1))
+        child, score = genetic.crossover("states", "Population", 4, planA, planB)
+        state = genetic.fromPlan("states", "Population", 4, child)
+        self.assertFalse(state.unplacedUnits)
+        self.assertTrue(all(group.isContiguous for group in state.groups))
+        self.assertEqual(score, genetic.fitness(state))
+
+    def test_solve(self):
+        seeded = min(genetic.fitness(medoids.solve(5, "Population", "states", seed=seed)) for seed in range(4))
+        state = genetic.solve(5, "Population", "states", populationSize=4, generations=3, processes=2)
+        self.assertFalse(state.unplacedUnits)
+        self.assertTrue(all(group.isContiguous for group in state.groups))
+        self.assertLessEqual(genetic.fitness(state), seeded)
+
+
+class BeamTests(unittest.TestCase):
+    def test_fork(self):
+        state = logic.State(numGroup=2, metricID="T1", scale="test")
+        a, b, c, d, e, f, g, h, i, j = state.placements.keys()
+        g1, g2 = state.groups
+        state.addToGroup(a, g1)
+        state.addToGroup(b, g2)
+
+        fork = state.fork()
+        fork.addToGroup(c, fork.groups[1])
+        fork.addToGroup(b, fork.groups[0])
+        self.assertEqual(state.groups[0].units, {a})
+        self.assertEqual(state.groups[1].units, {b})
+        self.assertEqual(state.placements[c], 0)
+        self.assertIn(c, state.unplacedUnits)
+        self.assertEqual(fork.groups[0].units, {a, b})
+        self.assertEqual(fork.groups[1].units, {c})
+        self.assertEqual(fork.groups[1].metric, state.unitMetrics[c.index])
+
+        # Untouched groups are still shared, until detached
+        other = state.fork()
+        self.assertIs(other.groups[0], state.groups[0])
+        other.detach()
+        self.assertIsNot(other.groups[0], state.groups[0])
+
+    def test_placementHash(self):
+        state = logic.State(numGroup=2, metricID="T1", scale="test")
+        a, b, c, d, e, f, g, h, i, j = state.placements.keys()
+        g1, g2 = state.groups
+        self.assertEqual(state.placementHash, 0)
+
+        first = state.fork()
+        first.addToGroup(a, first.groups[0])
+        first.addToGroup(b, first.groups[1])
+        second = state.fork()
+        second.addToGroup(b, second.groups[0])
+        second.addToGroup(a, second.groups[0])
+        self.assertNotEqual(first.placementHash, second.placementHash)
+        second.addToGroup(b, second.groups[1])
+        self.assertEqual(first.placementHash, second.placementHash)
+        second.removeFromGroup(a)
+        second.removeFromGroup(b)
+        self.assertEqual(second.placementHash, 0)
+
+    def test_solve(self):
+        for numGroup in range(2, 6):
+            state = logic.solve(numGroup, "Population", "states", beamWidth=3)
+            self.assertFalse(state.unplacedUnits)
+            self.assertTrue(all(group.isContiguous for group in state.groups))
+            self.assertEqual(sum(group.metric for group in state.groups), state.sumUnitMetrics)
+
+        codes = []
+        state = logic.solve(3, "T1", "test", callback=lambda code, index: codes.append(code), beamWidth=2)
+        self.assertEqual(set(codes), {unit.code for unit in state.placements})
+
+    def test_neverWorse(self):
+        # The plain solver's run is carried along, so a wider beam can't end up with a bigger spread than it
+        for numGroup, metricID in product(range(2, 9), range(2)):
+            plain = logic.solve(numGroup, metricID, "states")
+            beam = logic.solve(numGroup, metricID, "states", beamWidth=2)
+            self.assertLessEqual(logic.quality(beam), logic.quality(plain), (numGroup, metricID))
+
+    def test_budgets(self):
+        # Budgets hold with a beam too, and a beam can't be checkpointed
+        for options in ({"maxSteps": 1}, {"timeBudget": 0}):
+            state = logic.solve(8, "Population", "states", beamWidth=3, **options)
+            self.assertTrue(state.unplacedUnits)
+        seen = []
+        interval = logic.progressInterval
+        logic.progressInterval = 0
+        try:
+            state = logic.solve(
+                8, "Population", "states", beamWidth=3, maxSteps=30, progress=lambda s, n: seen.append(n)
+            )
+        finally:
+            logic.progressInterval = interval
+        self.assertTrue(seen)
+        self.assertLessEqual(len(seen), 30)
+        self.assertTrue(state.unplacedUnits)
+        with self.assertRaises(ValueError):
+            logic.solve(8, "Population", "states", beamWidth=3, checkpoint="unused.bin")
+
+
+class ExactTests(unittest.TestCase):
+    def test_bits(self):
+        self.assertEqual(list(exact.bits(0b101100)), [2, 3, 5])
+        self.assertEqual(list(exact.bits(0)), [])
+
+    def test_components(self):
+        state = logic.State(2, "T1", "test")
+        finder = exact.Search(state, float("inf"))
+        self.assertEqual([len(island) for island in finder.islands], [2])
+        self.assertEqual(finder.slack, 3)
+        self.assertEqual(len(finder.units), 8)
+        self.assertEqual(finder.components(finder.full), [finder.full])
+
+        index = {unit.code: i for i, unit in enumerate(finder.units)}
+        mask = sum(1 << index[code] for code in "BEIJ")
+        self.assertEqual(
+            sorted(sorted(finder.units[i].code for i in exact.bits(c)) for c in finder.components(mask)),
+            [["B", "E"], ["I", "J"]],
+        )
+
+    def test_search(self):
+        # Every contiguous plan on the test map, checked by brute force
+        units = ds.unitlist("test")
+        for numGroup in range(2, 4):
+            best = float("inf")
+            for placements in product(range(numGroup), repeat=len(units)):
+                if placements[0] != 0 or len(set(placements)) < numGroup:
+                    continue
+                state = logic.State(numGroup, "T1", "test")
+                for unit, placement in zip(units, placements):
+                    state.addToGroup(unit, state.groups[placement])
+                if all(group.isContiguous for group in state.groups):
+                    best = min(best, max(state.groups).metric - min(state.groups).metric)
+
+            state, optimal = exact.search(logic.solve(numGroup, "T1", "test"))
+            self.assertTrue(optimal)
+            self.assertEqual(max(state.groups).metric - min(state.groups).metric, best)
+            self.assertTrue(all(group.isContiguous for group in state.groups))
+
+    def test_islandGroups(self):
+        # A path of four units and a heavy island: the only even plan gives the island a group of its own
+        units = [ds.Unit(code, "islands", code) for code in "ABCDE"]
+        for unit, other in zip(units[:3], units[1:4]):
+            unit.adj.add(other)
+            other.adj.add(unit)
+        units[4].component = 1
+        ds.registerScale("islands", units, ["M"], array("d", [5, 5, 5, 5, 10]))
+        try:
+            start = logic.State(3, "M", "islands")
+            for unit, placement in zip(units, [1, 1, 2, 3, 1]):
+                start.addToGroup(unit, start.groups[placement - 1])
+            state, optimal = exact.search(start)
+            self.assertTrue(optimal)
+            self.assertEqual([group.metric for group in state.groups], [10, 10, 10])
+            self.assertTrue(all(group.isContiguous for group in state.groups))
+            self.assertIn({units[4]}, [group.units for group in state.groups])
+        finally:
+            ds.unregisterScale("islands")
+
+    def test_timeBudget(self):
+        start = logic.solve(4, "Population", "states")
+        spread = max(start.groups).metric - min(start.groups).metric
+        state, optimal = exact.search(start, timeBudget=0.5)
+        self.assertFalse(optimal)
+        self.assertFalse(state.unplacedUnits)
+        self.assertLessEqual(max(state.groups).metric - min(state.groups).metric, spread)
+        self.assertTrue(all(group.isContiguous for group in state.groups))
+
+
+class AnytimeTests(unittest.TestCase):
+    def test_rewind(self):
+        state = logic.State(2, "T1", "test")
+        a, b, c, d, e, f, g, h, i, j = state.placements.keys()
+        g1, g2 = state.groups
+        state.addToGroup(a, g1)
+        state.addToGroup(b, g2)
+        placements, placementHash = dict(state.placements), state.placementHash
+
+        state.journal = []
+        state.addToGroup(c, g2)
+        state.addToGroup(b, g1)
+        state.removeFromGroup(a)
+        self.assertEqual(len(state.journal), 3)
+        state.rewind()
+        self.assertEqual(state.placements, placements)
+        self.assertEqual(state.placementHash, placementHash)
+        self.assertEqual((g1.units, g2.units), ({a}, {b}))
+        self.assertEqual((g1.metric, g2.metric), (state.unitMetrics[a.index], state.unitMetrics[b.index]))
+        self.assertEqual(state.journal, [])
+
+    def test_maxSteps(self):
+        interval = logic.progressInterval
+        logic.progressInterval = 0
+        try:
+            for maxSteps in (5, 20, 40, 80):
+                seen = []
+                state = logic.solve(
+                    8, "Population", "states", maxSteps=maxSteps, progress=lambda s, _: seen.append(logic.quality(s))
+                )
+                self.assertLessEqual(len(seen), maxSteps)
+                self.assertLessEqual(logic.quality(state), min(seen))
+        finally:
+            logic.progressInterval = interval
+
+    def test_timeBudget(self):
+        state = logic.solve(5, "Population", "states", timeBudget=0)
+        self.assertEqual(len(state.unplacedUnits), len(state.placements))
+        state = logic.solve(5, "Population", "states", timeBudget=60)
+        self.assertFalse(state.unplacedUnits)
+
+
+class CheckpointTests(unittest.TestCase):
+    path = "test_checkpoint.bin"
+
+    def tearDown(self):
+        for path in (self.path, f"{self.path}.tmp"):
+            try:
+                removeFile(path)
+            except FileNotFoundError:
+                pass
+
+    def test_roundTrip(self):
+        state = logic.solve(4, "Population", "states", maxSteps=30)
+        units = ds.unitlist("states")
+        moves = [(units[3], 2, 0), (units[7], 1, 3)]
+        rng = Random(5)
+        rng.random()
+        ds.Checkpoint(state, moves, 2, 30, rng).write(self.path)
+
+        resumed = ds.Checkpoint.read(self.path)
+        restored = resumed.state
+        self.assertEqual((restored.scale, restored.metricID), ("states", "Population"))
+        self.assertEqual(restored.placements, state.placements)
+        self.assertEqual(restored.unplacedUnits, state.unplacedUnits)
+        self.assertEqual(restored.placementHash, state.placementHash)
+        for group, original in zip(restored.groups, state.groups):
+            self.assertEqual(group.units, original.units)
+            self.assertEqual(group.adj, original.adj)
+            self.assertEqual(group.metric, original.metric)
+            self.assertEqual(group.distanceSum, original.distanceSum)
+        self.assertEqual(resumed.previousMoves, moves)
+        self.assertEqual((resumed.passes, resumed.steps), (2, 30))
+        self.assertEqual(resumed.rng.random(), rng.random())
+
+    def test_bigScale(self):
+        # Unit indices past 16 bits survive the round trip
+        units = [ds.Unit(f"U{i}", scale="line", name=f"U{i}") for i in range(70000)]
+        for unit, other in zip(units, units[1:]):
+            unit.adj.add(other)
+            other.adj.add(unit)
+        for unit in units:
+            unit.component = 0
+        ds.registerScale("line", units, ["M"], array("d", [1.0] * len(units)))
+        try:
+            state = ds.State(2, "M", "line")
+            state.addToGroup(units[-1], state.groups[0])
+            ds.Checkpoint(state, [(units[-1], 1, 0)]).write(self.path)
+            self.assertEqual(ds.Checkpoint.read(self.path).previousMoves, [(units[-1], 1, 0)])
+        finally:
+            ds.unregisterScale("line")
+
+    def test_solve(self):
+        partial = logic.solve(5, "Population", "states", maxSteps=20, checkpoint=self.path)
+        self.assertTrue(partial.unplacedUnits)
+        resumed = ds.Checkpoint.read(self.path)
+        self.assertEqual(resumed.state.placements, partial.placements)
+        self.assertEqual(resumed.steps, 20)
+
+        state = logic.solve(5, "Population", "states", checkpoint=self.path)
+        self.assertFalse(state.unplacedUnits)
+        self.assertTrue(all(group.isContiguous for group in state.groups))
+        self.assertEqual(ds.Checkpoint.read(self.path).state.placements, state.placements)
+
+    def test_resumeAnywhere(self):
+        # Wherever a solve is cut off, in the main loop or while swapping, resuming it ends with the same plan as never
+        # stopping. Resuming a finished solve just gives its plan back
+        phases = set()
+        for numGroup, metricID in ((5, 3), (4, 0)):
+            expected = logic.solve(numGroup, metricID, "states").placements
+            for maxSteps in count(1):
+                self.tearDown()
+                logic.solve(numGroup, metricID, "states", maxSteps=maxSteps, checkpoint=self.path)
+                phases.add(phase := ds.Checkpoint.read(self.path).phase)
+                state = logic.solve(numGroup, metricID, "states", checkpoint=self.path)
+                self.assertEqual(state.placements, expected, (numGroup, metricID, maxSteps))
+                if phase == "done":
+                    self.assertEqual(
+                        logic.solve(numGroup, metricID, "states", checkpoint=self.path).placements, expected
+                    )
+                    break
+        self.assertEqual(phases, {"greedy", "swap", "done"})
+
+    def test_mismatch(self):
+        # A checkpoint left by a different solve is never quietly resumed
+        logic.solve(5, "Population", "states", maxSteps=20, checkpoint=self.path)
+        for args in ((3, "Population", "states"), (5, "Area (mi2)", "states"), (5, 0, "counties")):
+            with self.assertRaises(ValueError):
+                logic.solve(*args, checkpoint=self.path)
+        self.assertFalse(logic.solve(5, 0, "states", checkpoint=self.path).unplacedUnits)
+
+
+class WarmStartTests(unittest.TestCase):
+    def test_placeAll(self):
+        cold = logic.solve(5, "Population", "states")
+        incremental = logic.State(5, "Population", "states")
+        for unit, placement in cold.placements.items():
+            incremental.addToGroup(unit, incremental.groups[placement - 1])
+
+        state = logic.State(5, "Population", "states")
+        state.placeAll({unit.code: placement for unit, placement in cold.placements.items()})
+        self.assertEqual(state.placements, incremental.placements)
+        self.assertFalse(state.unplacedUnits)
+        self.assertEqual(state.placementHash, incremental.placementHash)
+        for group, original in zip(state.groups, incremental.groups):
+            self.assertEqual(group.units, original.units)
+            self.assertEqual(group.adj, original.adj)
+            self.assertAlmostEqual(group.metric, original.metric)
+            self.assertEqual(group.distanceSum, original.distanceSum)
+
+    def test_resolve(self):
+        cold = logic.solve(4, "Population", "states")
+        state = logic.solve(4, "Population", "states", initial=cold.placements)
+        self.assertEqual(state.placements, cold.placements)
+
+        # A different metric starts from the same boundaries but has to rebalance them
+        state = logic.solve(4, 1, "states", initial=cold.placements)
+        self.assertFalse(state.unplacedUnits)
+        self.assertTrue(all(group.isContiguous for group in state.groups))
+
+    def test_split(self):
+        cold = logic.solve(3, "Population", "states")
+        largest = max(cold.groups)
+        state = logic.warmStart(logic.State(4, "Population", "states"), cold.placements)
+        self.assertTrue(state.groups[3].units)
+        self.assertTrue(state.groups[3].units < largest.units)
+        self.assertTrue(all(group.isContiguous for group in state.groups))
+
+        state = logic.solve(4, "Population", "states", initial=cold.placements)
+        self.assertFalse(state.unplacedUnits)
+        self.assertTrue(all(group.isContiguous for group in state.groups))
+
+    def test_splitLeavesNoneEmpty(self):
+        # A group with a single free unit is never split, so the new group doesn't leave the old one empty
+        for numGroup, metricID in product(range(2, 12), range(4)):
+            cold = logic.solve(numGroup, metricID, "states")
+            state = logic.warmStart(logic.State(numGroup + 1, metricID, "states"), cold.placements)
+            self.assertFalse([group.index for group in state.groups if group.empty], (numGroup, metricID))
+
+        state = logic.solve(7, 2, "states", initial=logic.solve(6, 2, "states").placements)
+        self.assertFalse([group.index for group in state.groups if group.empty])
+
+
+class LockTests(unittest.TestCase):
+    def test_lock(self):
+        state = logic.State(2, "T1", "test")
+        state.placeAll({"A": 1, "D": 1, "B": 2, "C": 2})
+        state.lock(["A", "E"], [2])
+        self.assertEqual(state.locked, {"A", "B", "C"})
+        self.assertEqual(state.lockedGroups, {2})
+
+    def test_stealing(self):
+        state = logic.State(2, "T1", "test")
+        state.placeAll({"B": 1, "E": 1, "C": 2, "F": 2, "G": 2, "H": 2, "I": 2, "J": 2, "A": 1, "D": 2})
+        g1, g2 = state.groups
+        self.assertIn("F", set(logic.getPlaceableUnitsFor(state, g1)))
+        state.lock(["F"])
+        self.assertNotIn("F", set(logic.getPlaceableUnitsFor(state, g1)))
+        self.assertTrue(set(logic.getPlaceableUnitsFor(state, g1)))
+
+        state.lock(groups=[1])
+        self.assertEqual([group for _, group in logic.getNext(state)][:-1], [g2] * len(g2.adj & state.unplacedUnits))
+
+    def test_partialSolve(self):
+        cold = logic.solve(5, "Population", "states")
+        region = {"CA", "OR", "WA", "NV"}
+        plan = {unit.code: placement for unit, placement in cold.placements.items() if unit.code not in region}
+        state = logic.solve(5, "Population", "states", initial=plan, locked=plan)
+        self.assertFalse(state.unplacedUnits)
+        self.assertTrue(all(state.placements[code] == placement for code, placement in plan.items()))
+        self.assertTrue(all(group.isContiguous for group in state.groups))
+
+        state = logic.solve(5, "Population", "states", initial=cold.placements, lockedGroups=[1, 2])
+        self.assertEqual(state.groups[0].units, cold.groups[0].units)
+        self.assertEqual(state.groups[1].units, cold.groups[1].units)
+
+    def test_reconnect(self):
+        # Freeing the units that joined a locked unit to the rest of its group grows the group back out to it
+        cold = logic.solve(8, 2, "states")
+        initial = {
+            unit: placement for unit, placement in cold.placements.items() if unit not in {"CA", "OR", "WA", "NV", "AZ"}
+        }
+        state = logic.solve(8, 2, "states", initial=initial, locked=initial)
+        self.assertFalse(state.unplacedUnits)
+        self.assertTrue(all(group.isContiguous for group in state.groups))
+        for unit, placement in initial.items():
+            self.assertEqual(state.placements[unit], placement)
+
+        # Unless only other groups' locked units are in the way
+        locked = {"E": 1, "G": 1, "B": 2, "C": 2, "F": 2, "H": 2}
+        with self.assertRaises(ValueError):
+            logic.solve(2, "T1", "test", initial=locked, locked=locked)
+
+    def test_checkpoint(self):
+        # Locks are saved with the checkpoint, so a resumed partial re-solve still leaves locked groups alone
+        path = "test_lock_checkpoint.bin"
+        cold = logic.solve(5, 1, "states")
+        try:
+            partial = logic.solve(
+                5, 1, "states", initial=cold.placements, lockedGroups=[1, 2], maxSteps=1, checkpoint=path
+            )
+            self.assertEqual(ds.Checkpoint.read(path).state.locked, partial.locked)
+            self.assertEqual(ds.Checkpoint.read(path).state.lockedGroups, {1, 2})
+            state = logic.solve(5, 1, "states", initial=cold.placements, lockedGroups=[1, 2], checkpoint=path)
+        finally:
+            removeFile(path)
+        for group in (1, 2):
+            self.assertEqual(state.groups[group - 1].units, cold.groups[group - 1].units)
+
+
+class ConcurrencyTests(unittest.TestCase):
+    def test_metricVectors(self):
+        population = logic.State(2, "Population", "states")
+        other = logic.State(2, 1, "states")
+        units = ds.unitlist("states")
+        self.assertEqual(population.unitMetrics, ds.metricColumn("states", "Population"))
+        self.assertEqual(other.unitMetrics, ds.metricColumn("states", other.metricID))
+        self.assertNotEqual(population.unitMetrics, other.unitMetrics)
+
+        # Interleaved changes only ever see their own state's metric
+        for unit in units[:10]:
+            population.addToGroup(unit, population.groups[0])
+            other.addToGroup(unit, other.groups[0])
+        self.assertEqual(population.groups[0].metric, sum(population.unitMetrics[:10]))
+        self.assertEqual(other.groups[0].metric, sum(other.unitMetrics[:10]))
+
+    def test_threads(self):
+        jobs = [(numGroup, metricID, "states") for numGroup in (3, 4) for metricID in (0, 1)]
+        expected = [logic.solve(*job).placements for job in jobs]
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(lambda job: logic.solve(*job).placements, jobs))
+        self.assertEqual(results, expected)
+
+
+def buildSource(scale: str) -> bytes:
+    return bytes(ds.buildScale(scale)["source"])
+
+
+class BundleTests(unittest.TestCase):
+    def test_roundTrip(self):
+        bundle = ds.buildScale("test")
+        units, names, metrics = bundle.read("test")
+        expected, expectedNames, expectedMetrics = ds.readFile("test")
+        self.assertEqual((units, names, metrics), (expected, expectedNames, expectedMetrics))
+        for unit, other in zip(units, expected):
+            self.assertEqual((unit.index, unit.component), (other.index, other.component))
+            self.assertEqual(unit.adj, other.adj)
+            # Distances are read straight out of the file
+            self.assertIsInstance(unit.distances, ds.Distances)
+            self.assertEqual(unit.distances, other.distances)
+            self.assertEqual(len(unit.distances), len(other.distances))
+            self.assertEqual(list(unit.distances), sorted(other.distances, key=lambda u: u.index))
+            for u in units:
+                self.assertEqual(u in unit.distances, u in other.distances)
+                self.assertEqual(unit.distances.get(u, -1), other.distances.get(u, -1))
+        self.assertEqual([unit.component for unit in units], [0, 1, 1, 0, 1, 1, 1, 1, 1, 1])
+
+    def test_load(self):
+        ds.unregisterScale("test")
+        units = ds.unitlist("test")
+        self.assertEqual([unit.distances for unit in units], [unit.distances for unit in ds.readFile("test")[0]])
+        self.assertEqual(units[3].name, "D_Name")
+        # Every unit's distances are a view of the one mapped file
+        self.assertTrue(all(unit.distances.row.obj is ds._bundles["test"].map for unit in units))
+
+    def test_concurrentBuild(self):
+        # Processes rebuilding the same bundle at once each swap in a complete file rather than truncating each other's
+        with Pool(4) as pool:
+            sources = pool.map(buildSource, ["test"] * 8)
+        self.assertEqual(sources, [ds.sources("test")] * 8)
+        self.assertEqual(bytes(ds.Bundle("assets/test/scale.bin")["source"]), ds.sources("test"))
+        self.assertEqual([name for name in os.listdir("assets/test") if name.endswith(".tmp")], [])
+
+    def test_rebuild(self):
+        path = "assets/test/data.tsv"
+        first = ds.Bundle.load("test")
+        modified = getmtime(path)
+        utime(path, (modified, modified + 1))
+        try:
+            rebuilt = ds.Bundle.load("test")
+            self.assertEqual(bytes(rebuilt["source"]), ds.sources("test"))
+            self.assertNotEqual(bytes(rebuilt["source"]), bytes(first["source"]))
+        finally:
+            utime(path, (modified, modified))
+            ds.Bundle.load("test")
+
+
+class SolveResultTests(unittest.TestCase):
+    def test_roundTrip(self):
+        state = logic.solve(5, "Population", "states")
+        result = ds.SolveResult(state, 1.5)
+        self.assertEqual(list(result.placements), [state.placements[unit] for unit in ds.unitlist("states")])
+        self.assertEqual(list(result.metrics), [group.metric for group in state.groups])
+        self.assertEqual(result.spread, max(state.groups).metric - min(state.groups).metric)
+        self.assertEqual((result.numGroup, result.unplaced, result.seconds), (5, 0, 1.5))
+
+        # Small enough to send back cheaply, and enough to get the whole state back
+        data = pickle.dumps(result)
+        self.assertLess(len(data), 1000)
+        restored = pickle.loads(data).toState()
+        self.assertEqual(restored.placements, state.placements)
+        self.assertEqual(restored.placementHash, state.placementHash)
+        self.assertEqual([group.metric for group in restored.groups], list(result.metrics))
+
+    def test_pool(self):
+        jobs = [(numGroup, "Population", "states") for numGroup in (2, 3, 4)]
+        with Pool(2) as pool:
+            results = pool.starmap(logic.solveResult, jobs)
+        for job, result in zip(jobs, results):
+            self.assertIsInstance(result, ds.SolveResult)
+            self.assertEqual(result.toState().placements, logic.solve(*job).placements)
+
+
+class SolverPoolTests(unittest.TestCase):
+    def test_reuse(self):
+        jobs = [(numGroup, "Population", "states") for numGroup in (2, 3, 4, 5)]
+        with parallel.SolverPool(2, ["states"]) as pool:
+            first = pool.map(jobs)
+            second = pool.map(jobs)
+            stats = pool.stats
+        for job, a, b in zip(jobs, first, second):
+            self.assertEqual(list(a.placements), list(b.placements))
+            self.assertEqual(a.toState().placements, logic.solve(*job).placements)
+        # Both sweeps ran on the same two workers, and neither had to load the scale
+        self.assertEqual(stats["jobs"], 8)
+        self.assertLessEqual(stats["workers"], 2)
+        self.assertEqual(stats["loads"], 0)
+
+    def test_loadOnDemand(self):
+        ds.unregisterScale("test")
+        with parallel.SolverPool(2) as pool:
+            results = pool.map([(2, "T1", "test")] * 6)
+            result = pool.solve(3, "T1", "test", beamWidth=2)
+            stats = pool.stats
+        self.assertEqual(len({tuple(result.placements) for result in results}), 1)
+        self.assertEqual(result.toState().placements, logic.solve(3, "T1", "test", beamWidth=2).placements)
+        # Each worker loads a scale at most once
+        self.assertEqual(stats["jobs"], 7)
+        self.assertLessEqual(stats["loads"], stats["workers"])
+        self.assertGreaterEqual(stats["loads"], 1)
+
+
+class SchedulerTests(unittest.TestCase):
+    def test_order(self):
+        scheduler = parallel.Scheduler(None)
+        name = ds.metricNames("states")[0]
+        jobs = [
+            (2, 0, "states"),
+            (2, name, "states"),
+            (3, 0, "states", {"beamWidth": 2}),
+            (2, 0, "counties"),
+            (5, 0, "states"),
+        ]
+        order = scheduler.order(jobs)
+        # The same job asked for two ways only runs once, and the county job is far bigger than any state job
+        self.assertEqual(len(order), 4)
+        self.assertEqual(order[0], (2, ds.metricNames("counties")[0], "counties", ()))
+        self.assertEqual(
+            order[1:], [(5, name, "states", ()), (3, name, "states", (("beamWidth", 2),)), (2, name, "states", ())]
+        )
+
+        # Past timings win over the model, and scale the model for jobs that haven't run
+        scheduler.timings[(2, name, "states", ())] = 50.0
+        scheduler.timings[(4, name, "states", ())] = 0.001
+        scheduler.timings[(6, name, "states", ())] = 0.001
+        self.assertEqual(scheduler.order(jobs)[:2], [(2, name, "states", ()), order[0]])
+        self.assertAlmostEqual(scheduler.estimate((8, name, "states", ())), 8 * median([50 / 2, 0.001 / 4, 0.001 / 6]))
+
+    def test_warmStartOptions(self):
+        # Jobs can carry dicts and lists in their options, as warm starts do, and still be deduplicated and timed
+        cold = logic.solve(4, "Population", "states")
+        initial = {unit.code: group for unit, group in cold.placements.items()}
+        options = {"initial": initial, "locked": ["CA", "TX"], "lockedGroups": [1]}
+        jobs = [(4, 0, "states", options), (4, "Population", "states", dict(options, initial=dict(initial)))]
+        jobs.append((4, 0, "states", dict(options, lockedGroups=[2])))
+        with parallel.SolverPool(2, ["states"]) as pool:
+            scheduler = parallel.Scheduler(pool)
+            swept = list(scheduler.sweep(jobs))
+        self.assertEqual(len(swept), 2)
+        self.assertEqual(len(scheduler.timings), 2)
+        for job, result in swept:
+            self.assertIn(parallel.frozen(job), scheduler.timings)
+            expected = logic.solve(*job[:3], **dict(job[3])).placements
+            self.assertEqual(result.toState().placements, expected)
+
+    def test_sweep(self):
+        jobs = [(numGroup, metricID, "states") for numGroup in (2, 3, 4) for metricID in (0, 1)]
+        with parallel.SolverPool(2, ["states"]) as pool:
+            scheduler = parallel.Scheduler(pool)
+            results = dict(scheduler.sweep(jobs + jobs))
+            again = dict(scheduler.sweep(jobs))
+        self.assertEqual(set(results), set(map(parallel.jobKey, jobs)))
+        self.assertEqual(set(scheduler.timings), set(results))
+        for (numGroup, metricID, scale, _), result in results.items():
+            self.assertEqual(result.toState().placements, logic.solve(numGroup, metricID, scale).placements)
+            self.assertEqual(list(again[numGroup, metricID, scale, ()].placements), list(result.placements))
+
+
+def markUnpickled():
+    unpickled.set()
+
+
+unpickled = threading.Event()
+
+
+class Payload:
+    # Flags when it's unpickled
+    def __reduce__(self):
+        return markUnpickled, ()
+
+
+class CoordinatorTests(unittest.TestCase):
+    def startWorkers(self, coordinator: parallel.Coordinator, count: int) -> list[Process]:
+        workers = [Process(target=parallel.serveWorker, args=(coordinator.address, ["states"])) for _ in range(count)]
+        for worker in workers:
+            worker.start()
+        self.assertTrue(coordinator.waitForWorkers(count, 30))
+        return workers
+
+    def commandLineWorker(self, coordinator: parallel.Coordinator, scale: str) -> subprocess.Popen:
+        # A worker in an interpreter of its own, as it would be on another machine, given the key through the environment
+        host, port = coordinator.address
+        env = dict(os.environ, **{parallel.authkeyVariable: coordinator.authkey.decode()})
+        return subprocess.Popen([sys.executable, "logic_parallel.py", f"{host}:{port}", scale], env=env)
+
+    def fakeWorker(self, coordinator: parallel.Coordinator, name: str) -> Connection:
+        connection = Client(coordinator.address, authkey=coordinator.authkey)
+        connection.send((name, 0))
+        return connection
+
+    def test_sweep(self):
+        jobs = [(numGroup, metricID, "states") for numGroup in (2, 3, 4) for metricID in (0, 1)]
+        with parallel.Coordinator() as coordinator:
+            workers = self.startWorkers(coordinator, 2)
+            results = coordinator.map(jobs)
+            result = coordinator.solve(3, "T1", "test", beamWidth=2)
+            swept = dict(parallel.Scheduler(coordinator).sweep(jobs + jobs))
+            stats = coordinator.stats
+        for worker in workers:
+            worker.join(30)
+            self.assertEqual(worker.exitcode, 0)
+
+        # The same results as solving locally, whichever machine they came from
+        for job, solved in zip(jobs, results):
+            self.assertEqual(solved.toState().placements, logic.solve(*job).placements)
+            self.assertEqual(list(swept[parallel.jobKey(job)].placements), list(solved.placements))
+        self.assertEqual(result.toState().placements, logic.solve(3, "T1", "test", beamWidth=2).placements)
+        self.assertEqual(stats["jobs"], 13)
+        self.assertLessEqual(stats["loads"], 2)
+
+    def test_retry(self):
+        with parallel.Coordinator(authkey=b"shared secret") as coordinator:
+            workers = []
+
+            def flaky():
+                # Takes the first job and dies without answering once a real worker is there to pick it up. That worker
+                # runs in its own interpreter, as a forked one would hold on to a copy of this connection
+                with self.fakeWorker(coordinator, "flaky") as connection:
+                    connection.recv()
+                    workers.append(self.commandLineWorker(coordinator, "test"))
+                    self.assertTrue(coordinator.waitForWorkers(2, 60))
+
+            thread = threading.Thread(target=flaky)
+            thread.start()
+            self.assertTrue(coordinator.waitForWorkers(1, 30))
+            results = coordinator.map([(2, "T1", "test"), (3, "T1", "test")])
+            thread.join()
+            stats = coordinator.stats
+        for worker in workers:
+            self.assertEqual(worker.wait(30), 0)
+        self.assertEqual([result.numGroup for result in results], [2, 3])
+        self.assertNotIn(("flaky", 0), stats["perWorker"])
+        self.assertEqual(stats["jobs"], 2)
+
+    def test_lastWorkerDies(self):
+        # With retries left but no worker to give the job to, the sweep fails instead of waiting forever
+        with parallel.Coordinator(retries=2) as coordinator:
+            with self.assertRaises(ConnectionError):
+                coordinator.map([(2, "T1", "test")])
+
+            def dead():
+                with self.fakeWorker(coordinator, "dead") as connection:
+                    connection.recv()
+
+            thread = threading.Thread(target=dead)
+            thread.start()
+            self.assertTrue(coordinator.waitForWorkers(1, 30))
+            with self.assertRaises(ConnectionError):
+                coordinator.map([(2, "T1", "test"), (3, "T1", "test")])
+            thread.join()
+
+            # The abandoned jobs are skipped by workers that connect later
+            workers = self.startWorkers(coordinator, 1)
+            self.assertEqual(coordinator.solve(4, "T1", "test").numGroup, 4)
+            self.assertEqual(coordinator.stats["jobs"], 1)
+        workers[0].join(30)
+
+    def test_commandLine(self):
+        # A worker started on its own, as it would be on another machine
+        with parallel.Coordinator(authkey=b"shared secret") as coordinator:
+            worker = self.commandLineWorker(coordinator, "states")
+            self.assertTrue(coordinator.waitForWorkers(1, 60))
+            results = coordinator.map([(2, 0, "states"), (3, 0, "states")])
+        self.assertEqual(worker.wait(30), 0)
+        self.assertEqual(
+            [list(result.placements) for result in results],
+            [
+                list(result.placements)
+                for result in map(ds.SolveResult, (logic.solve(2, 0, "states"), logic.solve(3, 0, "states")))
+            ],
+        )
+        self.assertEqual(coordinator.stats["loads"], 0)
+
+    def test_authkey(self):
+        # A connection without the key is turned away before anything it sends is unpickled
+        unpickled.clear()
+        with parallel.Coordinator() as coordinator:
+            with Client(coordinator.address) as connection:
+                connection.send(Payload())
+                with self.assertRaises(EOFError):
+                    while True:
+                        connection.recv_bytes()
+            with self.assertRaises(AuthenticationError):
+                Client(coordinator.address, authkey=b"wrong key")
+            self.assertFalse(unpickled.is_set())
+            self.assertEqual(coordinator.processes, 0)
+
+            # A worker with the key still gets in
+            workers = self.startWorkers(coordinator, 1)
+            self.assertEqual(coordinator.solve(2, "T1", "test").numGroup, 2)
+        workers[0].join(30)
+
+    def test_giveUp(self):
+        with parallel.Coordinator(retries=0) as coordinator:
+
+            def dead():
+                with self.fakeWorker(coordinator, "dead") as connection:
+                    connection.recv()
+
+            thread = threading.Thread(target=dead)
+            thread.start()
+            self.assertTrue(coordinator.waitForWorkers(1, 30))
+            with self.assertRaises(ConnectionError):
+                coordinator.map([(2, "T1", "test")])
+            thread.join()
+
+    def test_timeout(self):
+        # A worker that sits on its job past the timeout counts as lost
+        with parallel.Coordinator(retries=0, timeout=0.5) as coordinator:
+            done = threading.Event()
+
+            def stuck():
+                with self.fakeWorker(coordinator, "stuck") as connection:
+                    connection.recv()
+                    done.wait(30)
+
+            thread = threading.Thread(target=stuck)
+            thread.start()
+            self.assertTrue(coordinator.waitForWorkers(1, 30))
+            with self.assertRaises(ConnectionError):
+                coordinator.map([(2, "T1", "test")])
+            done.set()
+            thread.join()
+
+    def test_solveError(self):
+        # A solve that raises fails the sweep but leaves its worker running
+        with parallel.Coordinator() as coordinator:
+            workers = self.startWorkers(coordinator, 1)
+            with self.assertRaises(ValueError):
+                coordinator.solve(2, "Nonexistent", "test")
+            self.assertEqual(coordinator.solve(2, "T1", "test").numGroup, 2)
+        workers[0].join(30)
+        self.assertEqual(workers[0].exitcode, 0)